@@ -234,9 +234,72 @@ CELERY_BEAT_SCHEDULE = {
     "update-reputations-every-day": {
         "task": "update_all_reputations",
         "schedule": timedelta(days=1),
+    },
+    "reconcile-article-counters-every-day": {
+        "task": "reconcile_article_counters",
+        "schedule": timedelta(days=1),
+    },
+    "flush-article-views-every-30-seconds": {
+        "task": "flush_article_views",
+        "schedule": timedelta(seconds=30),
+    },
+    "sweep-article-statuses-every-10-minutes": {
+        "task": "core_apps.articles.tasks.check_and_update_article_statuses",
+        "schedule": timedelta(minutes=10),
+    },
+    "sweep-product-statuses-every-10-minutes": {
+        "task": "sweep_product_statuses",
+        "schedule": timedelta(minutes=10),
+    },
+}
+
+# Publish/archive times closer than this are enqueued as exact ETA tasks on
+# save; the sweepers above enqueue the rest as they come into range, so the
+# horizon must exceed their interval.
+STATUS_SCHEDULER_HORIZON = timedelta(minutes=15)
+
+# Widths of the banner variants rendered by process_article_banner, and the
+# width list pages pick the smallest variant for.
+BANNER_VARIANT_WIDTHS = [320, 640, 1280]
+BANNER_LIST_WIDTH = 640
+
+# Direct-to-storage uploads (core_apps.common.uploads): the backend used for
+# each kind of file, how long signed uploads stay valid (seconds) and the
+# largest file StorageDirectUpload accepts (bytes). Avatars live in
+# Cloudinary; banners in the media storage.
+DIRECT_UPLOAD_BACKENDS = {
+    "avatar": "core_apps.common.uploads.CloudinaryDirectUpload",
+    "banner": "core_apps.common.uploads.StorageDirectUpload",
+}
+DIRECT_UPLOAD_MAX_AGE = 3600
+DIRECT_UPLOAD_MAX_SIZE = 10 * 1024 * 1024
+
+# Threaded article responses: how many levels of replies a page of
+# responses includes by default (?depth= may ask for up to the maximum, which
+# also caps how deeply replies can nest), and how many replies to each
+# response are previewed.
+ARTICLE_RESPONSE_THREAD_DEPTH = 2
+ARTICLE_RESPONSE_MAX_DEPTH = 8
+ARTICLE_RESPONSE_REPLY_PREVIEW = 3
+
+# Article retrieves queue view events here; flush_article_views drains them.
+ARTICLE_VIEW_BUFFER_BACKEND = "core_apps.articles.view_buffer.RedisViewBuffer"
+ARTICLE_VIEW_BUFFER_URL = env("ARTICLE_VIEW_BUFFER_URL", default=CELERY_BROKER_URL)
+
+# HyperLogLog unique-viewer estimates for articles and products.
+UNIQUE_VIEWER_COUNTER_BACKEND = "core_apps.common.unique_viewers.RedisViewerCounter"
+UNIQUE_VIEWER_COUNTER_URL = env("UNIQUE_VIEWER_COUNTER_URL", default=CELERY_BROKER_URL)
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": env("CACHE_URL", default=CELERY_BROKER_URL),
     }
 }
 
+# Public article responses are cached per generation; see core_apps.common.cache.
+RESPONSE_CACHE_TIMEOUT = env.int("RESPONSE_CACHE_TIMEOUT", default=300)
+
 CLOUDINARY_CLOUD_NAME = env("CLOUDINARY_CLOUD_NAME")
 CLOUDINARY_API_KEY = env("CLOUDINARY_API_KEY")
 CLOUDINARY_API_SECRET = env("CLOUDINARY_API_SECRET")
@@ -327,6 +390,7 @@ SOCIAL_AUTH_PIPELINE = (
 
 ELASTICSEARCH_DSL_AUTO_REFRESH = True
 ELASTICSEARCH_DSL_AUTOSYNC = True
+ELASTICSEARCH_DSL_SIGNAL_PROCESSOR = "core_apps.article_search.signals.ArticleSignalProcessor"
 
 ELASTICSEARCH_DSL = {
     "default": {
@@ -40,6 +40,8 @@ urlpatterns = [
     path("api/v1/article-bookmarks/", include("core_apps.article_bookmarks.urls")),
     path("api/v1/elastic/", include("core_apps.article_search.urls")),
     path("api/v1/reports/", include("core_apps.reports.urls")),
+    path("api/v1/products/", include("core_apps.products.urls")),
+    path("api/v1/uploads/", include("core_apps.common.urls")),
     path('api/v1/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/v1/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/v1/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
@@ -1,14 +1,44 @@
 import pytest
 from pytest_factoryboy import register
-from django.test import RequestFactory
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.contrib.auth.middleware import AuthenticationMiddleware
 
+from core_apps.articles.view_buffer import get_view_buffer
+from core_apps.common.unique_viewers import get_unique_viewer_counter
 from core_apps.users.tests.factories import UserFactory
 
 register(UserFactory)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def locmem_cache():
+    with override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def view_buffer(settings):
+    settings.ARTICLE_VIEW_BUFFER_BACKEND = (
+        "core_apps.articles.view_buffer.LocMemViewBuffer"
+    )
+    buffer = get_view_buffer()
+    yield buffer
+    buffer.clear()
+
+
+@pytest.fixture(autouse=True)
+def unique_viewer_counter(settings):
+    settings.UNIQUE_VIEWER_COUNTER_BACKEND = (
+        "core_apps.common.unique_viewers.HyperLogLogViewerCounter"
+    )
+    yield get_unique_viewer_counter()
+    cache.clear()
+
+
 @pytest.fixture
 def normal_user(db, user_factory):
     new_user = user_factory.create()
@@ -0,0 +1,33 @@
+from django.db import migrations, models
+
+from core_apps.common.models import backfill_tree_paths
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("article_responses", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="articleresponse",
+            name="path",
+            field=models.CharField(db_index=True, default="", editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="articleresponse",
+            name="depth",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="articleresponse",
+            index=models.Index(
+                fields=["article", "depth", "created_at"],
+                name="response_thread_roots_idx",
+            ),
+        ),
+        backfill_tree_paths(
+            "article_responses", "articleresponse", parent_field="parent_response"
+        ),
+    ]
@@ -1,14 +1,79 @@
+from functools import reduce
+from operator import or_
+
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
 from django.utils.translation import gettext_lazy as _
 
 from core_apps.articles.models import Article
-from core_apps.common.models import TimeStampedModel
+from core_apps.articles.managers import related_count
+from core_apps.common.models import MaterializedPathModel, TimeStampedModel
 
 User = get_user_model()
 
 
-class ArticleResponse(TimeStampedModel):
+class ArticleResponseQuerySet(models.QuerySet):
+    def for_thread(self):
+        """
+        Responses with what ``ThreadedResponseSerializer`` reads joined in,
+        and ``reply_count``, the number of direct replies.
+        """
+        return self.select_related("user__profile", "article").annotate(
+            reply_count=related_count(self.model, "parent_response")
+        )
+
+    def attach_replies(self, roots, depth, preview):
+        """
+        Give each of ``roots`` a nested ``replies`` list going ``depth``
+        levels down, at most ``preview`` (the earliest) replies per response,
+        read with one query on the materialized path. Returns ``roots``.
+        """
+        for root in roots:
+            root.replies = []
+        if not roots or depth < 1 or preview < 1:
+            return roots
+
+        subtrees = reduce(
+            or_,
+            (
+                Q(
+                    path__startswith=root.path,
+                    depth__gt=root.depth,
+                    depth__lte=root.depth + depth,
+                )
+                for root in roots
+            ),
+        )
+        # Number the replies to each response so the preview cut happens in
+        # the database rather than after loading whole threads.
+        replies = (
+            self.for_thread()
+            .filter(subtrees)
+            .annotate(
+                sibling_rank=Window(
+                    RowNumber(),
+                    partition_by=F("parent_response"),
+                    order_by=[F("created_at").asc(), F("pkid").asc()],
+                )
+            )
+            .filter(sibling_rank__lte=preview)
+            .order_by("depth", "created_at", "pkid")
+        )
+
+        nodes = {root.pkid: root for root in roots}
+        for reply in replies:
+            # Replies under a response that missed its own preview are dropped.
+            parent = nodes.get(reply.parent_response_id)
+            if parent is not None:
+                reply.replies = []
+                parent.replies.append(reply)
+                nodes[reply.pkid] = reply
+        return roots
+
+
+class ArticleResponse(MaterializedPathModel, TimeStampedModel):
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="article_responses"
     )
@@ -25,10 +90,20 @@ class ArticleResponse(TimeStampedModel):
 
     content = models.TextField(verbose_name=_("article response content"))
 
+    parent_field = "parent_response"
+
+    objects = ArticleResponseQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Article Response"
         verbose_name_plural = "Article Responses"
         ordering = ["created_at"]
+        indexes = [
+            models.Index(
+                fields=["article", "depth", "created_at"],
+                name="response_thread_roots_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.profile.username} commented on {self.article.title}"
@@ -0,0 +1,9 @@
+from rest_framework.pagination import PageNumberPagination
+
+
+class ResponseThreadPagination(PageNumberPagination):
+    """Pages of top-level responses; each brings its reply previews along."""
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 30
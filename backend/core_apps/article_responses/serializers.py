@@ -17,3 +17,27 @@ class ArticleResponseSerializer(serializers.ModelSerializer):
             "content",
             "created_at",
         ]
+
+
+class ThreadedResponseSerializer(ArticleResponseSerializer):
+    """
+    A response with the replies ``ArticleResponseQuerySet.attach_replies``
+    loaded under it. ``reply_count`` counts all direct replies, so clients
+    can tell when ``replies`` is only a preview.
+    """
+
+    depth = serializers.IntegerField(read_only=True)
+    reply_count = serializers.IntegerField(read_only=True)
+    replies = serializers.SerializerMethodField()
+
+    class Meta(ArticleResponseSerializer.Meta):
+        fields = ArticleResponseSerializer.Meta.fields + [
+            "depth",
+            "reply_count",
+            "replies",
+        ]
+
+    def get_replies(self, obj):
+        return ThreadedResponseSerializer(
+            getattr(obj, "replies", []), many=True, context=self.context
+        ).data
@@ -0,0 +1,111 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core_apps.articles.tests.factories import ArticleFactory, AuthorFactory
+
+from .models import ArticleResponse
+
+
+@override_settings(
+    ELASTICSEARCH_DSL_AUTOSYNC=False,
+    ARTICLE_RESPONSE_THREAD_DEPTH=2,
+    ARTICLE_RESPONSE_MAX_DEPTH=3,
+    ARTICLE_RESPONSE_REPLY_PREVIEW=2,
+)
+class ResponseThreadTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.reader = AuthorFactory()
+        self.article = ArticleFactory()
+        self.url = reverse("responses", kwargs={"slug": self.article.slug})
+
+    def respond(self, content, parent=None, article=None):
+        return ArticleResponse.objects.create(
+            user=self.reader,
+            article=article or self.article,
+            parent_response=parent,
+            content=content,
+        )
+
+    def test_paths_follow_parent_response(self):
+        root = self.respond("root")
+        reply = self.respond("reply", root)
+        nested = self.respond("nested", reply)
+        self.assertEqual(nested.path, f"{root.pkid}/{reply.pkid}/{nested.pkid}/")
+        self.assertEqual(nested.depth, 2)
+
+    def test_page_of_threads_in_three_queries(self):
+        roots = [self.respond(f"root {n}") for n in range(3)]
+        for root in roots:
+            first = self.respond("first", root)
+            self.respond("second", root)
+            self.respond("third", root)
+            deep = self.respond("deep", first)
+            self.respond("too deep", deep)
+        self.respond("elsewhere", article=ArticleFactory())
+
+        # count, the page of roots, and one query for all of their replies
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+
+        thread = response.data["results"][0]
+        self.assertEqual(thread["id"], str(roots[0].id))
+        self.assertEqual(thread["username"], self.reader.profile.username)
+        self.assertEqual(thread["reply_count"], 3)
+        self.assertEqual([r["content"] for r in thread["replies"]], ["first", "second"])
+        first = thread["replies"][0]
+        self.assertEqual([r["content"] for r in first["replies"]], ["deep"])
+        # The default depth stops above "too deep"; its count still shows.
+        self.assertEqual(first["replies"][0]["replies"], [])
+        self.assertEqual(first["replies"][0]["reply_count"], 1)
+
+    def test_depth_replies_and_parent_parameters(self):
+        root = self.respond("root")
+        replies = [self.respond(f"reply {n}", root) for n in range(3)]
+        self.respond("nested", replies[0])
+
+        response = self.client.get(self.url, {"depth": 0})
+        self.assertEqual(response.data["results"][0]["replies"], [])
+
+        response = self.client.get(self.url, {"depth": 1, "replies": 5})
+        thread = response.data["results"][0]["replies"]
+        self.assertEqual(len(thread), 3)
+        self.assertEqual(thread[0]["replies"], [])
+
+        response = self.client.get(self.url, {"parent": str(root.id)})
+        self.assertEqual(
+            [r["content"] for r in response.data["results"]],
+            ["reply 0", "reply 1", "reply 2"],
+        )
+        self.assertEqual(response.data["results"][0]["replies"][0]["content"], "nested")
+
+        response = self.client.get(self.url, {"parent": "nope"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_replies_stay_in_their_article_and_depth(self):
+        self.client.force_authenticate(self.reader)
+        other = self.respond("other", article=ArticleFactory())
+        response = self.client.post(
+            self.url, {"content": "hi", "parent_response": other.pkid}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        parent = self.respond("root")
+        for _ in range(3):
+            parent = self.respond("reply", parent)
+        response = self.client.post(
+            self.url, {"content": "hi", "parent_response": parent.pkid}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(
+            self.url,
+            {"content": "hi", "parent_response": parent.parent_response_id},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(ArticleResponse.objects.get(id=response.data["id"]).depth, 3)
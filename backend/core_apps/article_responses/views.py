@@ -1,32 +1,116 @@
-from drf_spectacular.utils import extend_schema
+import uuid
+
+from django.conf import settings
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from rest_framework import generics, permissions
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.generics import get_object_or_404
 
 from .models import Article, ArticleResponse
-from .serializers import ArticleResponseSerializer
+from .pagination import ResponseThreadPagination
+from .serializers import ArticleResponseSerializer, ThreadedResponseSerializer
+
+THREAD_PARAMETERS = [
+    OpenApiParameter(
+        name="parent",
+        description="List the replies to this response instead of the top-level responses",
+        required=False,
+        type=str,
+    ),
+    OpenApiParameter(
+        name="depth",
+        description="Levels of replies to include under each response",
+        required=False,
+        type=int,
+    ),
+    OpenApiParameter(
+        name="replies",
+        description="Replies to include per response; see reply_count for the total",
+        required=False,
+        type=int,
+    ),
+]
+
+
+def bounded_int_param(request, name, default, maximum):
+    """Integer query parameter clamped to ``0..maximum``; ``default`` if absent or invalid."""
+    try:
+        value = int(request.query_params[name])
+    except (KeyError, ValueError):
+        return default
+    return max(0, min(value, maximum))
 
 
 @extend_schema(tags=['articles'])
+@extend_schema_view(get=extend_schema(parameters=THREAD_PARAMETERS))
 class ArticleResponseListCreateView(generics.ListCreateAPIView):
+    """
+    GET pages through an article's top-level responses (or, with
+    ``?parent=``, the replies to one response), each with a preview of its
+    thread. A page costs three queries however deep the threads go: the
+    count, the page and one materialized-path query for all the replies.
+    """
+
     queryset = ArticleResponse.objects.all()
     serializer_class = ArticleResponseSerializer
+    pagination_class = ResponseThreadPagination
 
     def get_permissions(self):
         if self.request.method == 'GET':
             return [permissions.AllowAny()]
         return [permissions.IsAuthenticated()]
 
+    def get_serializer_class(self):
+        if self.request.method == "GET":
+            return ThreadedResponseSerializer
+        return ArticleResponseSerializer
+
     def get_queryset(self):
         article_slug = self.kwargs.get("slug")
-        return ArticleResponse.objects.filter(
-            article__slug=article_slug, parent_response=None
+        queryset = ArticleResponse.objects.for_thread().filter(article__slug=article_slug)
+        parent = self.request.query_params.get("parent", None)
+        if parent is None:
+            return queryset.filter(depth=0)
+        try:
+            parent = uuid.UUID(parent)
+        except ValueError:
+            raise ValidationError({"parent": ["Must be a response id."]})
+        return queryset.filter(parent_response__id=parent)
+
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        ArticleResponse.objects.attach_replies(
+            page,
+            depth=bounded_int_param(
+                request,
+                "depth",
+                settings.ARTICLE_RESPONSE_THREAD_DEPTH,
+                settings.ARTICLE_RESPONSE_MAX_DEPTH,
+            ),
+            preview=bounded_int_param(
+                request,
+                "replies",
+                settings.ARTICLE_RESPONSE_REPLY_PREVIEW,
+                self.pagination_class.max_page_size,
+            ),
         )
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     def perform_create(self, serializer):
         user = self.request.user
         article_slug = self.kwargs.get("slug")
         article = get_object_or_404(Article, slug=article_slug)
+        parent = serializer.validated_data.get("parent_response")
+        if parent is not None:
+            if parent.article_id != article.pkid:
+                raise ValidationError(
+                    {"parent_response": ["Responses can only reply within the same article."]}
+                )
+            if parent.depth >= settings.ARTICLE_RESPONSE_MAX_DEPTH:
+                raise ValidationError(
+                    {"parent_response": ["This thread cannot be nested any deeper."]}
+                )
         serializer.save(user=user, article=article)
 
 
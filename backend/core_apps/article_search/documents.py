@@ -74,6 +74,12 @@ class ArticleDocument(Document):
         model = Article
         fields = ["created_at"]
 
+    def get_queryset(self):
+        return Article.objects.published().select_related("author__profile")
+
+    def should_index_object(self, obj):
+        return obj.is_published
+
     def prepare_author_username(self, instance):
         return instance.author.profile.username
 
@@ -81,9 +87,7 @@ class ArticleDocument(Document):
         return instance.author.email
 
     def prepare_tags(self, instance):
-        if isinstance(instance.tags, list):
-            return instance.tags
-        return [tag.name for tag in instance.tags.all()]
+        return instance.tag_names
 
     def prepare_id(self, instance):
         return str(instance.id)
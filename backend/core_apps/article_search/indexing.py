@@ -0,0 +1,32 @@
+from django_elasticsearch_dsl.apps import DEDConfig
+
+from core_apps.articles.models import Article
+
+from .documents import ArticleDocument
+
+
+def reindex_articles(pkids, chunk_size=500):
+    """
+    Bulk-sync the given articles with Elasticsearch, ``chunk_size`` per
+    request, for writes that bypass the per-instance ``post_save`` signal.
+    Does nothing when ``ELASTICSEARCH_DSL_AUTOSYNC`` is off.
+    """
+    pkids = list(pkids)
+    if not pkids or not DEDConfig.autosync_enabled():
+        return 0
+
+    document = ArticleDocument()
+    for start in range(0, len(pkids), chunk_size):
+        chunk = pkids[start : start + chunk_size]
+        published = list(document.get_queryset().filter(pkid__in=chunk))
+        if published:
+            document.update(published)
+        # Articles that are no longer published leave the index.
+        unpublished = set(chunk) - {article.pkid for article in published}
+        if unpublished:
+            document.update(
+                [Article(pkid=pkid) for pkid in unpublished],
+                action="delete",
+                raise_on_error=False,
+            )
+    return len(pkids)
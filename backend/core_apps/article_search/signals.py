@@ -1,14 +1,59 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django_elasticsearch_dsl.registries import registry
+from django_elasticsearch_dsl.signals import RealTimeSignalProcessor
 
 from core_apps.articles.models import Article
 
+# Articles whose index update is held back by single_index_update(), by pk.
+_deferred_updates = ContextVar("deferred_article_index_updates", default=None)
+
+
+class ArticleSignalProcessor(RealTimeSignalProcessor):
+    """
+    django-elasticsearch-dsl's real-time processor, except that article
+    saves are left to ``update_document`` below, which also drops articles
+    that are no longer published. Each article save reaches Elasticsearch
+    once instead of twice.
+    """
+
+    def handle_save(self, sender, instance, **kwargs):
+        if isinstance(instance, Article):
+            return
+        super().handle_save(sender, instance, **kwargs)
+
+
+@contextmanager
+def single_index_update():
+    """
+    Hold back article index updates made inside the block and send one per
+    article when it exits, so a save followed by tag changes indexes once.
+    """
+    pending = {}
+    token = _deferred_updates.set(pending)
+    try:
+        yield
+    finally:
+        _deferred_updates.reset(token)
+    for instance in pending.values():
+        update_document(Article, instance)
+
 
 @receiver(post_save, sender=Article)
 def update_document(sender, instance=None, created=False, **kwargs):
     """Update the ArticleDocument in Elasticsearch when an article instance is updated or created"""
-    registry.update(instance)
+    pending = _deferred_updates.get()
+    if pending is not None:
+        pending[instance.pk] = instance
+        return
+    if instance.is_published:
+        registry.update(instance)
+    else:
+        # Only published articles are searchable; drop any stale document.
+        registry.delete(instance, raise_on_error=False)
 
 
 @receiver(post_delete, sender=Article)
@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from .indexing import reindex_articles
+
+
+@shared_task(name="reindex_articles")
+def reindex_articles_task(pkids):
+    """Bulk-sync articles written without ``post_save``, e.g. by bulk imports."""
+    return f"Reindexed {reindex_articles(pkids)} articles"
@@ -15,7 +15,7 @@ class ArticleAdmin(admin.ModelAdmin):
     list_display = ["pkid", "author", "title", "slug", "view_count"]
     list_display_links = ["pkid", "author"]
     list_filter = ["created_at", "updated_at"]
-    search_fields = ["title", "body", "tags"]
+    search_fields = ["title__trgm_icontains", "=tags__name"]
     ordering = ["-created_at"]
 
 
@@ -8,4 +8,5 @@ class ArticlesConfig(AppConfig):
     verbose_name = _("Articles")
 
     def ready(self):
-        import core_apps.article_search.signals
+        import core_apps.article_search.signals  # noqa
+        import core_apps.articles.signals  # noqa
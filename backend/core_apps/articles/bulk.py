@@ -0,0 +1,64 @@
+from django.db import transaction
+from django.utils import timezone
+
+from core_apps.article_search.tasks import reindex_articles_task
+from core_apps.common.cache import bump_generation
+from core_apps.common.tags import bulk_set_tags, normalize_tag_names
+
+from .managers import RESPONSE_CACHE_NAMESPACE
+from .models import Article
+from .read_time_engine import ArticleReadTimeEngine
+from .tasks import schedule_article_transitions
+
+
+@transaction.atomic
+def bulk_save_articles(author, entries):
+    """
+    Create or update many articles by ``author`` in a fixed number of
+    queries, whatever the batch size.
+
+    ``entries`` are ``(article, data)`` pairs: ``article`` is ``None`` for a
+    new article or the existing one to update, and ``data`` its validated
+    fields with ``category`` already resolved and optional ``tags``. New
+    articles get unique slugs up front; existing ones keep theirs. The
+    per-instance signals are bypassed, so reading time, ``tag_names``, the
+    response cache, status transitions and the search index are all handled
+    here. Returns the created and the updated articles.
+    """
+    created, updated = [], []
+    tags_by_article = []
+    update_fields = {"reading_time", "tag_names", "updated_at"}
+    now = timezone.now()
+    for article, data in entries:
+        data = dict(data)
+        tags = data.pop("tags", None)
+        if article is None:
+            article = Article(author=author, **data)
+            created.append(article)
+            tags = tags or []
+        else:
+            for field, value in data.items():
+                setattr(article, field, value)
+            article.updated_at = now
+            update_fields.update(data)
+            updated.append(article)
+        if tags is not None:
+            article.tag_names = normalize_tag_names(tags)
+            tags_by_article.append((article, tags))
+        article.reading_time = ArticleReadTimeEngine.reading_time(
+            article, len(tags) if tags is not None else len(article.tag_names)
+        )
+
+    Article._meta.get_field("slug").reserve(created)
+    Article.objects.bulk_create(created)
+    if updated:
+        Article.objects.bulk_update(updated, sorted(update_fields))
+    bulk_set_tags(Article, {article.pk: tags for article, tags in tags_by_article})
+
+    bump_generation(RESPONSE_CACHE_NAMESPACE)
+    articles = [*created, *updated]
+    for article in articles:
+        schedule_article_transitions(article)
+    pkids = [article.pkid for article in articles]
+    transaction.on_commit(lambda: reindex_articles_task.delay(pkids))
+    return created, updated
@@ -1,14 +1,13 @@
 import django_filters as filters
-from django.utils import timezone
-from core_apps.articles.models import Article
+from core_apps.articles.models import Article, ArticleCategory
+from core_apps.common.tags import TagFilterSet
 
 
-class ArticleFilter(filters.FilterSet):
+class ArticleFilter(TagFilterSet):
     author = filters.CharFilter(
-        field_name="author__first_name", lookup_expr="icontains"
+        field_name="author__profile__first_name", lookup_expr="trgm_icontains"
     )
-    title = filters.CharFilter(field_name="title", lookup_expr="icontains")
-    tags = filters.CharFilter(field_name="tags__name", lookup_expr="iexact")
+    title = filters.CharFilter(field_name="title", lookup_expr="trgm_icontains")
     created_at = filters.DateFromToRangeFilter(field_name="created_at")
     updated_at = filters.DateFromToRangeFilter(field_name="updated_at")
     status = filters.ChoiceFilter(choices=Article.Status.choices)
@@ -16,24 +15,27 @@ class ArticleFilter(filters.FilterSet):
     end_date = filters.DateFromToRangeFilter(field_name="end_date")
     is_active = filters.BooleanFilter(method='filter_is_active')
     category_id = filters.UUIDFilter(field_name="category__id")
-    category_slug = filters.CharFilter(field_name="category__slug")
+    category_slug = filters.CharFilter(method="filter_category_slug")
+    min_views = filters.NumberFilter(field_name="views_count", lookup_expr="gte")
+    min_claps = filters.NumberFilter(field_name="claps_count", lookup_expr="gte")
 
     def filter_is_active(self, queryset, name, value):
-        now = timezone.now()
         if value:
-            return queryset.filter(
-                status=Article.Status.PUBLISHED,
-                start_date__lte=now,
-                end_date__gt=now
-            )
+            return queryset.published()
         return queryset
 
+    def filter_category_slug(self, queryset, name, value):
+        # The category and all of its subcategories.
+        return queryset.filter(ArticleCategory.subtree_q(value, prefix="category"))
+
     class Meta:
         model = Article
         fields = [
             "author", 
             "title", 
             "tags", 
+            "tags_any",
+            "tags_all",
             "created_at", 
             "updated_at",
             "status",
@@ -42,4 +44,6 @@ class ArticleFilter(filters.FilterSet):
             "is_active",
             "category_id",
             "category_slug",
+            "min_views",
+            "min_claps",
         ]
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from core_apps.articles.models import Article
+from core_apps.articles.read_time_engine import ArticleReadTimeEngine
+
+
+class Command(BaseCommand):
+    help = "Compute and store the reading time of existing articles"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of articles loaded and updated per batch",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        updated_count = 0
+        last_pkid = 0
+        while True:
+            chunk = list(
+                Article.objects.filter(pkid__gt=last_pkid)
+                .order_by("pkid")
+                .only(
+                    "pkid", "title", "description", "body", "banner_image",
+                    "reading_time",
+                )[:chunk_size]
+            )
+            if not chunk:
+                break
+            last_pkid = chunk[-1].pkid
+
+            reading_times = ArticleReadTimeEngine.estimate_many(chunk)
+            changed = []
+            for article in chunk:
+                if article.reading_time != reading_times[article.pk]:
+                    article.reading_time = reading_times[article.pk]
+                    changed.append(article)
+            if changed:
+                Article.objects.bulk_update(changed, ["reading_time"])
+                updated_count += len(changed)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated reading time on {updated_count} articles")
+        )
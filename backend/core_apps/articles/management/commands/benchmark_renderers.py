@@ -0,0 +1,108 @@
+import json
+import time
+import uuid
+from collections import OrderedDict
+from unittest import mock
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from faker import Faker
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from core_apps.articles.renderers import ArticleJSONRenderer
+from core_apps.common import renderers
+
+
+class FakeResponse:
+    status_code = 200
+
+
+def legacy_render(data):
+    """The previous renderer body: stdlib dumps of the envelope, as str."""
+    return json.dumps({"status_code": 200, "article": data})
+
+
+class Command(BaseCommand):
+    help = "Compare envelope JSON rendering speed on large article pages"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-sizes",
+            type=int,
+            nargs="+",
+            default=[10, 100, 1000],
+            help="Articles per page to render",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs per renderer; the fastest one is reported",
+        )
+
+    def handle(self, *args, **options):
+        faker = Faker()
+        renderer = ArticleJSONRenderer()
+        context = {"response": FakeResponse()}
+
+        for page_size in options["page_sizes"]:
+            page = OrderedDict(
+                [
+                    ("count", page_size),
+                    ("next", None),
+                    ("previous", None),
+                    (
+                        "results",
+                        ReturnList(
+                            [self.article(faker) for _ in range(page_size)],
+                            serializer=None,
+                        ),
+                    ),
+                ]
+            )
+            candidates = {
+                "json.dumps (legacy)": lambda: legacy_render(page),
+                "stdlib": lambda: self.without_orjson(renderer, page, context),
+            }
+            if renderers.orjson is not None:
+                candidates["orjson"] = lambda: renderer.render(
+                    page, renderer_context=context
+                )
+
+            self.stdout.write(f"{page_size} articles per page:")
+            for name, render in candidates.items():
+                seconds = min(self.timed(render) for _ in range(options["repeat"]))
+                size = len(render())
+                self.stdout.write(
+                    f"  {name:<20} {seconds * 1000:9.2f} ms  {size / 1024:9.1f} KiB"
+                )
+
+    def without_orjson(self, renderer, page, context):
+        with mock.patch.object(renderers, "orjson", None):
+            return renderer.render(page, renderer_context=context)
+
+    def timed(self, render):
+        started = time.perf_counter()
+        render()
+        return time.perf_counter() - started
+
+    def article(self, faker):
+        return ReturnDict(
+            [
+                ("id", str(uuid.uuid4())),
+                ("title", faker.sentence()),
+                ("slug", faker.slug()),
+                ("tags", faker.words(nb=4)),
+                ("estimated_reading_time", faker.random_int(1, 20)),
+                ("author_info", {"username": faker.user_name(), "about_me": faker.text()}),
+                ("description", faker.sentence(nb_words=12)),
+                ("body", faker.text(max_nb_chars=3000)),
+                ("banner_image", faker.image_url()),
+                ("views", faker.random_int(0, 100000)),
+                ("average_rating", 4.25),
+                ("claps_count", faker.random_int(0, 5000)),
+                ("created_at", timezone.now().isoformat()),
+                ("updated_at", timezone.now().isoformat()),
+            ],
+            serializer=None,
+        )
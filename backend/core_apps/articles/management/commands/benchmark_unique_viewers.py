@@ -0,0 +1,116 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core_apps.articles.models import Article, ArticleView
+from core_apps.common.hyperloglog import HyperLogLog
+from core_apps.common.unique_viewers import (
+    RedisViewerCounter,
+    get_unique_viewer_counter,
+    viewer_key,
+)
+
+
+class Command(BaseCommand):
+    help = "Compare HyperLogLog unique-viewer estimates with exact counting"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--viewers",
+            type=int,
+            default=100000,
+            help="Number of synthetic unique viewers to feed the estimators",
+        )
+        parser.add_argument(
+            "--article",
+            type=str,
+            help="Slug of an article whose ArticleView rows are used instead",
+        )
+        parser.add_argument(
+            "--redis",
+            action="store_true",
+            help="Also benchmark the Redis PFADD backend",
+        )
+
+    def handle(self, *args, **options):
+        if options["article"]:
+            viewers, exact_count, exact_seconds = self.article_viewers(
+                options["article"]
+            )
+        else:
+            viewers = [f"|10.{n}" for n in range(options["viewers"])]
+            started = time.perf_counter()
+            exact_count = len(set(viewers))
+            exact_seconds = time.perf_counter() - started
+
+        self.stdout.write(
+            f"Exact: {exact_count} unique viewers in {exact_seconds * 1000:.1f} ms"
+        )
+
+        sketch = HyperLogLog()
+        started = time.perf_counter()
+        sketch.update(viewers)
+        add_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        estimate = sketch.count()
+        count_seconds = time.perf_counter() - started
+        self.report(
+            "HyperLogLog (python)",
+            exact_count,
+            estimate,
+            len(viewers),
+            add_seconds,
+            count_seconds,
+        )
+
+        if options["redis"]:
+            counter = get_unique_viewer_counter()
+            if not isinstance(counter, RedisViewerCounter):
+                counter = RedisViewerCounter()
+            kind = f"benchmark-{uuid.uuid4().hex}"
+            started = time.perf_counter()
+            for start in range(0, len(viewers), 10000):
+                counter.add(kind, 0, viewers[start : start + 10000])
+            add_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            estimate = counter.count(kind, 0)
+            count_seconds = time.perf_counter() - started
+            counter.client.delete(
+                counter.key(kind, 0), counter.key(kind, 0, timezone.localdate())
+            )
+            self.report(
+                "HyperLogLog (redis)",
+                exact_count,
+                estimate,
+                len(viewers),
+                add_seconds,
+                count_seconds,
+            )
+
+    def article_viewers(self, slug):
+        try:
+            article = Article.objects.get(slug=slug)
+        except Article.DoesNotExist:
+            raise CommandError(f"Article '{slug}' does not exist")
+
+        views = ArticleView.objects.filter(article=article)
+        started = time.perf_counter()
+        exact_count = views.count()
+        exact_seconds = time.perf_counter() - started
+        viewers = [
+            viewer_key(user_id, viewer_ip)
+            for user_id, viewer_ip in views.values_list(
+                "user_id", "viewer_ip"
+            ).iterator()
+        ]
+        return viewers, exact_count, exact_seconds
+
+    def report(self, label, exact_count, estimate, added, add_seconds, count_seconds):
+        error = abs(estimate - exact_count) / exact_count * 100 if exact_count else 0
+        throughput = added / add_seconds if add_seconds else float("inf")
+        self.stdout.write(
+            f"{label}: estimate {estimate} ({error:.2f}% error), "
+            f"{throughput:,.0f} adds/s, count in {count_seconds * 1000:.1f} ms"
+        )
@@ -0,0 +1,68 @@
+import io
+import re
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from faker import Faker
+
+from core_apps.articles.read_time_engine import ArticleReadTimeEngine
+
+SIZES = {"1KB": 1024, "100KB": 100 * 1024, "5MB": 5 * 1024 * 1024}
+
+
+def findall_word_count(text):
+    """The original implementation, kept as the baseline."""
+    words = re.findall(r"\w+", text)
+    return len(words)
+
+
+class Command(BaseCommand):
+    help = "Compare word counting implementations on synthetic article bodies"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs per implementation; the fastest one is reported",
+        )
+
+    def handle(self, *args, **options):
+        faker = Faker()
+        sample = " ".join(faker.paragraphs(nb=200))
+
+        for label, size in SIZES.items():
+            text = (sample * (size // len(sample) + 1))[:size]
+            data = text.encode()
+            implementations = {
+                "findall": lambda: findall_word_count(text),
+                "word_count": lambda: ArticleReadTimeEngine.word_count(text),
+                "word_count_stream": lambda: ArticleReadTimeEngine.word_count_stream(
+                    io.BytesIO(data)
+                ),
+            }
+            self.stdout.write(f"{label} body:")
+            for name, count_words in implementations.items():
+                seconds = min(
+                    self.timed(count_words) for _ in range(options["repeat"])
+                )
+                words, peak = self.peak_memory(count_words)
+                self.stdout.write(
+                    f"  {name:<18} {words:>8} words  {seconds * 1000:9.2f} ms  "
+                    f"peak {peak / 1024:9.1f} KiB"
+                )
+
+    def timed(self, count_words):
+        started = time.perf_counter()
+        count_words()
+        return time.perf_counter() - started
+
+    def peak_memory(self, count_words):
+        tracemalloc.start()
+        try:
+            words = count_words()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return words, peak
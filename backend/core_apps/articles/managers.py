@@ -0,0 +1,289 @@
+import uuid
+from functools import reduce
+from operator import or_
+
+from django.db import connections, models, transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Prefetch, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from core_apps.common.cache import bump_generation
+
+
+def related_count(model, fk_name="article"):
+    """Correlated COUNT(*) of ``model`` rows pointing at the outer article."""
+    subquery = (
+        model.objects.filter(**{fk_name: OuterRef("pk")})
+        .order_by()
+        .values(fk_name)
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(subquery, output_field=IntegerField()), 0)
+
+
+def related_sum(model, field, fk_name="article"):
+    """Correlated SUM(``field``) of ``model`` rows pointing at the outer article."""
+    subquery = (
+        model.objects.filter(**{fk_name: OuterRef("pk")})
+        .order_by()
+        .values(fk_name)
+        .annotate(total=Sum(field))
+        .values("total")
+    )
+    return Coalesce(Subquery(subquery, output_field=IntegerField()), 0)
+
+
+# Denormalized engagement counters stored on ``Article``.
+COUNTER_FIELDS = (
+    "views_count",
+    "claps_count",
+    "bookmarks_count",
+    "responses_count",
+    "rating_sum",
+    "rating_count",
+)
+
+# Per-article lists embedded by ``ArticleSerializer``.
+NESTED_RELATIONS = ("bookmarks", "article_responses")
+
+# Generation namespace of the cached public article responses.
+RESPONSE_CACHE_NAMESPACE = "articles"
+
+# Generation namespace of the cached category tree.
+CATEGORY_CACHE_NAMESPACE = "article-categories"
+
+
+class PublishedQuerySet(models.QuerySet):
+    """
+    The single definition of "published": status published and inside the
+    start/end window. Backed by the partial indexes on published rows.
+    """
+
+    published_status = "published"
+
+    def published(self, at=None):
+        at = at or timezone.now()
+        return self.filter(
+            status=self.published_status, start_date__lte=at, end_date__gt=at
+        )
+
+
+class ArticleQuerySet(PublishedQuerySet):
+    def _related_model(self, related_name):
+        return self.model._meta.get_field(related_name).related_model
+
+    def actual_counters(self):
+        """
+        Every denormalized counter column mapped to a correlated subquery
+        recomputing it from the source tables.
+        """
+        rating_model = self._related_model("ratings")
+
+        return {
+            "views_count": related_count(self._related_model("article_views")),
+            "claps_count": related_count(self._related_model("clap")),
+            "bookmarks_count": related_count(self._related_model("bookmarks")),
+            "responses_count": related_count(self._related_model("article_responses")),
+            "rating_sum": related_sum(rating_model, "rating"),
+            "rating_count": related_count(rating_model),
+        }
+
+    def with_actual_counters(self):
+        """Annotate ``actual_<counter>`` for every denormalized counter column."""
+        return self.annotate(
+            **{
+                f"actual_{field}": expression
+                for field, expression in self.actual_counters().items()
+            }
+        )
+
+    def repair_counters(self):
+        """
+        Rewrite the counters of rows whose stored values disagree with the
+        source tables, in a single ``UPDATE ... SET counter = (subquery)``
+        restricted to those rows. Computing and writing in one statement
+        leaves no window for a concurrent ``F()`` adjustment to be lost.
+        Returns the number of rows repaired.
+        """
+        counters = self.actual_counters()
+        drifted = reduce(
+            or_, (~Q(**{field: expression}) for field, expression in counters.items())
+        )
+        return self.filter(drifted).update(**counters)
+
+    def adjust_counters(self, **deltas):
+        """
+        Atomically add ``deltas`` to counter columns, e.g. ``claps_count=1``.
+        Decrements are clamped at zero so drift never trips the column check.
+        """
+        updates = {}
+        for field, delta in deltas.items():
+            value = F(field) + delta
+            updates[field] = Greatest(value, 0) if delta < 0 else value
+        return self.update(**updates)
+
+    def update_returning(self, **values):
+        """
+        ``update(**values)`` that also returns the primary keys of the rows it
+        changed, in a single ``UPDATE ... RETURNING`` statement where the
+        database supports it. Like ``update()``, no signals are sent.
+        """
+        connection = connections[self.db]
+        if connection.vendor not in ("postgresql", "sqlite"):
+            with transaction.atomic(using=self.db):
+                pkids = list(self.select_for_update().values_list("pkid", flat=True))
+                self.model._base_manager.filter(pkid__in=pkids).update(**values)
+            return pkids
+
+        opts = self.model._meta
+        quote = connection.ops.quote_name
+        assignments, params = [], []
+        for name, value in values.items():
+            field = opts.get_field(name)
+            assignments.append(f"{quote(field.column)} = %s")
+            params.append(field.get_db_prep_save(value, connection))
+
+        pk_column = quote(opts.pk.column)
+        subquery, subquery_params = (
+            self.order_by()
+            .values("pk")
+            .query.get_compiler(using=self.db)
+            .as_sql()
+        )
+        sql = (
+            f"UPDATE {quote(opts.db_table)} SET {', '.join(assignments)} "
+            f"WHERE {pk_column} IN ({subquery}) RETURNING {pk_column}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, (*params, *subquery_params))
+            return [row[0] for row in cursor.fetchall()]
+
+    def for_listing(self, nested=NESTED_RELATIONS):
+        """
+        Everything ``ArticleSerializer`` touches, loaded in a constant number
+        of queries regardless of how many articles are on the page. Only the
+        ``nested`` relations that will actually be rendered are prefetched.
+        """
+        lookups = []
+        for related_name in NESTED_RELATIONS:
+            if related_name in nested:
+                related_model = self._related_model(related_name)
+                lookups.append(
+                    Prefetch(
+                        related_name,
+                        queryset=related_model.objects.select_related("user__profile"),
+                    )
+                )
+
+        return self.select_related("author__profile", "category").prefetch_related(
+            *lookups
+        )
+
+
+ArticleManager = models.Manager.from_queryset(ArticleQuerySet)
+
+
+class ClapQuerySet(models.QuerySet):
+    """
+    Claps are added and removed with ``INSERT ... ON CONFLICT DO NOTHING``
+    and ``DELETE ... RETURNING``, so concurrent requests can neither clap
+    twice nor count twice. On PostgreSQL that statement and the
+    ``claps_count`` adjustment run as one data-modifying CTE; SQLite runs
+    them as two statements in a transaction.
+
+    No model signals are sent, so these methods update the counter and the
+    response cache themselves. Both return the pks of the articles changed.
+    """
+
+    def clap(self, user, slugs):
+        """Clap every article in ``slugs`` that ``user`` has not clapped yet."""
+        slugs = list(dict.fromkeys(slugs))
+        if not slugs:
+            return []
+        connection = connections[self.db]
+        quote = connection.ops.quote_name
+        opts, article_opts = self.model._meta, self._article_model()._meta
+        id_column, created, updated, user_column, article = (
+            quote(opts.get_field(name).column)
+            for name in ("id", "created_at", "updated_at", "user", "article")
+        )
+        slug = quote(article_opts.get_field("slug").column)
+
+        # Every inserted row needs its own UUID, picked by the article slug.
+        id_field = opts.get_field("id")
+        uuids = []
+        for value in slugs:
+            uuids += [value, id_field.get_db_prep_value(uuid.uuid4(), connection)]
+        now = opts.get_field("created_at").get_db_prep_value(timezone.now(), connection)
+
+        sql = (
+            f"INSERT INTO {quote(opts.db_table)} "
+            f"({id_column}, {created}, {updated}, {user_column}, {article}) "
+            f"SELECT CASE {slug} {' '.join(['WHEN %s THEN %s'] * len(slugs))} END, "
+            f"%s, %s, %s, {quote(article_opts.pk.column)} "
+            f"FROM {quote(article_opts.db_table)} "
+            f"WHERE {slug} IN ({', '.join(['%s'] * len(slugs))}) "
+            f"ON CONFLICT ({user_column}, {article}) DO NOTHING "
+            f"RETURNING {article}"
+        )
+        return self._apply(sql, (*uuids, now, now, user.pk, *slugs), 1)
+
+    def unclap(self, user, slugs):
+        """Remove ``user``'s claps from the articles in ``slugs``."""
+        slugs = list(dict.fromkeys(slugs))
+        if not slugs:
+            return []
+        connection = connections[self.db]
+        quote = connection.ops.quote_name
+        opts, article_opts = self.model._meta, self._article_model()._meta
+        article = quote(opts.get_field("article").column)
+
+        sql = (
+            f"DELETE FROM {quote(opts.db_table)} "
+            f"WHERE {quote(opts.get_field('user').column)} = %s "
+            f"AND {article} IN (SELECT {quote(article_opts.pk.column)} "
+            f"FROM {quote(article_opts.db_table)} "
+            f"WHERE {quote(article_opts.get_field('slug').column)} "
+            f"IN ({', '.join(['%s'] * len(slugs))})) "
+            f"RETURNING {article}"
+        )
+        return self._apply(sql, (user.pk, *slugs), -1)
+
+    def _article_model(self):
+        return self.model._meta.get_field("article").related_model
+
+    def _apply(self, sql, params, delta):
+        connection = connections[self.db]
+        articles = self._article_model()
+
+        if connection.vendor == "postgresql":
+            quote = connection.ops.quote_name
+            table = quote(articles._meta.db_table)
+            pk = quote(articles._meta.pk.column)
+            counter = quote(articles._meta.get_field("claps_count").column)
+            change = f"{counter} + 1" if delta > 0 else f"GREATEST({counter} - 1, 0)"
+            article = quote(self.model._meta.get_field("article").column)
+            sql = (
+                f"WITH changed AS ({sql}) "
+                f"UPDATE {table} SET {counter} = {change} "
+                f"WHERE {pk} IN (SELECT {article} FROM changed) RETURNING {pk}"
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                pkids = [row[0] for row in cursor.fetchall()]
+        else:
+            with transaction.atomic(using=self.db):
+                with connection.cursor() as cursor:
+                    cursor.execute(sql, params)
+                    pkids = [row[0] for row in cursor.fetchall()]
+                articles.objects.filter(pk__in=pkids).adjust_counters(
+                    claps_count=delta
+                )
+
+        if pkids:
+            bump_generation(RESPONSE_CACHE_NAMESPACE)
+        return pkids
+
+
+ClapManager = models.Manager.from_queryset(ClapQuerySet)
@@ -0,0 +1,87 @@
+# Generated by Django 5.0.2 on 2026-10-18 16:00
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Article = apps.get_model("articles", "Article")
+    sources = {
+        "views_count": (apps.get_model("articles", "ArticleView"), Count("pk")),
+        "claps_count": (apps.get_model("articles", "Clap"), Count("pk")),
+        "bookmarks_count": (
+            apps.get_model("article_bookmarks", "Bookmark"),
+            Count("pk"),
+        ),
+        "responses_count": (
+            apps.get_model("article_responses", "ArticleResponse"),
+            Count("pk"),
+        ),
+        "rating_sum": (apps.get_model("article_ratings", "Rating"), Sum("rating")),
+        "rating_count": (apps.get_model("article_ratings", "Rating"), Count("pk")),
+    }
+
+    updates = {}
+    for field, (model, aggregate) in sources.items():
+        subquery = (
+            model.objects.filter(article=OuterRef("pk"))
+            .order_by()
+            .values("article")
+            .annotate(total=aggregate)
+            .values("total")
+        )
+        updates[field] = Coalesce(Subquery(subquery, output_field=IntegerField()), 0)
+    Article.objects.update(**updates)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0008_articleimage"),
+        ("article_bookmarks", "0001_initial"),
+        ("article_ratings", "0001_initial"),
+        ("article_responses", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="bookmarks_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="Bookmarks"),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="claps_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="Claps"),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="Rating Count"),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0, verbose_name="Rating Sum"),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="responses_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="Responses"),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="views_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="Views"),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(fields=["-views_count"], name="article_views_count_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(fields=["-claps_count"], name="article_claps_count_idx"),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
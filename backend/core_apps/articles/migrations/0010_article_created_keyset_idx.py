@@ -0,0 +1,19 @@
+# Generated by Django 5.0.2 on 2026-10-18 16:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0009_article_engagement_counters"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["-created_at", "-pkid"], name="article_created_keyset_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.2 on 2026-10-18 17:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0010_article_created_keyset_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="reading_time",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Estimated reading time in minutes",
+                verbose_name="Reading Time",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.2 on 2026-10-18 18:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0011_article_reading_time"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["status", "start_date"], name="article_status_start_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["status", "end_date"], name="article_status_end_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.0.2 on 2026-10-18 19:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0012_article_status_date_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["start_date", "end_date"],
+                name="article_published_window_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["-created_at", "-pkid"],
+                name="article_published_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["category", "-created_at"],
+                name="article_category_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["author", "-created_at"], name="article_author_created_idx"
+            ),
+        ),
+    ]
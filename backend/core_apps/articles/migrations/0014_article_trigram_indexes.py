@@ -0,0 +1,15 @@
+from django.db import migrations
+
+from core_apps.common.trigram import add_trigram_indexes
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("articles", "0013_article_published_indexes"),
+    ]
+
+    operations = [
+        add_trigram_indexes("articles_article", ["title"]),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+from core_apps.common.indexes import add_postgres_indexes
+from core_apps.common.tags import backfill_tag_names
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("articles", "0014_article_trigram_indexes"),
+        ("taggit", "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="tag_names",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        backfill_tag_names("articles", "article"),
+        add_postgres_indexes("articles_article", {"article_tag_names_gin": "gin (tag_names)"}),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+from core_apps.common.models import backfill_tree_paths
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0015_article_tag_names"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="articlecategory",
+            name="path",
+            field=models.CharField(db_index=True, default="", editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="articlecategory",
+            name="depth",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        backfill_tree_paths("articles", "articlecategory"),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations
+
+import core_apps.common.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0016_articlecategory_path"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="article",
+            name="slug",
+            field=core_apps.common.fields.BulkAutoSlugField(
+                always_update=True, editable=False, populate_from="title", unique=True
+            ),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0017_alter_article_slug"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="banner_variants",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
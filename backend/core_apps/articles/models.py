@@ -1,23 +1,39 @@
+import uuid
+from collections import Counter
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
 from autoslug import AutoSlugField
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from taggit.managers import TaggableManager
-from django.utils import timezone
-from datetime import timedelta
 
-from core_apps.common.models import TimeStampedModel
+from core_apps.common.cache import bump_generation
+from core_apps.common.fields import BulkAutoSlugField
+from core_apps.common.models import MaterializedPathModel, TimeStampedModel
 
+from .managers import RESPONSE_CACHE_NAMESPACE, ArticleManager, ClapManager
 from .read_time_engine import ArticleReadTimeEngine
 
 User = get_user_model()
 
 
+# Article fields that feed into the stored reading time (tags are handled by
+# the m2m_changed receiver in core_apps.articles.signals).
+READING_TIME_FIELDS = {"title", "description", "body", "banner_image"}
+
+
+DEFAULT_BANNER_IMAGE = "/profile_default.png"
+
+
 def get_default_end_date():
     return timezone.now() + timedelta(days=365*50)
 
 
-class ArticleCategory(TimeStampedModel):
+class ArticleCategory(MaterializedPathModel, TimeStampedModel):
     name = models.CharField(max_length=100, unique=True)
     slug = AutoSlugField(populate_from="name", always_update=True, unique=True)
     description = models.TextField(blank=True)
@@ -44,6 +60,8 @@ class Clap(TimeStampedModel):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     article = models.ForeignKey("Article", on_delete=models.CASCADE)
 
+    objects = ClapManager()
+
     class Meta:
         unique_together = ["user", "article"]
         ordering = ["-created_at"]
@@ -60,12 +78,15 @@ class Article(TimeStampedModel):
 
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name="articles")
     title = models.CharField(verbose_name=_("Title"), max_length=255)
-    slug = AutoSlugField(populate_from="title", always_update=True, unique=True)
+    slug = BulkAutoSlugField(populate_from="title", always_update=True, unique=True)
     description = models.CharField(verbose_name=_("description"), max_length=255)
     body = models.TextField(verbose_name=_("article content"))
     banner_image = models.ImageField(
-        verbose_name=_("banner image"), default="/profile_default.png"
+        verbose_name=_("banner image"), default=DEFAULT_BANNER_IMAGE
     )
+    # Resized WebP/AVIF copies of the banner as {"format", "width", "name",
+    # "size"}, filled in by the process_article_banner task.
+    banner_variants = models.JSONField(default=list, blank=True, editable=False)
     category = models.ForeignKey(
         ArticleCategory,
         on_delete=models.SET_NULL,
@@ -75,6 +96,8 @@ class Article(TimeStampedModel):
         verbose_name=_("Article Category"),
     )
     tags = TaggableManager()
+    # Lowercased copy of the tag names, kept in sync by a signal receiver.
+    tag_names = models.JSONField(default=list, blank=True, editable=False)
     claps = models.ManyToManyField(User, through=Clap, related_name="clapped_articles")
     
     # New fields
@@ -95,23 +118,80 @@ class Article(TimeStampedModel):
         help_text=_("Date when the article will be archived")
     )
 
+    # Denormalized engagement counters, kept current by core_apps.articles.signals
+    # and repaired by the reconcile_article_counters task.
+    views_count = models.PositiveIntegerField(verbose_name=_("Views"), default=0)
+    claps_count = models.PositiveIntegerField(verbose_name=_("Claps"), default=0)
+    bookmarks_count = models.PositiveIntegerField(
+        verbose_name=_("Bookmarks"), default=0
+    )
+    responses_count = models.PositiveIntegerField(
+        verbose_name=_("Responses"), default=0
+    )
+    rating_sum = models.PositiveIntegerField(verbose_name=_("Rating Sum"), default=0)
+    rating_count = models.PositiveIntegerField(
+        verbose_name=_("Rating Count"), default=0
+    )
+    reading_time = models.PositiveIntegerField(
+        verbose_name=_("Reading Time"),
+        default=0,
+        help_text=_("Estimated reading time in minutes"),
+    )
+
+    objects = ArticleManager()
+
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            models.Index(fields=["-views_count"], name="article_views_count_idx"),
+            models.Index(fields=["-claps_count"], name="article_claps_count_idx"),
+            models.Index(
+                fields=["-created_at", "-pkid"], name="article_created_keyset_idx"
+            ),
+            models.Index(fields=["status", "start_date"], name="article_status_start_idx"),
+            models.Index(fields=["status", "end_date"], name="article_status_end_idx"),
+            # Partial indexes over published rows serve Article.objects.published().
+            models.Index(
+                fields=["start_date", "end_date"],
+                condition=models.Q(status="published"),
+                name="article_published_window_idx",
+            ),
+            models.Index(
+                fields=["-created_at", "-pkid"],
+                condition=models.Q(status="published"),
+                name="article_published_recent_idx",
+            ),
+            models.Index(
+                fields=["category", "-created_at"], name="article_category_created_idx"
+            ),
+            models.Index(
+                fields=["author", "-created_at"], name="article_author_created_idx"
+            ),
+        ]
+
     def __str__(self):
         return f"{self.author.email} - {self.title}"
 
-    @property
-    def estimated_reading_time(self):
-        return ArticleReadTimeEngine.estimate_reading_time(self)
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or READING_TIME_FIELDS & set(update_fields):
+            self.reading_time = ArticleReadTimeEngine.estimate_reading_time(self)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "reading_time"}
+        super().save(*args, **kwargs)
+
+    def stored_banner_files(self):
+        """Storage names of the uploaded banner and its variants."""
+        names = [variant["name"] for variant in self.banner_variants]
+        if self.banner_image and self.banner_image.name != DEFAULT_BANNER_IMAGE:
+            names.insert(0, self.banner_image.name)
+        return names
 
     def view_count(self):
-        return self.article_views.count()
+        return self.views_count
 
     def average_rating(self):
-        ratings = self.ratings.all()
-
-        if ratings.count() > 0:
-            total_rating = sum(rating.rating for rating in ratings)
-            average_rating = total_rating / ratings.count()
-            return round(average_rating, 2)
+        if self.rating_count > 0:
+            return round(self.rating_sum / self.rating_count, 2)
         return None
 
     @property
@@ -149,3 +229,82 @@ class ArticleView(TimeStampedModel):
             article=article, user=user, viewer_ip=viewer_ip
         )
         view.save()
+
+    @classmethod
+    def record_views(cls, events, chunk_size=200):
+        """
+        Persist buffered ``(article_id, user_id, viewer_ip)`` view events in
+        bulk. Duplicates within the batch and views already on record are
+        dropped, and each article's ``views_count`` is bumped by the number of
+        rows actually inserted.
+
+        Events can outlive what they point at while buffered: views of
+        deleted articles are dropped and deleted users become anonymous, so
+        one stale event cannot fail the whole batch on a foreign key.
+        """
+        events = list(dict.fromkeys(events))
+        live_articles = set(
+            Article.objects.filter(
+                pkid__in={article_id for article_id, _, _ in events}
+            ).values_list("pkid", flat=True)
+        )
+        live_users = set(
+            User.objects.filter(
+                pkid__in={user_id for _, user_id, _ in events if user_id is not None}
+            ).values_list("pkid", flat=True)
+        )
+        events = list(
+            dict.fromkeys(
+                (article_id, user_id if user_id in live_users else None, viewer_ip)
+                for article_id, user_id, viewer_ip in events
+                if article_id in live_articles
+            )
+        )
+        new_views = []
+        for start in range(0, len(events), chunk_size):
+            chunk = events[start : start + chunk_size]
+            lookup = reduce(
+                or_,
+                (
+                    models.Q(article_id=article_id, user_id=user_id, viewer_ip=viewer_ip)
+                    for article_id, user_id, viewer_ip in chunk
+                ),
+            )
+            existing = set(
+                cls.objects.filter(lookup).values_list(
+                    "article_id", "user_id", "viewer_ip"
+                )
+            )
+            new_views.extend(
+                cls(
+                    id=uuid.uuid4(),
+                    article_id=article_id,
+                    user_id=user_id,
+                    viewer_ip=viewer_ip,
+                )
+                for article_id, user_id, viewer_ip in chunk
+                if (article_id, user_id, viewer_ip) not in existing
+            )
+
+        cls.objects.bulk_create(new_views, ignore_conflicts=True)
+
+        # Rows a concurrent writer inserted first were skipped by
+        # ignore_conflicts; only the ids generated here that made it in count.
+        inserted = Counter()
+        for start in range(0, len(new_views), chunk_size):
+            ids = [view.id for view in new_views[start : start + chunk_size]]
+            inserted.update(
+                cls.objects.filter(id__in=ids).values_list("article_id", flat=True)
+            )
+
+        articles_by_delta = {}
+        for article_id, delta in inserted.items():
+            articles_by_delta.setdefault(delta, []).append(article_id)
+        for delta, article_ids in articles_by_delta.items():
+            Article.objects.filter(pkid__in=article_ids).adjust_counters(
+                views_count=delta
+            )
+        if inserted:
+            # update() sends no signals, so drop the cached responses here.
+            bump_generation(RESPONSE_CACHE_NAMESPACE)
+        return sum(inserted.values())
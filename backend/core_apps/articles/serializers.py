@@ -1,13 +1,27 @@
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
 from rest_framework import serializers
 
 from core_apps.article_responses.serializers import ArticleResponseSerializer
-from core_apps.articles.models import Article, ArticleView, Clap, ArticleCategory
-from core_apps.article_bookmarks.models import Bookmark
+from core_apps.article_search.signals import single_index_update
+from core_apps.articles.models import Article, Clap, ArticleCategory
 from core_apps.article_bookmarks.serializers import BookmarkSerializer
+from core_apps.common.images import smallest_variant
+from core_apps.common.serializers import DynamicFieldsMixin
+from core_apps.common.tags import bulk_set_tags, normalize_tag_names
 from core_apps.profiles.serializers import ProfileSerializer
 
 
 class TagListField(serializers.Field):
+    def get_attribute(self, instance):
+        # Read the denormalized names rather than querying the tag tables.
+        tag_names = getattr(instance, "tag_names", None)
+        if tag_names is not None:
+            return tag_names
+        return super().get_attribute(instance)
+
     def to_representation(self, value):
         if isinstance(value, list):
             return value
@@ -28,25 +42,34 @@ class TagListField(serializers.Field):
 
 
 class ArticleCategorySerializer(serializers.ModelSerializer):
+    def validate_parent(self, value):
+        if value is not None and self.instance is not None:
+            if self.instance.is_ancestor_of(value):
+                raise serializers.ValidationError(
+                    "A category cannot be moved under itself or its subcategories"
+                )
+        return value
+
     class Meta:
         model = ArticleCategory
-        fields = ["pkid", "id", "name", "slug", "description", "parent", "created_at", "updated_at"]
+        fields = ["pkid", "id", "name", "slug", "description", "parent", "depth", "created_at", "updated_at"]
 
 
-class ArticleSerializer(serializers.ModelSerializer):
+class ArticleSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     author_info = ProfileSerializer(source="author.profile", read_only=True)
     banner_image = serializers.SerializerMethodField()
-    estimated_reading_time = serializers.ReadOnlyField()
+    banner_variants = serializers.SerializerMethodField()
+    estimated_reading_time = serializers.IntegerField(
+        source="reading_time", read_only=True
+    )
     tags = TagListField()
     views = serializers.SerializerMethodField()
-    average_rating = serializers.ReadOnlyField()
+    average_rating = serializers.SerializerMethodField()
     bookmarks = serializers.SerializerMethodField()
     bookmarks_count = serializers.SerializerMethodField()
     claps_count = serializers.SerializerMethodField()
     article_responses = ArticleResponseSerializer(many=True, read_only=True)
-    article_responses_count = serializers.IntegerField(
-        source="article_responses.count", read_only=True
-    )
+    article_responses_count = serializers.SerializerMethodField()
     created_at = serializers.SerializerMethodField()
     updated_at = serializers.SerializerMethodField()
     category = ArticleCategorySerializer(read_only=True)
@@ -88,70 +111,74 @@ class ArticleSerializer(serializers.ModelSerializer):
         return data
 
     def get_article_responses_count(self, obj):
-        return obj.article_responses.count()
+        return obj.responses_count
 
     def get_claps_count(self, obj):
-        return obj.claps.count()
+        return obj.claps_count
 
     def get_bookmarks(self, obj):
-        bookmarks = Bookmark.objects.filter(article=obj)
-        return BookmarkSerializer(bookmarks, many=True).data
+        return BookmarkSerializer(obj.bookmarks.all(), many=True).data
 
     def get_bookmarks_count(self, obj):
-        return Bookmark.objects.filter(article=obj).count()
+        return obj.bookmarks_count
 
     def get_average_rating(self, obj):
         return obj.average_rating()
 
     def get_views(self, obj):
-        return ArticleView.objects.filter(article=obj).count()
+        return obj.views_count
 
     def get_banner_image(self, obj):
         if obj.banner_image:
             return obj.banner_image.url
         return None
 
+    def get_banner_variants(self, obj):
+        storage = obj.banner_image.storage
+        return [
+            {
+                "url": storage.url(variant["name"]),
+                "width": variant["width"],
+                "format": variant["format"],
+            }
+            for variant in obj.banner_variants
+        ]
+
     def get_created_at(self, obj):
         return obj.created_at.strftime("%Y-%m-%dT%H:%M:%SZ")
 
     def get_updated_at(self, obj):
         return obj.updated_at.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    def create(self, validated_data):
-        category_id = validated_data.pop("category_id", None)
-        article = super().create(validated_data)
-        
-        if category_id:
-            try:
-                category = ArticleCategory.objects.get(id=category_id)
-                article.category = category
-                article.save()
-            except ArticleCategory.DoesNotExist:
-                pass
-                
+    def resolve_category(self, validated_data):
+        # An unknown category id leaves the article uncategorized.
+        if "category_id" in validated_data:
+            category_id = validated_data.pop("category_id")
+            validated_data["category"] = (
+                ArticleCategory.objects.filter(id=category_id).first()
+                if category_id
+                else None
+            )
+        return validated_data
+
+    def save_with_tags(self, validated_data, save):
+        # Taggit's manager is not a field DRF writes to. The row is saved
+        # once with its tag_names (and so its reading time) already set, the
+        # tagged items follow in bulk and the article is indexed once.
+        tags = validated_data.pop("tags", None)
+        if tags is not None:
+            validated_data["tag_names"] = normalize_tag_names(tags)
+        with single_index_update(), transaction.atomic():
+            article = save(self.resolve_category(validated_data))
+            if tags is not None:
+                bulk_set_tags(Article, {article.pk: tags})
         return article
 
+    def create(self, validated_data):
+        return self.save_with_tags(validated_data, super().create)
+
     def update(self, instance, validated_data):
-        print("Update method called with data:", validated_data)
-        category_id = validated_data.pop("category_id", None)
-        print("Category ID from request:", category_id)
-        article = super().update(instance, validated_data)
-        
-        if category_id is not None:
-            try:
-                print("Attempting to fetch category with ID:", category_id)
-                category = ArticleCategory.objects.get(id=category_id)
-                print("Found category:", category)
-                article.category = category
-                article.save()
-                print("Article updated with category")
-            except ArticleCategory.DoesNotExist:
-                print("Category not found with ID:", category_id)
-                article.category = None
-                article.save()
-                print("Article category set to None")
-                
-        return article
+        return self.save_with_tags(validated_data, partial(super().update, instance))
 
     class Meta:
         model = Article
@@ -166,6 +193,7 @@ class ArticleSerializer(serializers.ModelSerializer):
             "description",
             "body",
             "banner_image",
+            "banner_variants",
             "average_rating",
             "bookmarks_count",
             "bookmarks",
@@ -182,6 +210,26 @@ class ArticleSerializer(serializers.ModelSerializer):
             "is_published",
         ]
         read_only_fields = ["author_info"]
+        # Responses are paged through the threaded responses endpoint; the
+        # flat list of all of them is only embedded when asked for.
+        expandable_fields = ["article_responses"]
+
+
+class ArticleListSerializer(ArticleSerializer):
+    """
+    Compact representation for list pages: the body and the per-user
+    bookmark/response lists are only rendered when asked for via ``?expand=``.
+    """
+
+    def get_banner_image(self, obj):
+        # The smallest WebP copy wide enough for a list card, once rendered.
+        variant = smallest_variant(obj.banner_variants, settings.BANNER_LIST_WIDTH)
+        if variant is not None:
+            return obj.banner_image.storage.url(variant["name"])
+        return super().get_banner_image(obj)
+
+    class Meta(ArticleSerializer.Meta):
+        expandable_fields = ["body", "bookmarks", "article_responses", "banner_variants"]
 
 
 class ClapSerializer(serializers.ModelSerializer):
@@ -191,3 +239,71 @@ class ClapSerializer(serializers.ModelSerializer):
     class Meta:
         model = Clap
         fields = ["id", "username", "article_title"]
+
+
+class ClapBatchSerializer(serializers.Serializer):
+    """Article slugs whose clap state to read, to clap or to unclap."""
+
+    MAX_SLUGS = 100
+
+    slugs = serializers.ListField(
+        child=serializers.SlugField(),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_SLUGS,
+    )
+    clap = serializers.ListField(
+        child=serializers.SlugField(), required=False, max_length=MAX_SLUGS
+    )
+    unclap = serializers.ListField(
+        child=serializers.SlugField(), required=False, max_length=MAX_SLUGS
+    )
+
+
+class ArticleBulkItemSerializer(ArticleSerializer):
+    """One article of a bulk write: updates the article ``slug`` names, if any."""
+
+    NEW_ARTICLE_FIELDS = ("title", "description", "body")
+
+    slug = serializers.SlugField(required=False)
+    tags = TagListField(required=False)
+    start_date = serializers.DateTimeField(required=False)
+    end_date = serializers.DateTimeField(required=False)
+
+    def validate(self, data):
+        data = super().validate(data)
+        if "slug" not in data:
+            missing = {
+                field: "This field is required."
+                for field in self.NEW_ARTICLE_FIELDS
+                if field not in data
+            }
+            if missing:
+                raise serializers.ValidationError(missing)
+        return data
+
+    class Meta(ArticleSerializer.Meta):
+        fields = [
+            "slug",
+            "title",
+            "description",
+            "body",
+            "tags",
+            "category_id",
+            "status",
+            "start_date",
+            "end_date",
+        ]
+        extra_kwargs = {
+            "title": {"required": False},
+            "description": {"required": False},
+            "body": {"required": False},
+        }
+
+
+class ArticleBulkSerializer(serializers.Serializer):
+    MAX_ARTICLES = 1000
+
+    articles = ArticleBulkItemSerializer(
+        many=True, allow_empty=False, max_length=MAX_ARTICLES
+    )
@@ -0,0 +1,133 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from core_apps.article_search.signals import update_document
+from core_apps.articles.managers import (
+    CATEGORY_CACHE_NAMESPACE,
+    RESPONSE_CACHE_NAMESPACE,
+    related_sum,
+)
+from core_apps.articles.models import Article, ArticleCategory
+from core_apps.articles.read_time_engine import ArticleReadTimeEngine
+from core_apps.articles.tasks import schedule_article_transitions
+from core_apps.common.cache import bump_generation
+from core_apps.common.tags import TAG_CHANGE_ACTIONS, tag_names_receiver
+
+# Engagement models whose rows are mirrored by a counter column on Article.
+COUNTED_MODELS = {
+    "articles.Clap": "claps_count",
+    "articles.ArticleView": "views_count",
+    "article_bookmarks.Bookmark": "bookmarks_count",
+    "article_responses.ArticleResponse": "responses_count",
+}
+
+
+def _make_counter_receivers(sender, field):
+    @receiver(post_save, sender=sender, weak=False)
+    def increment_counter(sender, instance, created, **kwargs):
+        if created:
+            Article.objects.filter(pkid=instance.article_id).adjust_counters(
+                **{field: 1}
+            )
+
+    @receiver(post_delete, sender=sender, weak=False)
+    def decrement_counter(sender, instance, **kwargs):
+        Article.objects.filter(pkid=instance.article_id).adjust_counters(
+            **{field: -1}
+        )
+
+
+for sender, field in COUNTED_MODELS.items():
+    _make_counter_receivers(sender, field)
+
+
+@receiver(post_save, sender="article_ratings.Rating")
+def add_rating(sender, instance, created, **kwargs):
+    articles = Article.objects.filter(pkid=instance.article_id)
+    if created:
+        articles.adjust_counters(rating_sum=instance.rating, rating_count=1)
+    else:
+        # The previous score is unknown here, so resum this article's ratings.
+        articles.update(rating_sum=related_sum(sender, "rating"))
+
+
+@receiver(post_delete, sender="article_ratings.Rating")
+def remove_rating(sender, instance, **kwargs):
+    Article.objects.filter(pkid=instance.article_id).adjust_counters(
+        rating_sum=-instance.rating, rating_count=-1
+    )
+
+
+# Models whose changes show up in cached article responses.
+CACHED_MODELS = (
+    "articles.Article",
+    "articles.ArticleCategory",
+    "profiles.Profile",
+    "articles.Clap",
+    "articles.ArticleView",
+    "article_ratings.Rating",
+    "article_bookmarks.Bookmark",
+    "article_responses.ArticleResponse",
+)
+
+
+def invalidate_article_responses(sender, **kwargs):
+    bump_generation(RESPONSE_CACHE_NAMESPACE)
+
+
+for sender in CACHED_MODELS:
+    post_save.connect(invalidate_article_responses, sender=sender, weak=False)
+    post_delete.connect(invalidate_article_responses, sender=sender, weak=False)
+
+
+@receiver(post_save, sender=ArticleCategory)
+@receiver(post_delete, sender=ArticleCategory)
+def invalidate_category_tree(sender, **kwargs):
+    bump_generation(CATEGORY_CACHE_NAMESPACE)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def invalidate_on_tags_changed(sender, instance, action, model, **kwargs):
+    # TaggedItem is shared with products, so only react to article tags.
+    if action in TAG_CHANGE_ACTIONS and (
+        isinstance(instance, Article) or model is Article
+    ):
+        bump_generation(RESPONSE_CACHE_NAMESPACE)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def update_reading_time(sender, instance, action, model, pk_set, **kwargs):
+    if action not in TAG_CHANGE_ACTIONS:
+        return
+    if isinstance(instance, Article):
+        articles = [instance]
+    elif model is Article and pk_set:
+        articles = Article.objects.filter(pkid__in=pk_set).only(
+            "pkid", "title", "description", "body", "banner_image"
+        )
+    else:
+        return
+
+    reading_times = ArticleReadTimeEngine.estimate_many(articles)
+    for pkid, reading_time in reading_times.items():
+        Article.objects.filter(pkid=pkid).update(reading_time=reading_time)
+    if isinstance(instance, Article):
+        instance.reading_time = reading_times[instance.pk]
+
+
+m2m_changed.connect(
+    tag_names_receiver(Article), sender=Article.tags.through, weak=False
+)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def reindex_on_tags_changed(sender, instance, action, **kwargs):
+    # The search index's own m2m handler runs before tag_names is synced
+    # above, so index the article again now that it holds the final tags.
+    if action in TAG_CHANGE_ACTIONS and isinstance(instance, Article):
+        update_document(Article, instance)
+
+
+@receiver(post_save, sender=Article)
+def schedule_status_transitions(sender, instance, **kwargs):
+    schedule_article_transitions(instance)
@@ -1,55 +1,252 @@
+import os
+from functools import partial
+
 from celery import shared_task
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
 from django.utils import timezone
 import logging
-from .models import Article
+
+from PIL import UnidentifiedImageError
+
+from core_apps.article_search.indexing import reindex_articles
+from core_apps.common.cache import bump_generation
+from core_apps.common.images import render_variants
+from core_apps.common.scheduling import (
+    apply_transition,
+    requeue_if_early,
+    schedule_transition,
+    schedule_upcoming,
+)
+from core_apps.common.tasks import delete_stored_files
+from core_apps.common.unique_viewers import get_unique_viewer_counter, viewer_key
+
+from .managers import RESPONSE_CACHE_NAMESPACE
+from .models import Article, ArticleView
+from .view_buffer import get_view_buffer
 
 logger = logging.getLogger(__name__)
 
+# Status change applied when each date passes: field -> (from, to).
+ARTICLE_TRANSITIONS = {
+    "start_date": (Article.Status.DRAFT, Article.Status.PUBLISHED),
+    "end_date": (Article.Status.PUBLISHED, Article.Status.ARCHIVED),
+}
+
+
+def schedule_article_transitions(article):
+    """
+    Enqueue exact-time tasks for the article's upcoming status changes, and
+    for indexing it when a published article's start_date arrives.
+    """
+    for field, (from_status, _) in ARTICLE_TRANSITIONS.items():
+        if article.status == from_status:
+            schedule_transition(
+                apply_article_status_transition, article.pkid, field, getattr(article, field)
+            )
+    if article.status == Article.Status.PUBLISHED and article.start_date > timezone.now():
+        schedule_transition(
+            index_article_at_start, article.pkid, "start_date", article.start_date
+        )
+
+
+@shared_task(name="apply_article_status_transition")
+def apply_article_status_transition(pkid, field, scheduled_for):
+    """
+    Publish or archive one article at the exact time its start_date or
+    end_date passes. Version-checked against the stored date, so tasks left
+    behind by an edit do nothing.
+    """
+    changed = apply_transition(
+        apply_article_status_transition,
+        Article.objects.all(),
+        pkid,
+        field,
+        scheduled_for,
+        ARTICLE_TRANSITIONS[field],
+    )
+    if changed:
+        bump_generation(RESPONSE_CACHE_NAMESPACE)
+        reindex_articles([pkid])
+    return f"Applied {field} transition to {changed} articles"
+
+
+@shared_task(name="index_article_at_start")
+def index_article_at_start(pkid, field, scheduled_for):
+    """
+    Add an article saved as published with a future start_date to the search
+    index once it goes live; no status changes then, so nothing else would.
+    Does nothing if the article was edited since the task was enqueued.
+    """
+    scheduled_for = requeue_if_early(index_article_at_start, pkid, field, scheduled_for)
+    if scheduled_for is None:
+        return f"Requeued indexing of article {pkid}"
+    if not Article.objects.filter(
+        pkid=pkid, status=Article.Status.PUBLISHED, **{field: scheduled_for}
+    ).exists():
+        return f"Article {pkid} was changed since indexing was scheduled"
+    bump_generation(RESPONSE_CACHE_NAMESPACE)
+    reindex_articles([pkid])
+    return f"Indexed article {pkid}"
+
+
 @shared_task
 def check_and_update_article_statuses():
     """
     Periodic task to check and update article statuses based on their start_date and end_date.
     - Articles with start_date <= now and status='draft' will be published
     - Articles with end_date <= now and status='published' will be archived
+
+    Each transition is a single UPDATE returning the affected ids, served by
+    the (status, start_date) and (status, end_date) indexes; only those ids
+    are then reindexed in bulk.
+
+    Exact-time tasks normally apply these on time; this sweep is the safety
+    net for lost tasks and enqueues tasks for dates coming into the
+    scheduler horizon, including indexing published articles that go live.
     """
     now = timezone.now()
-    logger.info(f"Checking article statuses at {now}")
-    
-    # Get all articles that should be published (start_date <= now and status is draft)
-    articles_to_publish = Article.objects.filter(
-        status=Article.Status.DRAFT,
-        start_date__lte=now
+
+    published_ids = Article.objects.filter(
+        status=Article.Status.DRAFT, start_date__lte=now
+    ).update_returning(status=Article.Status.PUBLISHED, updated_at=now)
+
+    archived_ids = Article.objects.filter(
+        status=Article.Status.PUBLISHED, end_date__lte=now
+    ).update_returning(status=Article.Status.ARCHIVED, updated_at=now)
+
+    changed_ids = set(published_ids) | set(archived_ids)
+    if changed_ids:
+        bump_generation(RESPONSE_CACHE_NAMESPACE)
+        reindex_articles(sorted(changed_ids))
+
+    scheduled_count = sum(
+        schedule_upcoming(
+            apply_article_status_transition,
+            Article.objects.filter(status=from_status),
+            field,
+        )
+        for field, (from_status, _) in ARTICLE_TRANSITIONS.items()
+    ) + schedule_upcoming(
+        index_article_at_start,
+        Article.objects.filter(status=Article.Status.PUBLISHED),
+        "start_date",
     )
-    
-    # Get all articles that should be archived (end_date <= now and status is published)
-    articles_to_archive = Article.objects.filter(
-        status=Article.Status.PUBLISHED,
-        end_date__lte=now
+
+    logger.info(
+        f"Published {len(published_ids)} articles and archived "
+        f"{len(archived_ids)} articles at {now}; scheduled {scheduled_count} transitions"
+    )
+    return f"Published {len(published_ids)} articles and archived {len(archived_ids)} articles"
+
+
+@shared_task(name="reconcile_article_counters")
+def reconcile_article_counters(chunk_size=1000):
+    """
+    Periodic task to repair drift in the denormalized engagement counters.
+    Articles are checked in primary-key chunks, each with one UPDATE that
+    recomputes and writes back only the rows whose stored counters disagree
+    with the source tables.
+    """
+    repaired_count = 0
+    last_pkid = 0
+    while True:
+        pkids = list(
+            Article.objects.filter(pkid__gt=last_pkid)
+            .order_by("pkid")
+            .values_list("pkid", flat=True)[:chunk_size]
+        )
+        if not pkids:
+            break
+        last_pkid = pkids[-1]
+        repaired_count += Article.objects.filter(pkid__in=pkids).repair_counters()
+
+    if repaired_count:
+        bump_generation(RESPONSE_CACHE_NAMESPACE)
+    logger.info(f"Repaired counters on {repaired_count} articles")
+    return f"Repaired counters on {repaired_count} articles"
+
+
+@shared_task(name="flush_article_views")
+def flush_article_views(batch_size=1000):
+    """
+    Periodic task to drain the article view buffer filled by
+    ``ArticleViewSet.retrieve`` into the ArticleView table and the
+    unique-viewer sketches.
+    """
+    view_buffer = get_view_buffer()
+    viewer_counter = get_unique_viewer_counter()
+    recorded_count = 0
+    while True:
+        events = view_buffer.pop_batch(batch_size)
+        if not events:
+            break
+        recorded_count += ArticleView.record_views(events)
+
+        viewers_by_article = {}
+        for article_id, user_id, viewer_ip in events:
+            viewers_by_article.setdefault(article_id, []).append(
+                viewer_key(user_id, viewer_ip)
+            )
+        for article_id, viewers in viewers_by_article.items():
+            viewer_counter.add("article", article_id, viewers)
+
+    logger.info(f"Recorded {recorded_count} new article views")
+    return f"Recorded {recorded_count} new article views"
+
+
+def schedule_banner_processing(article, old_files):
+    """
+    Once the transaction commits, render the variants of the article's new
+    banner and delete the files it replaced.
+    """
+    transaction.on_commit(
+        partial(process_article_banner.delay, article.pkid, article.banner_image.name)
+    )
+    if old_files:
+        transaction.on_commit(partial(delete_stored_files.delay, old_files))
+
+
+@shared_task(name="process_article_banner")
+def process_article_banner(pkid, name):
+    """
+    Render resized, metadata-free WebP (and, where Pillow supports it, AVIF)
+    copies of an article's banner at ``BANNER_VARIANT_WIDTHS`` and record
+    them on the article. Banners replaced in the meantime are left alone.
+    """
+    article = (
+        Article.objects.filter(pkid=pkid, banner_image=name)
+        .only("pkid", "id", "banner_image")
+        .first()
+    )
+    if article is None:
+        return f"Banner {name} of article {pkid} is no longer current"
+
+    storage = article.banner_image.storage
+    try:
+        with storage.open(name) as image_file:
+            rendered = render_variants(image_file, settings.BANNER_VARIANT_WIDTHS)
+    except (OSError, UnidentifiedImageError):
+        logger.warning(f"Could not render variants of banner {name}", exc_info=True)
+        return f"Could not render variants of banner {name}"
+
+    stem = os.path.splitext(os.path.basename(name))[0]
+    variants = []
+    for width, extension, content in rendered:
+        saved_name = storage.save(
+            f"banners/{article.id}/{stem}-{width}.{extension}", ContentFile(content)
+        )
+        variants.append(
+            {"format": extension, "width": width, "name": saved_name, "size": len(content)}
+        )
+
+    # updated_at moves too, so conditional GETs stop answering 304.
+    updated = Article.objects.filter(pkid=pkid, banner_image=name).update(
+        banner_variants=variants, updated_at=timezone.now()
     )
-    
-    logger.info(f"Found {articles_to_publish.count()} articles to publish")
-    logger.info(f"Found {articles_to_archive.count()} articles to archive")
-    
-    # Publish articles that have reached their start date
-    published_count = 0
-    for article in articles_to_publish:
-        logger.info(f"Publishing article: {article.title}")
-        logger.info(f"  - Start date: {article.start_date}")
-        logger.info(f"  - Current time: {now}")
-        article.status = Article.Status.PUBLISHED
-        article.save()
-        published_count += 1
-    
-    # Archive articles that have passed their end date
-    archived_count = 0
-    for article in articles_to_archive:
-        logger.info(f"Archiving article: {article.title}")
-        logger.info(f"  - End date: {article.end_date}")
-        logger.info(f"  - Current time: {now}")
-        article.status = Article.Status.ARCHIVED
-        article.save()
-        archived_count += 1
-    
-    logger.info(f"Published {published_count} articles")
-    logger.info(f"Archived {archived_count} articles")
-    return f"Published {published_count} articles and archived {archived_count} articles" 
\ No newline at end of file
+    if not updated:
+        delete_stored_files([variant["name"] for variant in variants])
+        return f"Banner {name} of article {pkid} was replaced while rendering"
+    bump_generation(RESPONSE_CACHE_NAMESPACE)
+    return f"Rendered {len(variants)} variants of banner {name}"
@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+import factory
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from faker import Factory as FakerFactory
+
+from core_apps.articles.models import Article
+
+faker = FakerFactory.create()
+
+User = get_user_model()
+
+
+class AuthorFactory(factory.django.DjangoModelFactory):
+    """Unlike ``UserFactory`` this keeps signals on, so a profile is created."""
+
+    class Meta:
+        model = User
+
+    email = factory.Sequence(lambda n: f"author{n}@example.com")
+    password = "testpass123"
+
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        return cls._get_manager(model_class).create_user(*args, **kwargs)
+
+
+class ArticleFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Article
+
+    author = factory.SubFactory(AuthorFactory)
+    title = factory.LazyAttribute(lambda x: faker.sentence(nb_words=5))
+    description = factory.LazyAttribute(lambda x: faker.sentence(nb_words=10))
+    body = factory.LazyAttribute(lambda x: faker.paragraph(nb_sentences=8))
+    status = Article.Status.PUBLISHED
+    start_date = factory.LazyFunction(lambda: timezone.now() - timedelta(days=1))
@@ -0,0 +1,192 @@
+import io
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from core_apps.articles.models import Article
+from core_apps.articles.serializers import ArticleListSerializer, ArticleSerializer
+from core_apps.articles.tasks import process_article_banner
+
+from .factories import ArticleFactory, AuthorFactory
+
+
+def png(width, height):
+    buffer = io.BytesIO()
+    image = Image.new("RGB", (width, height), "red")
+    exif = Image.Exif()
+    exif[0x010F] = "Camera maker"
+    image.save(buffer, format="PNG", exif=exif)
+    return ContentFile(buffer.getvalue(), name="banner.png")
+
+
+@override_settings(
+    ELASTICSEARCH_DSL_AUTOSYNC=False,
+    BANNER_VARIANT_WIDTHS=[320, 640, 1280],
+    BANNER_LIST_WIDTH=400,
+)
+class BannerVariantTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.article = ArticleFactory()
+        self.article.banner_image.save("banner.png", png(1000, 500))
+
+    def process(self):
+        process_article_banner(self.article.pkid, self.article.banner_image.name)
+        self.article.refresh_from_db()
+
+    def test_renders_stripped_webp_variants_below_the_original_width(self):
+        self.process()
+        webp = [v for v in self.article.banner_variants if v["format"] == "webp"]
+        self.assertEqual([variant["width"] for variant in webp], [320, 640])
+        with default_storage.open(webp[0]["name"]) as variant_file:
+            with Image.open(variant_file) as image:
+                self.assertEqual(image.format, "WEBP")
+                self.assertEqual(image.size, (320, 160))
+                self.assertFalse(image.getexif())
+        self.assertTrue(default_storage.exists(self.article.banner_image.name))
+
+    def test_rendering_moves_updated_at(self):
+        updated_at = self.article.updated_at
+        self.process()
+        self.assertGreater(self.article.updated_at, updated_at)
+
+    def test_replaced_banner_is_left_alone(self):
+        name = self.article.banner_image.name
+        Article.objects.filter(pkid=self.article.pkid).update(banner_image="other.png")
+        process_article_banner(self.article.pkid, name)
+        self.assertEqual(Article.objects.get(pkid=self.article.pkid).banner_variants, [])
+
+    def test_list_serializer_picks_the_smallest_suitable_variant(self):
+        self.assertTrue(
+            ArticleListSerializer(self.article).data["banner_image"].endswith(".png")
+        )
+        self.process()
+        request = Request(APIRequestFactory().get("/"))
+        data = ArticleListSerializer(self.article, context={"request": request}).data
+        self.assertRegex(data["banner_image"], r"-640\.webp$")
+        self.assertNotIn("banner_variants", data)
+
+        variants = ArticleSerializer(self.article).data["banner_variants"]
+        self.assertIn({"url": data["banner_image"], "width": 640, "format": "webp"}, variants)
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class BannerDirectUploadTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.client = APIClient()
+        self.author = AuthorFactory()
+        self.client.force_authenticate(self.author)
+        self.article = ArticleFactory(author=self.author)
+
+    def url(self, name, article=None):
+        return reverse(name, kwargs={"slug": (article or self.article).slug})
+
+    def issue(self, article=None):
+        return self.client.post(
+            self.url("article-banner-upload", article),
+            {"filename": "Holiday.PNG"},
+            format="json",
+        )
+
+    def complete(self, ticket):
+        return self.client.post(
+            self.url("article-banner-upload-complete"), {"ticket": ticket}, format="json"
+        )
+
+    def test_upload_goes_to_storage_and_is_attached(self):
+        response = self.issue()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        ticket, upload = response.data["ticket"], response.data["upload"]
+        self.assertEqual(upload["method"], "PUT")
+
+        # Completing before the file has arrived is refused.
+        self.assertEqual(self.complete(ticket).status_code, status.HTTP_400_BAD_REQUEST)
+
+        content = png(200, 100).read()
+        put = Client().put(upload["url"], content, content_type="image/png")
+        self.assertEqual(put.status_code, status.HTTP_201_CREATED)
+        again = Client().put(upload["url"], content, content_type="image/png")
+        self.assertEqual(again.status_code, status.HTTP_409_CONFLICT)
+
+        with mock.patch.object(
+            process_article_banner, "delay"
+        ) as process, self.captureOnCommitCallbacks(execute=True):
+            response = self.complete(ticket)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.article.refresh_from_db()
+        name = self.article.banner_image.name
+        self.assertRegex(name, rf"^banners/{self.article.id}/\w+\.png$")
+        with default_storage.open(name) as saved:
+            self.assertEqual(saved.read(), content)
+        process.assert_called_once_with(self.article.pkid, name)
+
+    def test_racing_upload_is_refused_and_discarded(self):
+        upload = self.issue().data["upload"]
+        first = png(200, 100).read()
+        self.assertEqual(
+            Client().put(upload["url"], first, content_type="image/png").status_code,
+            status.HTTP_201_CREATED,
+        )
+        # A PUT that got past the claim, e.g. after it expired, and raced
+        # the first one: the storage would save it under another name.
+        cache.clear()
+        real_exists = default_storage.exists
+        checks = iter([False, False])
+        with mock.patch.object(
+            default_storage,
+            "exists",
+            side_effect=lambda name: next(checks, None) or real_exists(name),
+        ):
+            put = Client().put(
+                upload["url"], png(300, 100).read(), content_type="image/png"
+            )
+        self.assertEqual(put.status_code, status.HTTP_409_CONFLICT)
+        _, files = default_storage.listdir(f"banners/{self.article.id}")
+        self.assertEqual(len(files), 1)
+        with default_storage.open(f"banners/{self.article.id}/{files[0]}") as saved:
+            self.assertEqual(saved.read(), first)
+
+    def test_tickets_are_bound_to_their_article(self):
+        other = ArticleFactory(author=self.author)
+        ticket = self.issue(other).data["ticket"]
+        response = self.complete(ticket)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.complete(ticket + "x").status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_only_the_author_may_upload(self):
+        self.assertEqual(
+            self.issue(ArticleFactory()).status_code, status.HTTP_403_FORBIDDEN
+        )
+
+    def test_rejects_bad_signatures_and_types(self):
+        response = self.client.post(
+            self.url("article-banner-upload"), {"filename": "run.exe"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        put = Client().put(
+            reverse("direct-upload", kwargs={"token": "forged"}),
+            b"data",
+            content_type="image/png",
+        )
+        self.assertEqual(put.status_code, status.HTTP_403_FORBIDDEN)
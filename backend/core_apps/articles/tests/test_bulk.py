@@ -0,0 +1,129 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core_apps.article_search.tasks import reindex_articles_task
+from core_apps.articles.models import Article, ArticleCategory
+
+from .factories import ArticleFactory, AuthorFactory
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class ArticleBulkTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = AuthorFactory()
+        self.client.force_authenticate(self.author)
+        self.category = ArticleCategory.objects.create(name="Deals")
+
+    def new_article(self, n, **fields):
+        return {
+            "title": f"Weekly deal {n}",
+            "description": "Short description",
+            "body": "word " * 500,
+            **fields,
+        }
+
+    def post(self, articles):
+        return self.client.post(
+            reverse("article-bulk"), {"articles": articles}, format="json"
+        )
+
+    def test_creates_articles_with_tags_and_categories(self):
+        with mock.patch.object(reindex_articles_task, "delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.post(
+                    [
+                        self.new_article(
+                            1, tags=["Sale", "deal"], category_id=str(self.category.id)
+                        ),
+                        self.new_article(2, tags=["deal"]),
+                    ]
+                )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        first, second = (
+            Article.objects.get(slug=slug) for slug in response.data["created"]
+        )
+        self.assertEqual(first.author, self.author)
+        self.assertEqual(first.category, self.category)
+        self.assertEqual(first.tag_names, ["deal", "sale"])
+        self.assertEqual(sorted(first.tags.names()), ["Sale", "deal"])
+        self.assertEqual(list(second.tags.names()), ["deal"])
+        self.assertEqual(first.reading_time, 3)
+        delay.assert_called_once_with([first.pkid, second.pkid])
+
+    def test_slugs_are_unique_across_the_batch(self):
+        ArticleFactory(title="Same title")
+        response = self.post(
+            [self.new_article(1, title="Same title") for _ in range(3)]
+        )
+        self.assertEqual(
+            response.data["created"],
+            ["same-title-2", "same-title-3", "same-title-4"],
+        )
+
+    def test_reservation_covers_a_single_save(self):
+        article = ArticleFactory.build(title="Reserved title", author=self.author)
+        Article._meta.get_field("slug").reserve([article])
+        article.save()
+        self.assertEqual(article.slug, "reserved-title")
+
+        article.title = "Renamed title"
+        article.save()
+        self.assertEqual(article.slug, "renamed-title")
+
+    def test_updates_own_articles(self):
+        article = ArticleFactory(author=self.author, title="Old title")
+        article.tags.add("old")
+        response = self.post(
+            [{"slug": article.slug, "description": "New description", "tags": ["new"]}]
+        )
+        self.assertEqual(response.data["updated"], [article.slug])
+        article.refresh_from_db()
+        self.assertEqual(article.description, "New description")
+        self.assertEqual(article.slug, "old-title")
+        self.assertEqual(article.tag_names, ["new"])
+        self.assertEqual(list(article.tags.names()), ["new"])
+
+    def test_cannot_update_others_articles(self):
+        article = ArticleFactory()
+        response = self.post([{"slug": article.slug, "title": "Mine now"}])
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertNotEqual(Article.objects.get(pk=article.pk).title, "Mine now")
+
+    def test_batch_is_validated_as_a_whole(self):
+        unknown = "00000000-0000-0000-0000-000000000000"
+        response = self.post(
+            [
+                self.new_article(1),
+                {"title": "No body"},
+                {"slug": "missing", "title": "Gone"},
+                self.new_article(2, category_id=unknown),
+            ]
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Article.objects.exists())
+
+        response = self.post([{"slug": "missing"}, self.new_article(2, category_id=unknown)])
+        errors = response.data["articles"]
+        self.assertIn("slug", errors[0])
+        self.assertIn("category_id", errors[1])
+
+    def test_query_count_does_not_grow_with_the_batch(self):
+        def queries(start, stop):
+            with CaptureQueriesContext(connection) as context:
+                response = self.post(
+                    [
+                        self.new_article(n, tags=[f"tag{n}", "shared"])
+                        for n in range(start, stop)
+                    ]
+                )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            return len(context)
+
+        self.assertEqual(queries(0, 2), queries(100, 120))
@@ -0,0 +1,62 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core_apps.articles.models import Clap
+from core_apps.articles.view_buffer import get_view_buffer
+
+from .factories import ArticleFactory, AuthorFactory
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class ArticleResponseCacheTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.article = ArticleFactory()
+
+    def published(self):
+        return self.client.get(reverse("article-published"))
+
+    def retrieve(self):
+        return self.client.get(
+            reverse("article-detail", kwargs={"slug": self.article.slug}),
+            REMOTE_ADDR="10.0.0.1",
+        )
+
+    def test_published_list_is_served_from_cache(self):
+        self.published()
+        with self.assertNumQueries(0):
+            response = self.published()
+        self.assertEqual(len(response.json()["article"]["results"]), 1)
+
+    def test_engagement_invalidates_cached_responses(self):
+        self.published()
+        self.retrieve()
+
+        Clap.objects.create(user=AuthorFactory(), article=self.article)
+
+        results = self.published().json()["article"]["results"]
+        self.assertEqual(results[0]["claps_count"], 1)
+        self.assertEqual(self.retrieve().data["claps_count"], 1)
+
+    def test_new_article_invalidates_published_list(self):
+        self.published()
+        ArticleFactory()
+        self.assertEqual(len(self.published().json()["article"]["results"]), 2)
+
+    def test_cached_retrieve_still_records_view(self):
+        self.retrieve()
+        # Only the conditional GET validator lookup.
+        with self.assertNumQueries(1):
+            response = self.retrieve()
+        self.assertEqual(response.data["slug"], self.article.slug)
+        self.assertEqual(
+            get_view_buffer().pop_batch(10),
+            [(self.article.pkid, None, "10.0.0.1")] * 2,
+        )
+
+    def test_missing_article_is_not_cached(self):
+        response = self.client.get(
+            reverse("article-detail", kwargs={"slug": "missing"})
+        )
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,96 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core_apps.articles.filters import ArticleFilter
+from core_apps.articles.models import Article, ArticleCategory
+from core_apps.articles.serializers import ArticleCategorySerializer
+
+from .factories import ArticleFactory
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class CategoryTreeTest(TestCase):
+    def setUp(self):
+        self.electronics = ArticleCategory.objects.create(name="Electronics")
+        self.phones = ArticleCategory.objects.create(
+            name="Phones", parent=self.electronics
+        )
+        self.android = ArticleCategory.objects.create(name="Android", parent=self.phones)
+        self.home = ArticleCategory.objects.create(name="Home")
+
+    def refreshed(self, *categories):
+        for category in categories:
+            category.refresh_from_db()
+
+    def test_paths_follow_parents(self):
+        self.assertEqual(self.electronics.path, f"{self.electronics.pk}/")
+        self.assertEqual(
+            self.android.path,
+            f"{self.electronics.pk}/{self.phones.pk}/{self.android.pk}/",
+        )
+        self.assertEqual(self.android.depth, 2)
+
+    def test_moving_rewrites_the_subtree(self):
+        self.phones.parent = self.home
+        with self.assertNumQueries(6):
+            # savepoint, slug check, save, parent lookup, subtree UPDATE, release
+            self.phones.save()
+        self.refreshed(self.android)
+        self.assertEqual(
+            self.android.path, f"{self.home.pk}/{self.phones.pk}/{self.android.pk}/"
+        )
+
+        self.phones.parent = None
+        self.phones.save()
+        self.refreshed(self.android)
+        self.assertEqual(self.android.path, f"{self.phones.pk}/{self.android.pk}/")
+        self.assertEqual(self.android.depth, 1)
+
+    def test_cannot_move_under_a_descendant(self):
+        serializer = ArticleCategorySerializer(
+            self.electronics, data={"parent": self.android.pk}, partial=True
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("parent", serializer.errors)
+
+        self.electronics.parent = self.android
+        with self.assertRaises(ValueError):
+            self.electronics.save()
+
+    def test_category_slug_includes_subcategories(self):
+        in_android = ArticleFactory(category=self.android)
+        in_electronics = ArticleFactory(category=self.electronics)
+        ArticleFactory(category=self.home)
+
+        def slugs(category_slug):
+            queryset = ArticleFilter(
+                {"category_slug": category_slug}, Article.objects.all()
+            ).qs
+            return sorted(queryset.values_list("slug", flat=True))
+
+        self.assertEqual(
+            slugs(self.electronics.slug), sorted([in_android.slug, in_electronics.slug])
+        )
+        self.assertEqual(slugs(self.phones.slug), [in_android.slug])
+        self.assertEqual(slugs("missing"), [])
+
+    def test_tree_endpoint_is_cached_until_a_category_changes(self):
+        client = APIClient()
+        response = client.get(reverse("article-category-tree"))
+        electronics, home = response.data
+        self.assertEqual(home["slug"], self.home.slug)
+        self.assertEqual(electronics["children"][0]["slug"], self.phones.slug)
+        self.assertEqual(
+            electronics["children"][0]["children"][0]["name"], "Android"
+        )
+
+        with self.assertNumQueries(0):
+            client.get(reverse("article-category-tree"))
+
+        self.android.name = "Android Phones"
+        self.android.save()
+        response = client.get(reverse("article-category-tree"))
+        self.assertEqual(
+            response.data[0]["children"][0]["children"][0]["name"], "Android Phones"
+        )
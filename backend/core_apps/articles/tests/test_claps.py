@@ -0,0 +1,96 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core_apps.articles.models import Article, Clap
+
+from .factories import ArticleFactory, AuthorFactory
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class ClapToggleTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.reader = AuthorFactory()
+        self.client.force_authenticate(self.reader)
+        self.article = ArticleFactory()
+
+    def clap_url(self, slug=None):
+        return reverse("article-clap", kwargs={"slug": slug or self.article.slug})
+
+    def claps_count(self):
+        return Article.objects.values_list("claps_count", flat=True).get(
+            pk=self.article.pk
+        )
+
+    def test_clap_is_one_statement_plus_counter(self):
+        # savepoint, INSERT ... ON CONFLICT ... RETURNING, counter UPDATE, release
+        with self.assertNumQueries(4):
+            response = self.client.post(self.clap_url())
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.claps_count(), 1)
+        self.assertTrue(Clap.objects.filter(user=self.reader, article=self.article).exists())
+
+    def test_second_clap_is_rejected_without_counting(self):
+        self.client.post(self.clap_url())
+        response = self.client.post(self.clap_url())
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.claps_count(), 1)
+
+    def test_unknown_article(self):
+        self.assertEqual(
+            self.client.post(self.clap_url("missing")).status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+        self.assertEqual(
+            self.client.delete(self.clap_url("missing")).status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+
+    def test_unclap(self):
+        self.client.post(self.clap_url())
+        response = self.client.delete(self.clap_url())
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.claps_count(), 0)
+        self.assertFalse(Clap.objects.exists())
+
+        response = self.client.delete(self.clap_url())
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.claps_count(), 0)
+
+    def test_batch_state(self):
+        other = ArticleFactory()
+        self.client.post(self.clap_url())
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("article-claps"),
+                {"slugs": f"{self.article.slug},{other.slug},missing"},
+            )
+        self.assertEqual(
+            response.data,
+            {
+                self.article.slug: {"clapped": True, "claps_count": 1},
+                other.slug: {"clapped": False, "claps_count": 0},
+            },
+        )
+
+        response = self.client.post(
+            reverse("article-claps"),
+            {"clap": [other.slug], "unclap": [self.article.slug]},
+            format="json",
+        )
+        self.assertEqual(
+            response.data,
+            {
+                other.slug: {"clapped": True, "claps_count": 1},
+                self.article.slug: {"clapped": False, "claps_count": 0},
+            },
+        )
+
+    def test_batch_state_requires_slugs(self):
+        for params in ({}, {"slugs": ""}, {"slugs": ","}):
+            response = self.client.get(reverse("article-claps"), params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("slugs", response.data)
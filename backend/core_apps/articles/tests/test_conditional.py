@@ -0,0 +1,109 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from core_apps.article_responses.models import ArticleResponse
+from core_apps.articles.models import Article, Clap
+from core_apps.articles.tasks import flush_article_views
+from core_apps.articles.view_buffer import get_view_buffer
+
+from .factories import ArticleFactory, AuthorFactory
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class ArticleConditionalGetTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.article = ArticleFactory()
+        self.url = reverse("article-detail", kwargs={"slug": self.article.slug})
+
+    def test_validators_are_sent(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertEqual(
+            response["Last-Modified"],
+            http_date(int(self.article.updated_at.timestamp())),
+        )
+
+    def test_matching_etag_skips_serialization(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        # Only the validator lookup; the view is still buffered.
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(len(get_view_buffer().pop_batch(10)), 2)
+
+    def test_if_modified_since(self):
+        last_modified = self.client.get(self.url)["Last-Modified"]
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_counter_change_invalidates_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        Clap.objects.create(user=AuthorFactory(), article=self.article)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["claps_count"], 1)
+
+    def assertStale(self, etag, **params):
+        response = self.client.get(self.url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        return response
+
+    def test_changes_outside_the_article_row_invalidate_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.article.tags.add("django")
+        etag = self.assertStale(etag)["ETag"]
+
+        Article.objects.filter(pkid=self.article.pkid).update(
+            banner_variants=[{"name": "b-640.webp", "width": 640, "format": "webp"}]
+        )
+        etag = self.assertStale(etag)["ETag"]
+
+        profile = self.article.author.profile
+        profile.about_me = "Changed"
+        profile.save()
+        self.assertStale(etag)
+
+    def test_expanded_response_edit_invalidates_etag(self):
+        response = ArticleResponse.objects.create(
+            user=AuthorFactory(), article=self.article, content="First"
+        )
+        etag = self.client.get(self.url, {"expand": "article_responses"})["ETag"]
+        response.content = "Edited"
+        response.save()
+        data = self.assertStale(etag, expand="article_responses").data
+        self.assertEqual(data["article_responses"][0]["content"], "Edited")
+
+    def test_flushed_views_refresh_the_cached_body(self):
+        response = self.client.get(self.url, REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(response.data["views"], 0)
+        flush_article_views()
+
+        response = self.client.get(
+            self.url, REMOTE_ADDR="10.0.0.1", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["views"], 1)
+        flush_article_views()
+
+        # The same viewer again: nothing new, so the body is still current.
+        response = self.client.get(
+            self.url, REMOTE_ADDR="10.0.0.1", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_missing_article(self):
+        response = self.client.get(
+            reverse("article-detail", kwargs={"slug": "missing"}),
+            HTTP_IF_NONE_MATCH='"stale"',
+        )
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,80 @@
+from django.test import TestCase, override_settings
+
+from core_apps.article_bookmarks.models import Bookmark
+from core_apps.article_ratings.models import Rating
+from core_apps.article_responses.models import ArticleResponse
+from core_apps.articles.models import Article, ArticleView, Clap
+from core_apps.articles.tasks import reconcile_article_counters
+
+from .factories import ArticleFactory, AuthorFactory
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class ArticleCounterTest(TestCase):
+    def setUp(self):
+        self.article = ArticleFactory()
+        self.reader = AuthorFactory()
+
+    def assertCounters(self, **expected):
+        self.article.refresh_from_db()
+        for field, value in expected.items():
+            self.assertEqual(getattr(self.article, field), value, field)
+
+    def test_counters_follow_creates_and_deletes(self):
+        clap = Clap.objects.create(user=self.reader, article=self.article)
+        bookmark = Bookmark.objects.create(user=self.reader, article=self.article)
+        response = ArticleResponse.objects.create(
+            user=self.reader, article=self.article, content="Great"
+        )
+        view = ArticleView.objects.create(article=self.article, user=self.reader)
+        self.assertCounters(
+            claps_count=1, bookmarks_count=1, responses_count=1, views_count=1
+        )
+
+        for row in (clap, bookmark, response, view):
+            row.delete()
+        self.assertCounters(
+            claps_count=0, bookmarks_count=0, responses_count=0, views_count=0
+        )
+
+    def test_rating_counters(self):
+        other = AuthorFactory()
+        rating = Rating.objects.create(article=self.article, user=self.reader, rating=5)
+        Rating.objects.create(article=self.article, user=other, rating=2)
+        self.assertCounters(rating_sum=7, rating_count=2)
+        self.assertEqual(self.article.average_rating(), 3.5)
+
+        rating.rating = 3
+        rating.save()
+        self.assertCounters(rating_sum=5, rating_count=2)
+
+        rating.delete()
+        self.assertCounters(rating_sum=2, rating_count=1)
+
+    def test_decrement_never_goes_negative(self):
+        clap = Clap.objects.create(user=self.reader, article=self.article)
+        Article.objects.filter(pkid=self.article.pkid).update(claps_count=0)
+        clap.delete()
+        self.assertCounters(claps_count=0)
+
+    def test_reconcile_repairs_drift(self):
+        Clap.objects.create(user=self.reader, article=self.article)
+        Rating.objects.create(article=self.article, user=self.reader, rating=4)
+        untouched = ArticleFactory()
+        Article.objects.filter(pkid=self.article.pkid).update(
+            claps_count=10, rating_sum=0, views_count=3
+        )
+
+        result = reconcile_article_counters(chunk_size=1)
+
+        self.assertEqual(result, "Repaired counters on 1 articles")
+        self.assertCounters(claps_count=1, rating_sum=4, rating_count=1, views_count=0)
+        untouched.refresh_from_db()
+        self.assertEqual(untouched.claps_count, 0)
+
+    def test_reconcile_writes_with_one_statement_per_chunk(self):
+        Article.objects.filter(pkid=self.article.pkid).update(claps_count=5)
+        # The chunk's pkids, the conditional UPDATE, then the empty next chunk.
+        with self.assertNumQueries(3):
+            reconcile_article_counters()
+        self.assertCounters(claps_count=0)
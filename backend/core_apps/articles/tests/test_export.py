@@ -0,0 +1,55 @@
+import csv
+import io
+import json
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core_apps.articles.models import Article
+
+from .factories import ArticleFactory, AuthorFactory
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class ArticleExportTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(AuthorFactory(is_staff=True))
+        self.published = ArticleFactory.create_batch(3)
+        self.draft = ArticleFactory(status=Article.Status.DRAFT)
+
+    def export(self, **params):
+        response = self.client.get(reverse("article-export"), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_ndjson_export_applies_article_filters(self):
+        content = self.export(status="published")
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(
+            [row["slug"] for row in rows],
+            [article.slug for article in self.published],
+        )
+        self.assertNotIn("body", rows[0])
+        self.assertEqual(rows[0]["status"], "published")
+
+    def test_csv_export_with_selected_fields(self):
+        content = self.export(export_format="csv", fields="slug,body,claps_count")
+        rows = list(csv.reader(io.StringIO(content)))
+        self.assertEqual(rows[0], ["slug", "body", "claps_count"])
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[1], [self.published[0].slug, self.published[0].body, "0"])
+
+    def test_rejects_unknown_fields_and_formats(self):
+        url = reverse("article-export")
+        self.assertEqual(self.client.get(url, {"fields": "password"}).status_code, 400)
+        self.assertEqual(
+            self.client.get(url, {"export_format": "xml"}).status_code, 400
+        )
+
+    def test_staff_only(self):
+        self.client.force_authenticate(AuthorFactory())
+        response = self.client.get(reverse("article-export"))
+        self.assertEqual(response.status_code, 403)
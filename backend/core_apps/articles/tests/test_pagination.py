@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core_apps.articles.models import Article
+
+from .factories import ArticleFactory
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class ArticleKeysetPaginationTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        articles = ArticleFactory.create_batch(7)
+        # Two articles share a timestamp so the pkid tie-breaker is exercised.
+        now = timezone.now()
+        for offset, article in enumerate(articles):
+            created_at = now - timedelta(minutes=offset // 2)
+            Article.objects.filter(pkid=article.pkid).update(created_at=created_at)
+        self.expected = list(
+            Article.objects.order_by("-created_at", "-pkid").values_list(
+                "slug", flat=True
+            )
+        )
+
+    def test_walks_every_page_without_gaps_or_duplicates(self):
+        url = reverse("article-all")
+        params = {"cursor": "", "page_size": 3}
+        slugs = []
+        while url:
+            response = self.client.get(url, params)
+            page = response.json()["article"]
+            self.assertNotIn("count", page)
+            slugs.extend(article["slug"] for article in page["results"])
+            url, params = page["next"], None
+        self.assertEqual(slugs, self.expected)
+
+    def test_page_is_a_single_query(self):
+        response = self.client.get(
+            reverse("article-all"), {"cursor": "", "page_size": 3}
+        )
+        next_url = response.json()["article"]["next"]
+        # just the page: no COUNT(*), tags come from tag_names
+        with self.assertNumQueries(1):
+            response = self.client.get(next_url)
+        self.assertIsNotNone(response.json()["article"]["first"])
+
+    def test_approximate_count_is_opt_in(self):
+        response = self.client.get(
+            reverse("article-all"), {"cursor": "", "approximate_count": "true"}
+        )
+        self.assertIn("approximate_count", response.json()["article"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse("article-all"), {"cursor": "bogus"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_page_number_pagination_remains_default(self):
+        response = self.client.get(reverse("article-all"))
+        self.assertEqual(response.json()["article"]["count"], 7)
@@ -0,0 +1,97 @@
+import io
+import re
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from core_apps.articles.models import Article
+from core_apps.articles.read_time_engine import (
+    ArticleReadTimeEngine,
+    count_words_in_chunks,
+)
+
+from .factories import ArticleFactory
+
+TAGS = [f"tag{n}" for n in range(30)]
+
+SAMPLE = "Déjà vu: 50% off_today — naïve café, 東京 deals! snake_case x2 ... "
+
+
+class WordCountTest(SimpleTestCase):
+    def expected(self, text):
+        return len(re.findall(r"\w+", text))
+
+    def test_matches_findall(self):
+        for text in ("", "   ", "one", SAMPLE, SAMPLE * 5000):
+            self.assertEqual(
+                ArticleReadTimeEngine.word_count(text), self.expected(text)
+            )
+
+    def test_stream_handles_chunk_boundaries(self):
+        text = SAMPLE * 50
+        for chunk_size in (1, 3, 7, 64):
+            self.assertEqual(
+                ArticleReadTimeEngine.word_count_stream(
+                    io.StringIO(text), chunk_size=chunk_size
+                ),
+                self.expected(text),
+            )
+            # Multi-byte characters may be split between binary chunks too.
+            self.assertEqual(
+                ArticleReadTimeEngine.word_count_stream(
+                    io.BytesIO(text.encode()), chunk_size=chunk_size
+                ),
+                self.expected(text),
+            )
+
+    def test_long_run_without_separators_is_one_word(self):
+        chunks = iter(["x" * 1024] * 1000)
+        self.assertEqual(count_words_in_chunks(chunks), 1)
+        self.assertEqual(count_words_in_chunks(["ab", "", "c d", "e"]), 2)
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class ReadingTimeTest(TestCase):
+    def setUp(self):
+        # 1005 words plus the banner: 4.02 + 10s rounds up to 5 minutes.
+        self.article = ArticleFactory(
+            title="Short title", description="One two three", body="word " * 1000
+        )
+
+    def test_computed_on_save(self):
+        self.assertEqual(self.article.reading_time, 5)
+        self.article.body = "word " * 2000
+        self.article.save(update_fields=["body"])
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.reading_time, 9)
+
+    def test_unrelated_update_fields_skip_estimate(self):
+        with self.assertNumQueries(1):
+            self.article.save(update_fields=["status"])
+
+    def test_recomputed_when_tags_change(self):
+        self.article.tags.add(*TAGS)
+        self.assertEqual(self.article.reading_time, 6)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.reading_time, 6)
+
+        self.article.tags.clear()
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.reading_time, 5)
+
+    def test_estimate_many_counts_tags_in_one_query(self):
+        other = ArticleFactory(
+            title="Short title", description="One two three", body="word " * 1000
+        )
+        other.tags.add(*TAGS)
+        articles = list(Article.objects.filter(pkid__in=[self.article.pkid, other.pkid]))
+        with self.assertNumQueries(1):
+            reading_times = ArticleReadTimeEngine.estimate_many(articles)
+        self.assertEqual(reading_times, {self.article.pkid: 5, other.pkid: 6})
+
+    def test_backfill_command(self):
+        self.article.tags.add(*TAGS)
+        Article.objects.update(reading_time=0)
+        call_command("backfill_reading_time", chunk_size=1, stdout=open("/dev/null", "w"))
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.reading_time, 6)
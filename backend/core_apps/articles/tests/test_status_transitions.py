@@ -0,0 +1,197 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core_apps.article_search.documents import ArticleDocument
+from core_apps.article_search.indexing import reindex_articles
+from core_apps.articles.models import Article
+from core_apps.articles.tasks import (
+    apply_article_status_transition,
+    check_and_update_article_statuses,
+    index_article_at_start,
+)
+
+from .factories import ArticleFactory
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class StatusTransitionTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.due = ArticleFactory.create_batch(
+            3, status=Article.Status.DRAFT, start_date=now - timedelta(hours=1)
+        )
+        self.scheduled = ArticleFactory(
+            status=Article.Status.DRAFT, start_date=now + timedelta(days=1)
+        )
+        self.expired = ArticleFactory(end_date=now - timedelta(minutes=1))
+        self.live = ArticleFactory()
+
+    def statuses(self):
+        return dict(Article.objects.values_list("pkid", "status"))
+
+    def test_transitions_run_as_two_statements(self):
+        # Two UPDATE ... RETURNING, then one lookup per date for upcoming
+        # transitions to schedule and one for published articles going live.
+        with mock.patch(
+            "core_apps.articles.tasks.reindex_articles"
+        ) as reindex, self.assertNumQueries(5):
+            result = check_and_update_article_statuses()
+
+        self.assertEqual(result, "Published 3 articles and archived 1 articles")
+        statuses = self.statuses()
+        for article in self.due:
+            self.assertEqual(statuses[article.pkid], Article.Status.PUBLISHED)
+        self.assertEqual(statuses[self.scheduled.pkid], Article.Status.DRAFT)
+        self.assertEqual(statuses[self.expired.pkid], Article.Status.ARCHIVED)
+        self.assertEqual(statuses[self.live.pkid], Article.Status.PUBLISHED)
+        reindex.assert_called_once_with(
+            sorted([article.pkid for article in self.due] + [self.expired.pkid])
+        )
+
+    def test_transition_touches_updated_at_but_not_slug(self):
+        article = self.due[0]
+        check_and_update_article_statuses()
+        refreshed = Article.objects.get(pkid=article.pkid)
+        self.assertGreater(refreshed.updated_at, article.updated_at)
+        self.assertEqual(refreshed.slug, article.slug)
+
+    def test_nothing_to_do(self):
+        check_and_update_article_statuses()
+        with mock.patch("core_apps.articles.tasks.reindex_articles") as reindex:
+            result = check_and_update_article_statuses()
+        self.assertEqual(result, "Published 0 articles and archived 0 articles")
+        reindex.assert_not_called()
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+@mock.patch.object(apply_article_status_transition, "apply_async")
+class ScheduledTransitionTest(TestCase):
+    def create_draft(self, start_date):
+        with self.captureOnCommitCallbacks(execute=True):
+            return ArticleFactory(status=Article.Status.DRAFT, start_date=start_date)
+
+    def test_save_enqueues_exact_time_task(self, apply_async):
+        start_date = timezone.now() + timedelta(minutes=5)
+        article = self.create_draft(start_date)
+
+        # The default end date is decades away and left to the sweeper.
+        apply_async.assert_called_once_with(
+            args=(article.pkid, "start_date", start_date.isoformat()), eta=start_date
+        )
+
+    def test_only_transitions_from_the_current_status_are_enqueued(self, apply_async):
+        soon = timezone.now() + timedelta(minutes=5)
+        with self.captureOnCommitCallbacks(execute=True):
+            ArticleFactory(status=Article.Status.DRAFT, start_date=soon, end_date=soon)
+            ArticleFactory(start_date=timezone.now() - timedelta(hours=1))
+        self.assertEqual(
+            [call.kwargs["args"][1] for call in apply_async.call_args_list],
+            ["start_date"],
+        )
+
+    def test_dates_beyond_horizon_are_left_to_the_sweeper(self, apply_async):
+        article = self.create_draft(timezone.now() + timedelta(days=2))
+        apply_async.assert_not_called()
+
+        Article.objects.filter(pkid=article.pkid).update(
+            start_date=timezone.now() + timedelta(minutes=5)
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            check_and_update_article_statuses()
+        self.assertEqual(apply_async.call_args.kwargs["args"][:2], (article.pkid, "start_date"))
+
+    def test_task_is_idempotent_and_version_checked(self, apply_async):
+        start_date = timezone.now() - timedelta(seconds=1)
+        article = self.create_draft(start_date)
+        stale = (article.pkid, "start_date", (start_date - timedelta(hours=1)).isoformat())
+        current = (article.pkid, "start_date", start_date.isoformat())
+
+        self.assertEqual(
+            apply_article_status_transition(*stale),
+            "Applied start_date transition to 0 articles",
+        )
+        self.assertEqual(
+            apply_article_status_transition(*current),
+            "Applied start_date transition to 1 articles",
+        )
+        self.assertEqual(
+            apply_article_status_transition(*current),
+            "Applied start_date transition to 0 articles",
+        )
+        article.refresh_from_db()
+        self.assertEqual(article.status, Article.Status.PUBLISHED)
+
+    def test_early_delivery_is_requeued(self, apply_async):
+        start_date = timezone.now() + timedelta(minutes=5)
+        article = self.create_draft(start_date)
+        apply_async.reset_mock()
+
+        apply_article_status_transition(article.pkid, "start_date", start_date.isoformat())
+
+        apply_async.assert_called_once_with(
+            args=(article.pkid, "start_date", start_date.isoformat()), eta=start_date
+        )
+        article.refresh_from_db()
+        self.assertEqual(article.status, Article.Status.DRAFT)
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+@mock.patch.object(index_article_at_start, "apply_async")
+class IndexAtStartTest(TestCase):
+    def test_published_article_is_indexed_when_it_goes_live(self, apply_async):
+        start_date = timezone.now() + timedelta(minutes=5)
+        with self.captureOnCommitCallbacks(execute=True):
+            article = ArticleFactory(start_date=start_date)
+        apply_async.assert_called_once_with(
+            args=(article.pkid, "start_date", start_date.isoformat()), eta=start_date
+        )
+
+        Article.objects.filter(pkid=article.pkid).update(
+            start_date=timezone.now() - timedelta(seconds=1)
+        )
+        article.refresh_from_db()
+        with mock.patch("core_apps.articles.tasks.reindex_articles") as reindex:
+            stale = index_article_at_start(
+                article.pkid,
+                "start_date",
+                (article.start_date - timedelta(hours=1)).isoformat(),
+            )
+            index_article_at_start(
+                article.pkid, "start_date", article.start_date.isoformat()
+            )
+        self.assertIn("changed", stale)
+        reindex.assert_called_once_with([article.pkid])
+
+    def test_sweeper_schedules_published_articles_coming_into_range(self, apply_async):
+        article = ArticleFactory(start_date=timezone.now() + timedelta(days=2))
+        Article.objects.filter(pkid=article.pkid).update(
+            start_date=timezone.now() + timedelta(minutes=5)
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            check_and_update_article_statuses()
+        self.assertEqual(apply_async.call_args.kwargs["args"][:2], (article.pkid, "start_date"))
+
+
+class ReindexArticlesTest(TestCase):
+    @override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+    def setUp(self):
+        self.live = ArticleFactory()
+        self.archived = ArticleFactory(status=Article.Status.ARCHIVED)
+
+    def test_indexes_published_and_drops_the_rest(self):
+        with mock.patch.object(ArticleDocument, "update") as update:
+            reindex_articles([self.live.pkid, self.archived.pkid])
+
+        indexed, deleted = update.call_args_list
+        self.assertEqual(indexed.args[0], [self.live])
+        self.assertEqual([article.pkid for article in deleted.args[0]], [self.archived.pkid])
+        self.assertEqual(deleted.kwargs["action"], "delete")
+
+    @override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+    def test_respects_autosync(self):
+        with mock.patch.object(ArticleDocument, "update") as update:
+            self.assertEqual(reindex_articles([self.live.pkid]), 0)
+        update.assert_not_called()
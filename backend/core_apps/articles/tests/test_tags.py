@@ -0,0 +1,66 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django_elasticsearch_dsl.registries import registry
+
+from core_apps.article_search.documents import ArticleDocument
+from core_apps.articles.filters import ArticleFilter
+from core_apps.articles.models import Article
+from core_apps.articles.serializers import ArticleSerializer
+
+from .factories import ArticleFactory
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class TagNamesTest(TestCase):
+    def setUp(self):
+        self.article = ArticleFactory()
+
+    def stored(self, article):
+        return Article.objects.values_list("tag_names", flat=True).get(pk=article.pk)
+
+    def test_kept_in_sync_with_taggit(self):
+        self.article.tags.add("Sale", " deals ")
+        self.assertEqual(self.article.tag_names, ["deals", "sale"])
+        self.assertEqual(self.stored(self.article), ["deals", "sale"])
+
+        self.article.tags.remove("Sale")
+        self.assertEqual(self.stored(self.article), ["deals"])
+
+        self.article.tags.clear()
+        self.assertEqual(self.stored(self.article), [])
+
+    def test_serializers_and_documents_read_the_column(self):
+        self.article.tags.add("Deal")
+        article = Article.objects.get(pk=self.article.pk)
+        with self.assertNumQueries(0):
+            tags = ArticleSerializer().fields["tags"].get_attribute(article)
+            self.assertEqual(tags, ["deal"])
+            self.assertEqual(ArticleDocument().prepare_tags(article), ["deal"])
+
+    def test_tag_changes_reindex_with_final_tags(self):
+        indexed = []
+
+        def update(instance, **kwargs):
+            if isinstance(instance, Article):
+                indexed.append(instance.tag_names)
+
+        with mock.patch.object(registry, "update", side_effect=update):
+            self.article.tags.add("deal")
+        self.assertEqual(indexed[-1], ["deal"])
+
+    def test_filters(self):
+        both = self.article
+        both.tags.add("deal", "Sale")
+        deal_only = ArticleFactory()
+        deal_only.tags.add("Deal")
+        ArticleFactory().tags.add("other")
+
+        def slugs(**params):
+            queryset = ArticleFilter(params, Article.objects.all()).qs
+            return sorted(queryset.values_list("slug", flat=True))
+
+        self.assertEqual(slugs(tags="DEAL"), sorted([both.slug, deal_only.slug]))
+        self.assertEqual(slugs(tags_any="sale,missing"), [both.slug])
+        self.assertEqual(slugs(tags_all="deal,sale"), [both.slug])
+        self.assertEqual(slugs(tags_all="deal,missing"), [])
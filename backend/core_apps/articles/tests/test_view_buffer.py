@@ -0,0 +1,113 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core_apps.articles.models import ArticleView
+from core_apps.articles.tasks import flush_article_views
+from core_apps.articles.view_buffer import get_view_buffer
+
+from .factories import ArticleFactory, AuthorFactory
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class BufferedViewRecordingTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.article = ArticleFactory()
+        self.buffer = get_view_buffer()
+
+    def retrieve(self):
+        return self.client.get(
+            reverse("article-detail", kwargs={"slug": self.article.slug}),
+            REMOTE_ADDR="10.0.0.1",
+        )
+
+    def test_retrieve_does_not_write_views(self):
+        # validators, then article + bookmarks prefetch (responses are only
+        # embedded on ?expand=); no writes
+        with self.assertNumQueries(3):
+            self.retrieve()
+        self.assertFalse(ArticleView.objects.exists())
+
+    def test_flush_deduplicates_and_counts(self):
+        reader = AuthorFactory()
+        self.retrieve()
+        self.retrieve()
+        self.client.force_authenticate(reader)
+        self.retrieve()
+
+        result = flush_article_views()
+
+        self.assertEqual(result, "Recorded 2 new article views")
+        self.assertEqual(ArticleView.objects.count(), 2)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.views_count, 2)
+        response = self.client.get(
+            reverse("article-view-count", kwargs={"slug": self.article.slug})
+        )
+        self.assertEqual(
+            response.data,
+            {"view_count": 2, "unique_viewers": 2, "unique_viewers_today": 2},
+        )
+
+        # Views already on record are not inserted or counted twice.
+        self.retrieve()
+        self.assertEqual(flush_article_views(), "Recorded 0 new article views")
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.views_count, 2)
+
+    def test_record_views_groups_counter_updates(self):
+        other = ArticleFactory()
+        events = [
+            (self.article.pkid, None, "10.0.0.1"),
+            (self.article.pkid, None, "10.0.0.2"),
+            (other.pkid, None, "10.0.0.1"),
+        ]
+        self.assertEqual(ArticleView.record_views(events), 3)
+        self.article.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(self.article.views_count, 2)
+        self.assertEqual(other.views_count, 1)
+
+    def test_record_views_skips_deleted_articles_and_users(self):
+        gone = ArticleFactory()
+        gone_pkid = gone.pkid
+        gone.delete()
+        reader = AuthorFactory()
+        reader_pkid = reader.pkid
+        reader.delete()
+        events = [
+            (gone_pkid, None, "10.0.0.1"),
+            (self.article.pkid, reader_pkid, "10.0.0.1"),
+            (self.article.pkid, None, "10.0.0.2"),
+        ]
+        self.assertEqual(ArticleView.record_views(events), 2)
+        self.assertEqual(
+            set(ArticleView.objects.values_list("article_id", "user_id", "viewer_ip")),
+            {(self.article.pkid, None, "10.0.0.1"), (self.article.pkid, None, "10.0.0.2")},
+        )
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.views_count, 2)
+
+    def test_record_views_counts_only_rows_it_inserted(self):
+        reader = AuthorFactory()
+        events = [
+            (self.article.pkid, reader.pkid, "10.0.0.1"),
+            (self.article.pkid, reader.pkid, "10.0.0.2"),
+        ]
+        bulk_create = ArticleView.objects.bulk_create
+
+        def concurrent_flush(objs, **kwargs):
+            # Another writer records the first view after the existence check.
+            ArticleView.record_view(self.article, reader, "10.0.0.1")
+            return bulk_create(objs, **kwargs)
+
+        with mock.patch.object(
+            ArticleView.objects, "bulk_create", side_effect=concurrent_flush
+        ):
+            self.assertEqual(ArticleView.record_views(events), 1)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.views_count, 2)
+        self.assertEqual(ArticleView.objects.filter(article=self.article).count(), 2)
@@ -0,0 +1,222 @@
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django_elasticsearch_dsl.registries import registry
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core_apps.article_bookmarks.models import Bookmark
+from core_apps.article_ratings.models import Rating
+from core_apps.article_responses.models import ArticleResponse
+from core_apps.articles.models import Article, ArticleCategory, ArticleView, Clap
+from core_apps.articles.tasks import process_article_banner
+from core_apps.common.tasks import delete_stored_files
+
+from .factories import ArticleFactory, AuthorFactory
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class ArticleListQueryCountTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.category = ArticleCategory.objects.create(name="Electronics")
+        self.readers = AuthorFactory.create_batch(2)
+
+    def create_articles(self, count):
+        for article in ArticleFactory.create_batch(count, category=self.category):
+            article.tags.add("deal", "sale")
+            for reader in self.readers:
+                Clap.objects.create(user=reader, article=article)
+                Bookmark.objects.create(user=reader, article=article)
+                ArticleResponse.objects.create(
+                    user=reader, article=article, content="Nice deal"
+                )
+                ArticleView.objects.create(article=article, user=reader)
+            Rating.objects.create(article=article, user=self.readers[0], rating=4)
+            Rating.objects.create(article=article, user=self.readers[1], rating=5)
+
+    def get_published(self, **params):
+        return self.client.get(
+            reverse("article-published"), {"page_size": 30, **params}
+        )
+
+    def test_published_page_costs_constant_queries(self):
+        self.create_articles(2)
+        # count + page + bookmarks + responses prefetches
+        with self.assertNumQueries(4):
+            self.get_published(expand="bookmarks,article_responses")
+
+        self.create_articles(8)
+        with self.assertNumQueries(4):
+            response = self.get_published(expand="bookmarks,article_responses")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_compact_page_skips_nested_prefetches(self):
+        self.create_articles(4)
+        # count + page
+        with self.assertNumQueries(2):
+            self.get_published()
+
+    def test_published_page_serializes_annotated_counters(self):
+        self.create_articles(1)
+        response = self.get_published()
+
+        article = response.json()["article"]["results"][0]
+        self.assertEqual(article["views"], 2)
+        self.assertEqual(article["claps_count"], 2)
+        self.assertEqual(article["bookmarks_count"], 2)
+        self.assertEqual(article["article_responses_count"], 2)
+        self.assertEqual(article["average_rating"], 4.5)
+        self.assertEqual(sorted(article["tags"]), ["deal", "sale"])
+        self.assertEqual(article["category"]["name"], "Electronics")
+
+    def test_all_page_costs_constant_queries(self):
+        self.create_articles(3)
+        with self.assertNumQueries(2):
+            self.client.get(reverse("article-all"))
+        self.create_articles(6)
+        with self.assertNumQueries(2):
+            self.client.get(reverse("article-all"))
+
+    def test_view_count_is_single_row_lookup(self):
+        self.create_articles(1)
+        article = Article.objects.get()
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("article-view-count", kwargs={"slug": article.slug})
+            )
+        self.assertEqual(response.data["view_count"], 2)
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class ArticleFieldSelectionTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.article = ArticleFactory()
+        reader = AuthorFactory()
+        Bookmark.objects.create(user=reader, article=self.article)
+
+    def get_first_result(self, **params):
+        response = self.client.get(reverse("article-published"), params)
+        return response.json()["article"]["results"][0]
+
+    def test_list_is_compact_by_default(self):
+        article = self.get_first_result()
+        self.assertNotIn("body", article)
+        self.assertNotIn("bookmarks", article)
+        self.assertNotIn("article_responses", article)
+        self.assertEqual(article["bookmarks_count"], 1)
+
+    def test_expand_adds_nested_relations(self):
+        article = self.get_first_result(expand="body,bookmarks")
+        self.assertEqual(article["body"], self.article.body)
+        self.assertEqual(len(article["bookmarks"]), 1)
+        self.assertNotIn("article_responses", article)
+
+    def test_fields_limits_representation(self):
+        article = self.get_first_result(fields="title,slug,body")
+        self.assertEqual(set(article), {"title", "slug", "body"})
+
+    def test_detail_keeps_full_representation(self):
+        response = self.client.get(
+            reverse("article-detail", kwargs={"slug": self.article.slug})
+        )
+        article = response.json()["article"]
+        self.assertIn("body", article)
+        self.assertEqual(len(article["bookmarks"]), 1)
+
+    def test_detail_supports_fields(self):
+        response = self.client.get(
+            reverse("article-detail", kwargs={"slug": self.article.slug}),
+            {"fields": "title"},
+        )
+        self.assertEqual(response.json()["article"], {"title": self.article.title})
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class ArticleUpdateTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = AuthorFactory()
+        self.client.force_authenticate(self.author)
+        self.article = ArticleFactory(author=self.author)
+        self.article.tags.add("deal")
+        self.category = ArticleCategory.objects.create(name="Electronics")
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def patch(self, data, **kwargs):
+        return self.client.patch(
+            reverse("article-detail", kwargs={"slug": self.article.slug}),
+            data,
+            **kwargs,
+        )
+
+    def test_update_saves_once_and_indexes_once(self):
+        with mock.patch.object(registry, "update") as update, mock.patch.object(
+            Article, "save", autospec=True, side_effect=Article.save
+        ) as save:
+            # article with its prefetches (3), category, slug check, savepoint,
+            # UPDATE, tag upsert (3), tagged items (3), release, the
+            # representation's bookmarks and responses (2)
+            with self.assertNumQueries(16):
+                response = self.patch(
+                    {
+                        "title": "New title",
+                        "category_id": str(self.category.id),
+                        "tags": ["deal", "sale"],
+                    },
+                    format="json",
+                )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        save.assert_called_once()
+        indexed = [
+            call.args[0]
+            for call in update.call_args_list
+            if isinstance(call.args[0], Article)
+        ]
+        self.assertEqual(len(indexed), 1)
+        self.assertEqual(indexed[0].tag_names, ["deal", "sale"])
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.category, self.category)
+        self.assertEqual(self.article.slug, "new-title")
+        self.assertEqual(self.article.tag_names, ["deal", "sale"])
+
+    def test_banner_is_saved_with_the_update(self):
+        def upload(name):
+            return SimpleUploadedFile(name, b"GIF89a", content_type="image/gif")
+
+        self.patch({"banner_image": upload("first.gif")}, format="multipart")
+        self.article.refresh_from_db()
+        first = self.article.banner_image.name
+        self.assertTrue(default_storage.exists(first))
+
+        with mock.patch.object(
+            Article, "save", autospec=True, side_effect=Article.save
+        ) as save, mock.patch.object(
+            process_article_banner, "delay"
+        ) as process, mock.patch.object(
+            delete_stored_files, "delay"
+        ) as delete, self.captureOnCommitCallbacks(execute=True):
+            response = self.patch(
+                {"banner_image": upload("second.gif"), "title": "With a banner"},
+                format="multipart",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        save.assert_called_once()
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.title, "With a banner")
+        self.assertTrue(self.article.banner_image.name.startswith("second"))
+        # Variants are rendered and the old banner removed in the background.
+        process.assert_called_once_with(
+            self.article.pkid, self.article.banner_image.name
+        )
+        delete.assert_called_once_with([first])
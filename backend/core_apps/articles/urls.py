@@ -1,7 +1,16 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from .views import ArticleViewSet, ArticleViewCountView, ClapArticleView, ArticleCategoryViewSet
+from .views import (
+    ArticleBannerUploadView,
+    ArticleBulkView,
+    ArticleCategoryViewSet,
+    ArticleExportView,
+    ArticleViewCountView,
+    ArticleViewSet,
+    ClapArticleView,
+    ClapStateView,
+)
 
 router = DefaultRouter()
 router.register(r"article-categories", ArticleCategoryViewSet, basename="article-category")
@@ -9,16 +18,30 @@ router.register(r"", ArticleViewSet, basename="article")
 
 urlpatterns = [
     path("categories/", ArticleCategoryViewSet.as_view({"get": "list"}), name="article-categories"),
+    path("categories/tree/", ArticleCategoryViewSet.as_view({"get": "tree"}), name="article-category-tree"),
     path("all/", ArticleViewSet.as_view({"get": "all"}), name="article-all"),
     path("published/", ArticleViewSet.as_view({"get": "published"}), name="article-published"),
     path("archived/", ArticleViewSet.as_view({"get": "archived"}), name="article-archived"),
     path("draft/", ArticleViewSet.as_view({"get": "draft"}), name="article-draft"),
+    path("export/", ArticleExportView.as_view(), name="article-export"),
+    path("bulk/", ArticleBulkView.as_view(), name="article-bulk"),
+    path("claps/", ClapStateView.as_view(), name="article-claps"),
     path("", include(router.urls)),
     path(
         "<slug:slug>/view-count/",
         ArticleViewCountView.as_view(),
         name="article-view-count",
     ),
+    path(
+        "<slug:slug>/banner/upload/",
+        ArticleBannerUploadView.as_view(),
+        name="article-banner-upload",
+    ),
+    path(
+        "<slug:slug>/banner/upload/complete/",
+        ArticleBannerUploadView.as_view(complete=True),
+        name="article-banner-upload-complete",
+    ),
     path(
         "<slug:slug>/clap/",
         ClapArticleView.as_view(),
@@ -0,0 +1,61 @@
+import json
+import threading
+from collections import deque
+from functools import lru_cache
+
+import redis
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class RedisViewBuffer:
+    """Article view events queued on a Redis list, shared by all workers."""
+
+    key = "articles:view-buffer"
+
+    def __init__(self, url=None):
+        self.client = redis.Redis.from_url(
+            url or settings.ARTICLE_VIEW_BUFFER_URL, socket_timeout=1
+        )
+
+    def push(self, article_id, user_id, viewer_ip):
+        self.client.rpush(self.key, json.dumps([article_id, user_id, viewer_ip]))
+
+    def pop_batch(self, size):
+        with self.client.pipeline() as pipe:
+            pipe.lrange(self.key, 0, size - 1)
+            pipe.ltrim(self.key, size, -1)
+            events, _ = pipe.execute()
+        return [tuple(json.loads(event)) for event in events]
+
+    def clear(self):
+        self.client.delete(self.key)
+
+
+class LocMemViewBuffer:
+    """In-process buffer for tests and single-process development servers."""
+
+    def __init__(self):
+        self.events = deque()
+        self.lock = threading.Lock()
+
+    def push(self, article_id, user_id, viewer_ip):
+        with self.lock:
+            self.events.append((article_id, user_id, viewer_ip))
+
+    def pop_batch(self, size):
+        with self.lock:
+            return [self.events.popleft() for _ in range(min(size, len(self.events)))]
+
+    def clear(self):
+        with self.lock:
+            self.events.clear()
+
+
+@lru_cache(maxsize=None)
+def _load_view_buffer(backend):
+    return import_string(backend)()
+
+
+def get_view_buffer():
+    return _load_view_buffer(settings.ARTICLE_VIEW_BUFFER_BACKEND)
@@ -2,41 +2,110 @@ import logging
 from datetime import datetime
 
 from django.contrib.auth import get_user_model
-from django.core.files.storage import default_storage
 from django.http import Http404
+from django.db.models import Exists, OuterRef, Subquery
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiParameter
+from redis.exceptions import RedisError
 from rest_framework import filters, generics, permissions, status, viewsets
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from django.utils import timezone
 
+from core_apps.common.cache import get_or_build, versioned_key
+from core_apps.common.conditional import compute_etag, conditional_get
+from core_apps.common.exports import EXPORT_PARAMETERS, StreamingExportView
+from core_apps.common.pagination import KeysetPaginationMixin
+from core_apps.common.serializers import parse_field_list
+from core_apps.common.unique_viewers import get_unique_viewer_counter
+from core_apps.common.views import DirectUploadView
+
+from .bulk import bulk_save_articles
 from .filters import ArticleFilter
 from .models import Article, ArticleView, Clap, ArticleCategory
-from .pagination import ArticlePagination
+from .pagination import ArticleKeysetPagination, ArticlePagination
 from .permissions import IsOwnerOrReadOnly
 from .renderers import ArticleJSONRenderer, ArticlesJSONRenderer
-from .serializers import ArticleSerializer, ClapSerializer, ArticleCategorySerializer
+from .managers import (
+    CATEGORY_CACHE_NAMESPACE,
+    COUNTER_FIELDS,
+    NESTED_RELATIONS,
+    RESPONSE_CACHE_NAMESPACE,
+)
+from .serializers import (
+    ArticleBulkSerializer,
+    ArticleCategorySerializer,
+    ArticleListSerializer,
+    ArticleSerializer,
+    ClapBatchSerializer,
+    ClapSerializer,
+)
+from .tasks import schedule_banner_processing
+from .view_buffer import get_view_buffer
 
 User = get_user_model()
 
 logger = logging.getLogger(__name__)
 
+FIELD_SELECTION_PARAMETERS = [
+    OpenApiParameter(
+        name="fields",
+        description="Comma-separated list of fields to return",
+        required=False,
+        type=str,
+    ),
+    OpenApiParameter(
+        name="expand",
+        description="Comma-separated list of optional fields to include (body, bookmarks, article_responses)",
+        required=False,
+        type=str,
+    ),
+    OpenApiParameter(
+        name="cursor",
+        description="Switch to keyset pagination; pass an empty value for the first page, then follow `next`",
+        required=False,
+        type=str,
+    ),
+]
+
 
 @extend_schema(tags=['articles'])
-class ArticleViewSet(viewsets.ModelViewSet):
+class ArticleViewSet(KeysetPaginationMixin, viewsets.ModelViewSet):
     queryset = Article.objects.all()
     serializer_class = ArticleSerializer
     permission_classes = [permissions.AllowAny]
     pagination_class = ArticlePagination
+    keyset_pagination_class = ArticleKeysetPagination
     filter_backends = (DjangoFilterBackend, filters.OrderingFilter)
     filterset_class = ArticleFilter
-    ordering_fields = ["created_at", "updated_at"]
+    ordering_fields = [
+        "created_at",
+        "updated_at",
+        "views_count",
+        "claps_count",
+        "bookmarks_count",
+        "responses_count",
+    ]
     renderer_classes = [ArticleJSONRenderer]
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     lookup_field = "slug"
 
+    list_actions = ["list", "all", "draft", "archived", "published"]
+
+    def get_serializer_class(self):
+        if self.action in self.list_actions:
+            return ArticleListSerializer
+        return ArticleSerializer
+
+    def get_queryset(self):
+        nested = self.get_serializer_class().get_selected_fields(
+            self.request, NESTED_RELATIONS
+        )
+        return Article.objects.for_listing(nested=nested)
+
     def get_renderer_classes(self):
         if self.action == 'published':
             return [ArticlesJSONRenderer]
@@ -47,9 +116,20 @@ class ArticleViewSet(viewsets.ModelViewSet):
             return [permissions.IsAuthenticated(), IsOwnerOrReadOnly()]
         return [permissions.AllowAny()]
 
+    def get_cached_data(self, build):
+        """
+        Serialized data for this request, shared by every client asking for
+        the same URL until an article or its engagement changes.
+        """
+        key = versioned_key(
+            RESPONSE_CACHE_NAMESPACE, self.action, self.request.build_absolute_uri()
+        )
+        return get_or_build(key, build)
+
     @extend_schema(
         description="Get all articles regardless of status",
-        responses={200: ArticleSerializer(many=True)}
+        parameters=FIELD_SELECTION_PARAMETERS,
+        responses={200: ArticleListSerializer(many=True)}
     )
     def all(self, request):
         queryset = self.get_queryset()
@@ -63,7 +143,8 @@ class ArticleViewSet(viewsets.ModelViewSet):
 
     @extend_schema(
         description="Get all draft articles",
-        responses={200: ArticleSerializer(many=True)}
+        parameters=FIELD_SELECTION_PARAMETERS,
+        responses={200: ArticleListSerializer(many=True)}
     )
     def draft(self, request):
         queryset = self.get_queryset().filter(
@@ -79,7 +160,8 @@ class ArticleViewSet(viewsets.ModelViewSet):
 
     @extend_schema(
         description="Get all archived articles",
-        responses={200: ArticleSerializer(many=True)}
+        parameters=FIELD_SELECTION_PARAMETERS,
+        responses={200: ArticleListSerializer(many=True)}
     )
     def archived(self, request):
         now = timezone.now()
@@ -96,22 +178,21 @@ class ArticleViewSet(viewsets.ModelViewSet):
 
     @extend_schema(
         description="Get all published articles",
-        responses={200: ArticleSerializer(many=True)}
+        parameters=FIELD_SELECTION_PARAMETERS,
+        responses={200: ArticleListSerializer(many=True)}
     )
     def published(self, request):
-        now = timezone.now()
-        queryset = self.get_queryset().filter(
-            status=Article.Status.PUBLISHED,
-            start_date__lte=now,
-            end_date__gt=now
-        )
-        
+        return Response(self.get_cached_data(self.published_data))
+
+    def published_data(self):
+        queryset = self.get_queryset().published()
+
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            return self.get_paginated_response(serializer.data).data
         serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return serializer.data
 
     def perform_create(self, serializer):
         serializer.save(author=self.request.user)
@@ -120,31 +201,118 @@ class ArticleViewSet(viewsets.ModelViewSet):
         )
 
     def perform_update(self, serializer):
-        instance = serializer.save(author=self.request.user)
-        if "banner_image" in self.request.FILES:
-            if (
-                instance.banner_image
-                and instance.banner_image.name != "/profile_default.png"
-            ):
-                default_storage.delete(instance.banner_image.path)
-            instance.banner_image = self.request.FILES["banner_image"]
-            instance.save()
+        # The new banner is stored as uploaded along with the other fields.
+        # Its variants are rendered, and the old files deleted, by Celery
+        # once the update has committed.
+        banner_image = self.request.FILES.get("banner_image")
+        if banner_image is None:
+            serializer.save(author=self.request.user)
+            return
+        old_files = serializer.instance.stored_banner_files()
+        article = serializer.save(
+            author=self.request.user, banner_image=banner_image, banner_variants=[]
+        )
+        schedule_banner_processing(article, old_files)
 
     def retrieve(self, request, *args, **kwargs):
+        articles = Article.objects.filter(slug=kwargs[self.lookup_field])
+        fields = list(VALIDATOR_FIELDS)
+        nested = self.get_serializer_class().get_selected_fields(
+            request, NESTED_RELATIONS
+        )
+        if "article_responses" in nested:
+            # Embedded responses can be edited without touching the article.
+            responses = Article._meta.get_field("article_responses").related_model
+            articles = articles.annotate(
+                responses_updated_at=Subquery(
+                    responses.objects.filter(article=OuterRef("pk"))
+                    .order_by("-updated_at")
+                    .values("updated_at")[:1]
+                )
+            )
+            fields.append("responses_updated_at")
+        article = articles.values(*fields).first()
+        if article is None:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        self.record_view(article["pkid"])
+        return conditional_get(
+            request,
+            article_etag(article),
+            article_last_modified(article),
+            self.detail_response,
+        )
+
+    def detail_response(self):
         try:
-            instance = self.get_object()
+            return Response(self.get_cached_data(self.retrieve_data))
         except Http404:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        serializer = self.get_serializer(instance)
+    def retrieve_data(self):
+        return self.get_serializer(self.get_object()).data
 
-        viewer_ip = request.META.get("REMOTE_ADDR", None)
-        user = None if request.user.is_anonymous else request.user
-        ArticleView.record_view(
-            article=instance, user=user, viewer_ip=viewer_ip
-        )
+    def record_view(self, article_pkid):
+        viewer_ip = self.request.META.get("REMOTE_ADDR", None)
+        user = None if self.request.user.is_anonymous else self.request.user
+        try:
+            get_view_buffer().push(article_pkid, user.pkid if user else None, viewer_ip)
+        except RedisError:
+            logger.warning("View buffer unavailable, recording view synchronously")
+            ArticleView.record_view(
+                article=Article.objects.get(pkid=article_pkid),
+                user=user,
+                viewer_ip=viewer_ip,
+            )
 
-        return Response(serializer.data)
+
+# Columns an article detail is rendered from, read for its validators.
+# Celery tasks and tag receivers write some of them with update(), and the
+# author profile and category change independently of the article.
+VALIDATOR_FIELDS = (
+    "pkid",
+    "updated_at",
+    "status",
+    "start_date",
+    "end_date",
+    "tag_names",
+    "reading_time",
+    "category_id",
+    "banner_image",
+    "banner_variants",
+    "author__profile__updated_at",
+    "category__updated_at",
+    *COUNTER_FIELDS,
+)
+
+# Modification times of the rows a detail is built from, when loaded.
+MODIFIED_FIELDS = (
+    "updated_at",
+    "author__profile__updated_at",
+    "category__updated_at",
+    "responses_updated_at",
+)
+
+
+def article_etag(article):
+    """ETag of an article detail from its ``values()`` row."""
+    is_published = Article(
+        status=article["status"],
+        start_date=article["start_date"],
+        end_date=article["end_date"],
+    ).is_published
+    return compute_etag(
+        is_published,
+        *(article[field] for field in VALIDATOR_FIELDS),
+        article.get("responses_updated_at"),
+    )
+
+
+def article_last_modified(article):
+    """Latest modification time among the rows an article detail shows."""
+    return max(
+        article[field] for field in MODIFIED_FIELDS if article.get(field) is not None
+    )
 
 
 @extend_schema(tags=['articles'])
@@ -154,8 +322,142 @@ class ArticleViewCountView(generics.RetrieveAPIView):
     permission_classes = [permissions.AllowAny]
 
     def retrieve(self, request, *args, **kwargs):
-        article = self.get_object()
-        return Response({"view_count": article.view_count()})
+        article = (
+            self.get_queryset()
+            .filter(slug=kwargs.get("slug"))
+            .values("pkid", "views_count")
+            .first()
+        )
+        if article is None:
+            raise Http404
+
+        viewer_counter = get_unique_viewer_counter()
+        return Response(
+            {
+                "view_count": article["views_count"],
+                "unique_viewers": viewer_counter.count("article", article["pkid"]),
+                "unique_viewers_today": viewer_counter.count_today(
+                    "article", article["pkid"]
+                ),
+            }
+        )
+
+
+@extend_schema(
+    tags=['articles'],
+    description="Stream every article matching the list filters (staff only)",
+    parameters=EXPORT_PARAMETERS,
+    responses={200: OpenApiTypes.BINARY},
+)
+class ArticleExportView(StreamingExportView):
+    queryset = Article.objects.all()
+    filter_backends = (DjangoFilterBackend,)
+    filterset_class = ArticleFilter
+    export_name = "articles"
+    export_fields = (
+        "id",
+        "slug",
+        "title",
+        "description",
+        "body",
+        "status",
+        "category__slug",
+        "author__email",
+        "tag_names",
+        "start_date",
+        "end_date",
+        "reading_time",
+        *COUNTER_FIELDS,
+        "created_at",
+        "updated_at",
+    )
+    default_fields = tuple(field for field in export_fields if field != "body")
+
+
+@extend_schema(tags=['articles'])
+class ArticleBulkView(generics.GenericAPIView):
+    """
+    Create or update up to ``ArticleBulkSerializer.MAX_ARTICLES`` articles in
+    one request. Entries naming a ``slug`` update that article, which must
+    belong to the user; the others are created. The whole batch is validated
+    before anything is written and is saved in one transaction.
+    """
+
+    serializer_class = ArticleBulkSerializer
+    permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
+    parser_classes = [JSONParser]
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data["articles"]
+
+        slugs = [item["slug"] for item in items if "slug" in item]
+        articles = Article.objects.select_related("author").in_bulk(
+            slugs, field_name="slug"
+        )
+        for article in articles.values():
+            self.check_object_permissions(request, article)
+        category_ids = {item["category_id"] for item in items if item.get("category_id")}
+        categories = ArticleCategory.objects.in_bulk(category_ids, field_name="id")
+
+        entries, errors = [], []
+        seen_slugs = set()
+        for item in items:
+            data = dict(item)
+            slug = data.pop("slug", None)
+            article = articles.get(slug)
+            error = {}
+            if slug is not None:
+                if article is None:
+                    error["slug"] = ["No article with this slug."]
+                elif slug in seen_slugs:
+                    error["slug"] = ["This article appears more than once."]
+                seen_slugs.add(slug)
+            if "category_id" in data:
+                category_id = data.pop("category_id")
+                if category_id and category_id not in categories:
+                    error["category_id"] = ["No category with this id."]
+                data["category"] = categories.get(category_id)
+            if article is not None:
+                start_date = data.get("start_date", article.start_date)
+                if start_date >= data.get("end_date", article.end_date):
+                    error["end_date"] = ["End date must be after start date"]
+            errors.append(error)
+            entries.append((article, data))
+        if any(errors):
+            raise ValidationError({"articles": errors})
+
+        created, updated = bulk_save_articles(request.user, entries)
+        logger.info(
+            f"{len(created)} articles created and {len(updated)} updated "
+            f"in bulk by {request.user.profile.username}"
+        )
+        return Response(
+            {
+                "created": [article.slug for article in created],
+                "updated": [article.slug for article in updated],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+@extend_schema(tags=['articles'])
+class ArticleBannerUploadView(DirectUploadView):
+    """Upload an article's banner straight to storage; see DirectUploadView."""
+
+    upload_target = "banner"
+    queryset = Article.objects.all()
+    lookup_field = "slug"
+    permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
+
+    def attach(self, article, name):
+        old_files = article.stored_banner_files()
+        article.banner_image = name
+        article.banner_variants = []
+        article.save(update_fields=["banner_image", "banner_variants", "updated_at"])
+        schedule_banner_processing(article, old_files)
+        return {"banner_image": article.banner_image.url}
 
 
 @extend_schema(tags=['articles'])
@@ -166,39 +468,87 @@ class ClapArticleView(generics.CreateAPIView, generics.DestroyAPIView):
     lookup_field = "slug"
 
     def create(self, request, *args, **kwargs):
-        user = request.user
         article_slug = kwargs.get("slug")
-        article = get_object_or_404(Article, slug=article_slug)
-
-        if Clap.objects.filter(user=user, article=article).exists():
+        if not Clap.objects.clap(request.user, [article_slug]):
+            get_object_or_404(Article, slug=article_slug)
             return Response(
                 {"detail": "You have already clapped on this article."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        clap = Clap.objects.create(user=user, article=article)
-        clap.save()
         return Response(
             {"detail": "Clap added to article"}, status=status.HTTP_201_CREATED
         )
 
     def delete(self, request, *args, **kwargs):
-        user = request.user
-        article_slug = kwargs.get("slug")
-        article = get_object_or_404(Article, slug=article_slug)
-
-        clap = get_object_or_404(Clap, user=user, article=article)
-        clap.delete()
+        if not Clap.objects.unclap(request.user, [kwargs.get("slug")]):
+            raise Http404
         return Response(
             {"detail": "Clap removed from article"}, status=status.HTTP_204_NO_CONTENT
         )
 
 
+@extend_schema(tags=['articles'])
+class ClapStateView(generics.GenericAPIView):
+    """
+    Clap state of many articles at once, for hydrating feeds: ``GET
+    ?slugs=a,b`` reads it, ``POST {"clap": [...], "unclap": [...]}`` applies
+    changes first. Either way the response maps each slug to whether the
+    user clapped it and its clap count; unknown slugs are left out.
+    """
+
+    serializer_class = ClapBatchSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="slugs",
+                description="Comma-separated article slugs",
+                required=True,
+                type=str,
+            )
+        ]
+    )
+    def get(self, request):
+        serializer = self.get_serializer(
+            data={"slugs": sorted(parse_field_list(request, "slugs"))}
+        )
+        serializer.is_valid(raise_exception=True)
+        return Response(self.clap_state(serializer.validated_data["slugs"]))
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        clap = serializer.validated_data.get("clap", [])
+        unclap = serializer.validated_data.get("unclap", [])
+        Clap.objects.clap(request.user, clap)
+        Clap.objects.unclap(request.user, unclap)
+        return Response(self.clap_state([*clap, *unclap]))
+
+    def clap_state(self, slugs):
+        rows = (
+            Article.objects.filter(slug__in=slugs)
+            .annotate(
+                clapped=Exists(
+                    Clap.objects.filter(user=self.request.user, article=OuterRef("pk"))
+                )
+            )
+            .order_by()
+            .values_list("slug", "clapped", "claps_count")
+        )
+        return {
+            slug: {"clapped": clapped, "claps_count": claps_count}
+            for slug, clapped, claps_count in rows
+        }
+
+
 @extend_schema(tags=['articles'])
 class ArticleCategoryViewSet(viewsets.ModelViewSet):
     queryset = ArticleCategory.objects.all()
     serializer_class = ArticleCategorySerializer
     permission_classes = [permissions.AllowAny]
     lookup_field = "slug"
+    tree_fields = ("id", "name", "slug", "description", "sequence", "depth")
 
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
@@ -210,8 +560,19 @@ class ArticleCategoryViewSet(viewsets.ModelViewSet):
         parent = self.request.query_params.get("parent", None)
         if parent is not None:
             queryset = queryset.filter(parent_id=parent)
+        within = self.request.query_params.get("within", None)
+        if within is not None:
+            queryset = queryset.filter(ArticleCategory.subtree_q(within))
         return queryset
 
+    @extend_schema(description="The whole category tree, for navigation menus")
+    def tree(self, request):
+        tree = get_or_build(
+            versioned_key(CATEGORY_CACHE_NAMESPACE, "tree"),
+            lambda: ArticleCategory.build_tree(self.tree_fields),
+        )
+        return Response(tree)
+
     def perform_create(self, serializer):
         serializer.save()
 
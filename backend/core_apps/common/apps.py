@@ -6,3 +6,8 @@ class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core_apps.common"
     verbose_name = _("Common")
+
+    def ready(self):
+        from .trigram import register_lookups
+
+        register_lookups()
@@ -0,0 +1,73 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+GENERATION_KEY = "cache-generation:{namespace}"
+
+
+def get_generation(namespace):
+    """Current generation of ``namespace``; cached responses embed it in their keys."""
+    key = GENERATION_KEY.format(namespace=namespace)
+    generation = cache.get(key)
+    if generation is None:
+        # Seed from the clock so a counter lost to eviction or a restart never
+        # comes back at a value whose responses may still be cached.
+        cache.add(key, time.time_ns() // 1000, None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(namespace):
+    """Invalidate every response cached under ``namespace``."""
+    key = GENERATION_KEY.format(namespace=namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        return get_generation(namespace)
+
+
+def versioned_key(namespace, *parts):
+    digest = hashlib.md5(
+        "|".join(str(part) for part in parts).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f"response:{namespace}:{get_generation(namespace)}:{digest}"
+
+
+def get_or_build(key, build, timeout=None, lock_timeout=10, poll_interval=0.05):
+    """
+    Return the value cached at ``key``, calling ``build`` on a miss.
+
+    Only one caller rebuilds a missing key at a time: the others wait for its
+    result for up to ``lock_timeout`` seconds before building it themselves,
+    so a burst of requests after an invalidation costs a single rebuild.
+    """
+    if timeout is None:
+        timeout = settings.RESPONSE_CACHE_TIMEOUT
+
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, 1, lock_timeout):
+        try:
+            value = build()
+            cache.set(key, value, timeout)
+            return value
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        value = cache.get(key)
+        if value is not None:
+            return value
+        if cache.get(lock_key) is None:
+            # The rebuild failed; don't wait out the full timeout.
+            break
+    value = build()
+    cache.set(key, value, timeout)
+    return value
@@ -0,0 +1,34 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def compute_etag(*parts):
+    """Strong ETag over the values a representation is derived from."""
+    digest = hashlib.md5(
+        "|".join(str(part) for part in parts).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def conditional_get(request, etag, last_modified, respond):
+    """
+    Answer ``If-None-Match``/``If-Modified-Since`` with a 304 when the
+    validators still match, calling ``respond`` to build the full response
+    only otherwise. Either way the validators are sent back to the client.
+
+    ``If-None-Match`` takes precedence over ``If-Modified-Since``, so the
+    ETag should also cover data that does not move ``last_modified``.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(
+        request, etag=etag, last_modified=timestamp
+    )
+    if response is None:
+        response = respond()
+    if response.status_code in (200, 304):
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+    return response
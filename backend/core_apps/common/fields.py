@@ -0,0 +1,65 @@
+from collections import Counter
+from functools import reduce
+from operator import or_
+
+from autoslug import AutoSlugField
+from autoslug.utils import crop_slug, get_prepopulated_value
+from django.db.models import Q
+
+
+class BulkAutoSlugField(AutoSlugField):
+    """
+    ``AutoSlugField`` whose slugs can be assigned for a whole batch up front.
+
+    autoslug checks uniqueness with a query per row as it saves, and cannot
+    see the other rows of a ``bulk_create()`` batch. :meth:`reserve` picks
+    unique slugs for every instance in a couple of queries instead and marks
+    them so ``pre_save`` keeps them.
+    """
+
+    def pre_save(self, instance, add):
+        if getattr(instance, "_slug_reserved", False):
+            # The reservation covers one save; later saves slug as usual.
+            instance._slug_reserved = False
+            return self.value_from_object(instance)
+        return super().pre_save(instance, add)
+
+    def base_slug(self, instance):
+        slug = self.slugify(get_prepopulated_value(self, instance) or "")
+        if not slug:
+            return instance._meta.model_name
+        return self.slugify(crop_slug(self, slug))
+
+    def reserve(self, instances):
+        """Give each unsaved instance a unique slug, as autoslug would."""
+        bases = [self.base_slug(instance) for instance in instances]
+        if not bases:
+            return
+        manager = self.model._default_manager
+        taken = set(
+            manager.filter(**{f"{self.name}__in": set(bases)}).values_list(
+                self.name, flat=True
+            )
+        )
+        clashing = {
+            base for base, count in Counter(bases).items() if base in taken or count > 1
+        }
+        if clashing:
+            numbered = reduce(
+                or_,
+                (
+                    Q(**{f"{self.name}__startswith": f"{base}{self.index_sep}"})
+                    for base in clashing
+                ),
+            )
+            taken |= set(manager.filter(numbered).values_list(self.name, flat=True))
+
+        for instance, base in zip(instances, bases):
+            slug, index = base, 1
+            while slug in taken:
+                index += 1
+                suffix = f"{self.index_sep}{index}"
+                slug = f"{base[: self.max_length - len(suffix)]}{suffix}"
+            taken.add(slug)
+            setattr(instance, self.attname, slug)
+            instance._slug_reserved = True
@@ -0,0 +1,58 @@
+import io
+
+from PIL import Image, ImageOps
+
+# Pillow format name -> file extension, in order of preference.
+VARIANT_FORMATS = {"AVIF": "avif", "WEBP": "webp"}
+
+
+def supported_variant_formats():
+    """The variant formats this Pillow build can encode (AVIF needs 11.2+)."""
+    Image.init()
+    return [name for name in VARIANT_FORMATS if name in Image.SAVE]
+
+
+def render_variants(image_file, widths, formats=None, quality=75):
+    """
+    Downscaled copies of an image, one per width and format, as
+    ``(width, extension, bytes)``. Widths at or above the original's are
+    skipped, except that the original width is used when all of them are.
+    EXIF orientation is applied and all metadata (EXIF, XMP, ICC profile)
+    is left out of the output.
+    """
+    formats = formats or supported_variant_formats()
+    with Image.open(image_file) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+        # Rebuilding from pixels drops whatever metadata Pillow carried over.
+        pixels = Image.new(image.mode, image.size)
+        pixels.paste(image)
+
+    targets = sorted({width for width in widths if width < pixels.width}) or [
+        pixels.width
+    ]
+    variants = []
+    for width in targets:
+        height = max(1, round(pixels.height * width / pixels.width))
+        resized = pixels.resize((width, height), Image.Resampling.LANCZOS)
+        for name in formats:
+            buffer = io.BytesIO()
+            resized.save(buffer, format=name, quality=quality)
+            variants.append((width, VARIANT_FORMATS[name], buffer.getvalue()))
+    return variants
+
+
+def smallest_variant(variants, width, extension="webp"):
+    """
+    The narrowest ``extension`` variant at least ``width`` pixels wide, or
+    the widest one if none is. ``None`` when there are no such variants.
+    """
+    candidates = sorted(
+        (variant for variant in variants if variant["format"] == extension),
+        key=lambda variant: variant["width"],
+    )
+    for variant in candidates:
+        if variant["width"] >= width:
+            return variant
+    return candidates[-1] if candidates else None
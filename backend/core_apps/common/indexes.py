@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+def add_postgres_indexes(table, indexes, extensions=()):
+    """
+    Migration operation creating PostgreSQL-only indexes on ``table``.
+
+    ``indexes`` maps index names to the ``USING ...`` clause, e.g.
+    ``{"article_tag_names_gin": "gin (tag_names)"}``. They are built
+    ``CONCURRENTLY`` so the migration using this must set ``atomic = False``.
+    Any ``extensions`` the indexes need are created first. Other databases
+    are skipped; they have no equivalent index type.
+    """
+
+    def forwards(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        quote = schema_editor.quote_name
+        for extension in extensions:
+            schema_editor.execute(f"CREATE EXTENSION IF NOT EXISTS {quote(extension)}")
+        for name, using in indexes.items():
+            schema_editor.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {quote(name)} "
+                f"ON {quote(table)} USING {using}"
+            )
+
+    def backwards(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for name in indexes:
+            schema_editor.execute(
+                f"DROP INDEX CONCURRENTLY IF EXISTS {schema_editor.quote_name(name)}"
+            )
+
+    return migrations.RunPython(forwards, backwards, atomic=False)
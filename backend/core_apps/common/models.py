@@ -1,9 +1,13 @@
 import uuid
+from collections import defaultdict
 
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.db import IntegrityError, models
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, migrations, models, transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Concat, Substr
 from django.utils.translation import gettext_lazy as _
 
 User = get_user_model()
@@ -20,6 +24,132 @@ class TimeStampedModel(models.Model):
         ordering = ["-created_at", "-updated_at"]
 
 
+class MaterializedPathModel(models.Model):
+    """
+    Tree node that stores its ancestry as ``path``: the primary keys from
+    the root down to the node itself, each followed by ``/`` (``"1/7/42/"``).
+
+    Subclasses define a nullable foreign key to ``"self"``, named ``parent``
+    unless ``parent_field`` says otherwise; ``save()`` keeps ``path`` and
+    ``depth`` in step with it and rewrites the whole subtree in one
+    ``UPDATE`` when a node moves. "This node and all its descendants" is
+    then a single indexed ``path LIKE 'prefix%'`` query.
+    """
+
+    path = models.CharField(max_length=255, db_index=True, editable=False, default="")
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
+
+    parent_field = "parent"
+
+    class Meta:
+        abstract = True
+
+    def is_ancestor_of(self, other):
+        """Whether ``other`` is this node or one of its descendants."""
+        return bool(self.path) and other.path.startswith(self.path)
+
+    def clean(self):
+        super().clean()
+        parent = getattr(self, self.parent_field)
+        if parent is not None and self.is_ancestor_of(parent):
+            raise ValidationError(
+                {
+                    self.parent_field: _(
+                        "Cannot move a node under itself or its descendants."
+                    )
+                }
+            )
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+            self._update_path()
+
+    def _update_path(self):
+        manager = type(self)._default_manager
+        parent_path, parent_depth = "", -1
+        parent_id = getattr(self, f"{self.parent_field}_id")
+        if parent_id is not None:
+            parent_path, parent_depth = (
+                manager.filter(pk=parent_id).values_list("path", "depth").get()
+            )
+        old_path, old_depth = self.path, self.depth
+        path, depth = f"{parent_path}{self.pk}/", parent_depth + 1
+        if path != old_path:
+            if not old_path:
+                manager.filter(pk=self.pk).update(path=path, depth=depth)
+            elif parent_path.startswith(old_path):
+                raise ValueError("Cannot move a node under itself or its descendants")
+            else:
+                # The node and its whole subtree swap the old prefix for the new.
+                manager.filter(path__startswith=old_path).update(
+                    path=Concat(
+                        Value(path),
+                        Substr("path", len(old_path) + 1),
+                        output_field=models.CharField(),
+                    ),
+                    depth=F("depth") + (depth - old_depth),
+                )
+        self.path, self.depth = path, depth
+
+    @classmethod
+    def subtree_q(cls, slug, prefix=None):
+        """
+        ``Q`` matching the node with ``slug`` and all its descendants, or,
+        with ``prefix``, rows whose ``prefix`` foreign key points into that
+        subtree. An unknown slug matches nothing.
+        """
+        path = (
+            cls._default_manager.filter(slug=slug)
+            .values_list("path", flat=True)
+            .first()
+        )
+        if not path:
+            return Q(pk__in=[])
+        lookup = f"{prefix}__path__startswith" if prefix else "path__startswith"
+        return Q(**{lookup: path})
+
+    @classmethod
+    def build_tree(cls, fields):
+        """
+        Every node as a dict of ``fields`` with a nested ``children`` list,
+        siblings in the model's default order, read in one query.
+        """
+        parent_id = f"{cls.parent_field}_id"
+        children = defaultdict(list)
+        for row in cls._default_manager.values("pk", parent_id, *fields):
+            children[row.pop(parent_id)].append(row)
+
+        def attach(nodes):
+            for node in nodes:
+                node["children"] = attach(children[node.pop("pk")])
+            return nodes
+
+        return attach(children[None])
+
+
+def backfill_tree_paths(app_label, model_name, batch_size=1000, parent_field="parent"):
+    """Migration operation computing ``path``/``depth`` for existing nodes."""
+
+    def forwards(apps, schema_editor):
+        model = apps.get_model(app_label, model_name)
+        children = defaultdict(list)
+        for pk, parent_id in model.objects.values_list("pk", f"{parent_field}_id"):
+            children[parent_id].append(pk)
+
+        pending = [(pk, f"{pk}/", 0) for pk in children[None]]
+        batch = []
+        while pending:
+            pk, path, depth = pending.pop()
+            batch.append(model(pk=pk, path=path, depth=depth))
+            pending.extend(
+                (child, f"{path}{child}/", depth + 1) for child in children[pk]
+            )
+        model.objects.bulk_update(batch, ["path", "depth"], batch_size=batch_size)
+
+    return migrations.RunPython(forwards, migrations.RunPython.noop)
+
+
 class ContentView(TimeStampedModel):
     content_type = models.ForeignKey(
         ContentType, on_delete=models.CASCADE, verbose_name=_("Content Type")
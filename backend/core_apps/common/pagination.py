@@ -0,0 +1,155 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def estimate_count(queryset):
+    """
+    Row estimate for ``queryset`` taken from the PostgreSQL planner instead
+    of running COUNT(*). Returns None on databases without planner estimates.
+    """
+    if connections[queryset.db].vendor != "postgresql":
+        return None
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset ("seek") pagination on (created_at, pkid), newest first.
+
+    Each page is one ``WHERE (created_at, pkid) < cursor LIMIT n`` query, so
+    deep pages cost the same as the first one and no COUNT(*) is issued.
+    Pass ``?approximate_count=true`` to get a planner-based total.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 30
+    cursor_query_param = "cursor"
+    approximate_count_query_param = "approximate_count"
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            decoded = base64.urlsafe_b64decode(encoded.encode()).decode()
+            created_at, pkid = decoded.rsplit("|", 1)
+            created_at = parse_datetime(created_at)
+            pkid = int(pkid)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, pkid
+
+    def encode_cursor(self, instance):
+        position = f"{instance.created_at.isoformat()}|{instance.pkid}"
+        encoded = base64.urlsafe_b64encode(position.encode()).decode()
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, encoded
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        self.approximate_count = None
+        self.include_approximate_count = request.query_params.get(
+            self.approximate_count_query_param, ""
+        ).lower() in ("1", "true")
+        if self.include_approximate_count:
+            self.approximate_count = estimate_count(queryset)
+
+        cursor = self.decode_cursor(request)
+        queryset = queryset.order_by("-created_at", "-pkid")
+        if cursor is not None:
+            created_at, pkid = cursor
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, pkid__lt=pkid)
+            )
+
+        results = list(queryset[: page_size + 1])
+        self.has_next = len(results) > page_size
+        self.page = results[:page_size]
+        self.has_previous = cursor is not None
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_first_link(self):
+        if not self.has_previous:
+            return None
+        return remove_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param
+        )
+
+    def get_paginated_response(self, data):
+        response = OrderedDict(
+            [
+                ("next", self.get_next_link()),
+                ("first", self.get_first_link()),
+                ("results", data),
+            ]
+        )
+        if self.include_approximate_count:
+            response["approximate_count"] = self.approximate_count
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "first": {"type": "string", "nullable": True, "format": "uri"},
+                "approximate_count": {"type": "integer", "nullable": True},
+                "results": schema,
+            },
+        }
+
+
+class KeysetPaginationMixin:
+    """
+    Opt-in keyset pagination for a view that keeps page-number pagination as
+    its default: requests carrying ``?cursor=`` (empty for the first page)
+    are paginated with ``keyset_pagination_class`` instead.
+    """
+
+    keyset_pagination_class = KeysetPagination
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            request = getattr(self, "request", None)
+            if (
+                request is not None
+                and self.keyset_pagination_class.cursor_query_param
+                in request.query_params
+            ):
+                self._paginator = self.keyset_pagination_class()
+            else:
+                self._paginator = super().paginator
+        return self._paginator
@@ -3,39 +3,100 @@ from typing import Any, Optional, Union
 
 from django.utils.translation import gettext_lazy as _
 from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+_encoder = encoders.JSONEncoder()
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Encode ``data`` straight to UTF-8 bytes in the shape of DRF's compact
+    ``JSONRenderer`` output: same keys, order and values.
+
+    orjson is used when installed; anything it does not handle natively
+    (datetimes, decimals, lazy strings, ...) goes through DRF's encoder so
+    both paths format those values identically. Floats are not always
+    spelled the same: orjson writes ``1e16`` and ``1e-7`` where the stdlib
+    writes ``1e+16`` and ``1e-07``, and it encodes NaN and infinities as
+    ``null`` where the stdlib path raises ``ValueError``.
+    """
+    content = None
+    if orjson is not None:
+        try:
+            content = orjson.dumps(
+                data,
+                default=_encoder.default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; the stdlib handles those.
+            content = None
+    if content is None:
+        content = json.dumps(
+            data,
+            cls=encoders.JSONEncoder,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    # Line/paragraph separators are valid JSON but not valid JavaScript.
+    return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+        b"\xe2\x80\xa9", b"\\u2029"
+    )
+
+
+class EnvelopeJSONRenderer(JSONRenderer):
+    """
+    Renders ``{"status_code": ..., <object_label>: data}``, encoding the
+    payload once with :func:`dumps`. Error payloads are rendered unwrapped.
+    """
 
-class GenericJSONRenderer(JSONRenderer):
     charset = "utf-8"
     object_label = "object"
 
+    def get_object_label(self, renderer_context: dict) -> str:
+        return self.object_label
+
+    def get_status_code(self, renderer_context: dict) -> int:
+        response = renderer_context.get("response")
+        return response.status_code if response is not None else 200
+
     def render(
         self,
         data: Any,
         accepted_media_type: Optional[str] = None,
         renderer_context: Optional[dict] = None,
     ) -> Union[bytes, str]:
-
         if renderer_context is None:
             renderer_context = {}
 
+        if isinstance(data, dict) and data.get("errors", None) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return dumps(
+            {
+                "status_code": self.get_status_code(renderer_context),
+                self.get_object_label(renderer_context): data,
+            }
+        )
+
+
+class GenericJSONRenderer(EnvelopeJSONRenderer):
+    def get_object_label(self, renderer_context: dict) -> str:
         view = renderer_context.get("view")
         if hasattr(view, "object_label"):
-            object_label = view.object_label
-        else:
-            object_label = self.object_label
+            return view.object_label
+        return self.object_label
 
+    def get_status_code(self, renderer_context: dict) -> int:
         response = renderer_context.get("response")
 
         if not response:
             raise ValueError(_("Response not found in renderer context"))
 
-        status_code = response.status_code
-        errors = data.get("errors", None)
-
-        if errors is not None:
-            return super(GenericJSONRenderer, self).render(data)
-
-        return json.dumps({"status_code": status_code, object_label: data}).encode(
-            self.charset
-        )
+        return response.status_code
@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+
+def schedule_transition(task, pkid, field, when):
+    """
+    Enqueue ``task(pkid, field, when)`` to run exactly at ``when`` (or right
+    away if it has passed) once the current transaction commits.
+
+    Only times within ``STATUS_SCHEDULER_HORIZON`` are enqueued, so brokers
+    never hold months-long ETAs; the periodic sweeper picks the rest up as
+    they come into range. Returns whether a task was enqueued.
+    """
+    now = timezone.now()
+    if when is None or when > now + settings.STATUS_SCHEDULER_HORIZON:
+        return False
+    transaction.on_commit(
+        lambda: task.apply_async(args=(pkid, field, when.isoformat()), eta=max(when, now))
+    )
+    return True
+
+
+def schedule_upcoming(task, queryset, field):
+    """Enqueue ``task`` for every row of ``queryset`` whose ``field`` is due soon."""
+    now = timezone.now()
+    upcoming = queryset.filter(
+        **{
+            f"{field}__gt": now,
+            f"{field}__lte": now + settings.STATUS_SCHEDULER_HORIZON,
+        }
+    ).values_list("pk", field)
+    scheduled = 0
+    for pkid, when in upcoming.iterator():
+        scheduled += schedule_transition(task, pkid, field, when)
+    return scheduled
+
+
+def requeue_if_early(task, pkid, field, scheduled_for):
+    """
+    Parse a scheduled task's ``scheduled_for``; if that time is still ahead
+    (the broker delivered early), put the task back for the exact time and
+    return ``None``.
+    """
+    scheduled_for = parse_datetime(scheduled_for)
+    if scheduled_for > timezone.now():
+        task.apply_async(args=(pkid, field, scheduled_for.isoformat()), eta=scheduled_for)
+        return None
+    return scheduled_for
+
+
+def apply_transition(task, queryset, pkid, field, scheduled_for, transition):
+    """
+    Body of a scheduled transition task: move row ``pkid`` from one status to
+    the other if ``field`` still holds ``scheduled_for``.
+
+    Edits to the date make the filter miss, so superseded tasks are no-ops,
+    and re-running a task that already applied does nothing either. A task
+    delivered early is put back on the queue for the exact time. Returns the
+    number of rows changed.
+    """
+    scheduled_for = requeue_if_early(task, pkid, field, scheduled_for)
+    if scheduled_for is None:
+        return 0
+
+    from_status, to_status = transition
+    return queryset.filter(
+        pk=pkid, status=from_status, **{field: scheduled_for}
+    ).update(status=to_status, updated_at=timezone.now())
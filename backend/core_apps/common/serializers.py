@@ -0,0 +1,64 @@
+import os
+from typing import Iterable, Set
+
+from rest_framework import serializers
+
+
+def parse_field_list(request, param: str) -> Set[str]:
+    if request is None:
+        return set()
+    value = request.query_params.get(param, "")
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class DynamicFieldsMixin:
+    """
+    Sparse fieldsets for read requests.
+
+    ``?fields=title,slug`` limits the representation to the named fields and
+    ``?expand=bookmarks`` opts into anything listed in ``Meta.expandable_fields``,
+    which are otherwise left out. Write requests always get every field.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        selected = self.get_selected_fields(request, self.fields)
+        for name in set(self.fields) - selected:
+            self.fields.pop(name)
+
+    @classmethod
+    def get_selected_fields(cls, request, available: Iterable[str]) -> Set[str]:
+        available = set(available)
+        if request is None or request.method != "GET":
+            return available
+
+        requested = parse_field_list(request, "fields")
+        expandable = set(getattr(cls.Meta, "expandable_fields", []))
+        expanded = (parse_field_list(request, "expand") | requested) & expandable
+
+        selected = available - (expandable - expanded)
+        if requested:
+            selected &= requested
+        return selected
+
+
+# Image types clients may upload directly to storage.
+DIRECT_UPLOAD_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif"}
+
+
+class DirectUploadRequestSerializer(serializers.Serializer):
+    # Only the extension of the client's file name is used.
+    filename = serializers.CharField(max_length=255)
+
+    def validate_filename(self, value):
+        extension = os.path.splitext(value)[1].lower()
+        if extension not in DIRECT_UPLOAD_EXTENSIONS:
+            raise serializers.ValidationError("Unsupported image type.")
+        return extension
+
+
+class DirectUploadCompleteSerializer(serializers.Serializer):
+    ticket = serializers.CharField()
+    # The storage's upload response, for backends that sign it (Cloudinary).
+    result = serializers.DictField(required=False)
@@ -1,60 +1,87 @@
 import os
 import uuid
-import shutil
 from django.conf import settings
+from django.core.files import File
 from django.core.files.storage import default_storage
-from django.core.files.base import ContentFile
-from django.utils import timezone
+
+# Names passed to a storage's delete_many() per call; S3's DeleteObjects and
+# Cloudinary's delete_resources both cap a request at 100-1000 keys.
+BULK_DELETE_SIZE = 100
+
 
 class MediaService:
     @staticmethod
     def save_image(image_file, article_id, is_featured=False):
         """
-        Save image file and return its URL
+        Save image file and return its URL. The upload is streamed to
+        storage in chunks rather than read into memory first.
         """
         # Generate unique filename
         ext = os.path.splitext(image_file.name)[1]
         filename = f"{uuid.uuid4()}{ext}"
-        
+
         # Create path with article UUID for organization
         path = f"articles/{article_id}/{filename}"
-        
-        # Save file
-        saved_path = default_storage.save(path, ContentFile(image_file.read()))
-        
+
+        # Uploaded files are already Files; wrap anything else so storage
+        # backends copy it with File.chunks().
+        if not isinstance(image_file, File):
+            image_file = File(image_file, name=image_file.name)
+        saved_path = default_storage.save(path, image_file)
+
         # Generate URL
         url = f"{settings.MEDIA_URL}{saved_path}"
-        
+
         return url
 
+    @staticmethod
+    def delete_files(names, storage=None):
+        """
+        Delete the named files, ignoring ones that are already gone.
+
+        Storages with a ``delete_many(names)`` method (e.g. wrapping S3
+        DeleteObjects or Cloudinary delete_resources) get the names in
+        batches of ``BULK_DELETE_SIZE``; others get one ``delete()`` per
+        file. Storage backends treat deleting a missing file as a no-op, so
+        nothing is checked with ``exists()`` first.
+        """
+        storage = storage or default_storage
+        names = list(names)
+        delete_many = getattr(storage, "delete_many", None)
+        if delete_many is None:
+            for name in names:
+                storage.delete(name)
+            return len(names)
+        for start in range(0, len(names), BULK_DELETE_SIZE):
+            delete_many(names[start : start + BULK_DELETE_SIZE])
+        return len(names)
+
     @staticmethod
     def delete_image(url):
         """
         Delete image file from storage
         """
         if url.startswith(settings.MEDIA_URL):
-            path = url.replace(settings.MEDIA_URL, '')
-            if default_storage.exists(path):
-                default_storage.delete(path)
-    
+            MediaService.delete_files([url[len(settings.MEDIA_URL) :]])
+
     @staticmethod
-    def delete_article_images(article_id):
+    def delete_article_images(article_id, storage=None):
         """
-        Delete all images for an article
+        Delete all images for an article: one listing, then a batched delete.
         """
+        storage = storage or default_storage
         article_path = f"articles/{article_id}"
-        if default_storage.exists(article_path):
-            # List all files in the directory
-            _, filenames = default_storage.listdir(article_path)
-            
-            # Delete each file
-            for filename in filenames:
-                file_path = f"{article_path}/{filename}"
-                if default_storage.exists(file_path):
-                    default_storage.delete(file_path)
-            
-            # Try to remove the directory (if empty)
-            try:
-                default_storage.delete(article_path)
-            except:
-                pass  # Directory might not be empty or might not be deletable 
\ No newline at end of file
+        try:
+            _, filenames = storage.listdir(article_path)
+        except FileNotFoundError:
+            return 0
+        deleted = MediaService.delete_files(
+            (f"{article_path}/{filename}" for filename in filenames), storage
+        )
+
+        # Filesystem storage leaves the now empty directory behind.
+        try:
+            storage.delete(article_path)
+        except (OSError, NotImplementedError):
+            pass
+        return deleted
@@ -0,0 +1,204 @@
+from collections import defaultdict
+from functools import reduce
+from operator import or_
+
+import django_filters as filters
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, migrations
+from django.db.models import Q
+from django.utils import timezone
+from taggit.models import TaggedItem
+
+# m2m_changed actions after which a model's tags are final.
+TAG_CHANGE_ACTIONS = ("post_add", "post_remove", "post_clear")
+
+
+def normalize_tag_names(names):
+    """Stripped, lowercased, de-duplicated and sorted tag names."""
+    return sorted({name.strip().lower() for name in names if name and name.strip()})
+
+
+def _tag_names_by_object(tagged_items, object_ids):
+    tag_names = defaultdict(list)
+    rows = tagged_items.filter(object_id__in=object_ids).values_list(
+        "object_id", "tag__name"
+    )
+    for object_id, name in rows:
+        tag_names[object_id].append(name)
+    return {
+        object_id: normalize_tag_names(tag_names[object_id])
+        for object_id in object_ids
+    }
+
+
+def sync_tag_names(model, pks):
+    """
+    Rewrite the denormalized ``tag_names`` column of the ``model`` rows in
+    ``pks`` from their taggit tags, touching ``updated_at`` so Last-Modified
+    follows tag edits. Returns the new names keyed by pk.
+    """
+    tagged_items = model.tags.through.objects.filter(
+        content_type=ContentType.objects.get_for_model(model)
+    )
+    tag_names = _tag_names_by_object(tagged_items, list(pks))
+    now = timezone.now()
+    for pk, names in tag_names.items():
+        model._default_manager.filter(pk=pk).update(tag_names=names, updated_at=now)
+    return tag_names
+
+
+def tag_names_receiver(tagged_model):
+    """
+    ``m2m_changed`` receiver for ``tagged_model.tags.through`` keeping
+    ``tag_names`` in step with taggit. The through model is shared by every
+    tagged model, so changes to other models' tags are ignored.
+    """
+
+    def update_tag_names(sender, instance, action, model, pk_set, **kwargs):
+        if action not in TAG_CHANGE_ACTIONS:
+            return
+        if isinstance(instance, tagged_model):
+            pks = [instance.pk]
+        elif model is tagged_model and pk_set:
+            pks = pk_set
+        else:
+            return
+        tag_names = sync_tag_names(tagged_model, pks)
+        if isinstance(instance, tagged_model):
+            instance.tag_names = tag_names[instance.pk]
+
+    return update_tag_names
+
+
+def upsert_tags(names):
+    """
+    Taggit tags for ``names``, created in bulk where missing. Keyed by name.
+    """
+    tag_model = TaggedItem.tag_model()
+    names = set(names)
+    tags = {tag.name: tag for tag in tag_model.objects.filter(name__in=names)}
+    missing = names - tags.keys()
+    if missing:
+        tag_model.objects.bulk_create(
+            [tag_model(name=name, slug=tag_model().slugify(name)) for name in missing],
+            ignore_conflicts=True,
+        )
+        tags.update(
+            (tag.name, tag) for tag in tag_model.objects.filter(name__in=missing)
+        )
+        # Names whose slug clashed with another tag's; save() picks a free one.
+        for name in missing - tags.keys():
+            tags[name] = tag_model.objects.create(name=name)
+    return tags
+
+
+def bulk_set_tags(model, tags_by_pk):
+    """
+    Replace the taggit tags of many ``model`` rows at once, mapping pk to tag
+    names, in a fixed number of queries. Unlike ``tags.set()`` this sends no
+    ``m2m_changed`` signals, so callers keep ``tag_names`` current themselves.
+    """
+    if not tags_by_pk:
+        return
+    content_type = ContentType.objects.get_for_model(model)
+    tags = upsert_tags(name for names in tags_by_pk.values() for name in names)
+    TaggedItem.objects.filter(
+        content_type=content_type, object_id__in=list(tags_by_pk)
+    ).delete()
+    TaggedItem.objects.bulk_create(
+        [
+            TaggedItem(content_type=content_type, object_id=pk, tag=tags[name])
+            for pk, names in tags_by_pk.items()
+            for name in dict.fromkeys(names)
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def backfill_tag_names(app_label, model_name, batch_size=1000):
+    """Migration operation filling ``tag_names`` for existing rows."""
+
+    def forwards(apps, schema_editor):
+        model = apps.get_model(app_label, model_name)
+        content_type = apps.get_model("contenttypes", "ContentType").objects.filter(
+            app_label=app_label, model=model_name.lower()
+        ).first()
+        if content_type is None:
+            return
+        tagged_items = apps.get_model("taggit", "TaggedItem").objects.filter(
+            content_type=content_type
+        )
+        object_ids = (
+            tagged_items.order_by("object_id")
+            .values_list("object_id", flat=True)
+            .distinct()
+        )
+        batch = []
+        for object_id in object_ids.iterator(chunk_size=batch_size):
+            batch.append(object_id)
+            if len(batch) == batch_size:
+                _write_tag_names(model, tagged_items, batch)
+                batch = []
+        if batch:
+            _write_tag_names(model, tagged_items, batch)
+
+    return migrations.RunPython(forwards, migrations.RunPython.noop)
+
+
+def _write_tag_names(model, tagged_items, object_ids):
+    tag_names = _tag_names_by_object(tagged_items, object_ids)
+    rows = model._default_manager.filter(pk__in=object_ids).only("pk")
+    for row in rows:
+        row.tag_names = tag_names[row.pk]
+    model._default_manager.bulk_update(rows, ["tag_names"])
+
+
+def filter_by_tags(queryset, names, match_all=False):
+    """
+    Narrow ``queryset`` to rows tagged with any (or, with ``match_all``, all)
+    of ``names``, compared case-insensitively.
+
+    On PostgreSQL this reads the GIN-indexed ``tag_names`` column with
+    ``?|`` / ``@>``. Other databases cannot look inside JSON arrays, so they
+    go through taggit's tables instead.
+    """
+    names = normalize_tag_names(names)
+    if not names:
+        return queryset
+
+    if connections[queryset.db].vendor == "postgresql":
+        if match_all:
+            return queryset.filter(tag_names__contains=names)
+        return queryset.filter(tag_names__has_any_keys=names)
+
+    tagged_items = queryset.model.tags.through.objects.filter(
+        content_type=ContentType.objects.get_for_model(queryset.model)
+    )
+    if match_all:
+        for name in names:
+            queryset = queryset.filter(
+                pk__in=tagged_items.filter(tag__name__iexact=name).values("object_id")
+            )
+        return queryset
+    matches = reduce(or_, (Q(tag__name__iexact=name) for name in names))
+    return queryset.filter(pk__in=tagged_items.filter(matches).values("object_id"))
+
+
+class TagFilterSet(filters.FilterSet):
+    """
+    ``?tags=`` (one tag), ``?tags_any=`` and ``?tags_all=`` (comma-separated)
+    filters for models with a ``tag_names`` column.
+    """
+
+    tags = filters.CharFilter(method="filter_tags")
+    tags_any = filters.CharFilter(method="filter_tags_any")
+    tags_all = filters.CharFilter(method="filter_tags_all")
+
+    def filter_tags(self, queryset, name, value):
+        return filter_by_tags(queryset, [value])
+
+    def filter_tags_any(self, queryset, name, value):
+        return filter_by_tags(queryset, value.split(","))
+
+    def filter_tags_all(self, queryset, name, value):
+        return filter_by_tags(queryset, value.split(","), match_all=True)
@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from .services import MediaService
+
+
+@shared_task(name="delete_stored_files")
+def delete_stored_files(names):
+    """Remove replaced uploads from storage outside the request."""
+    return f"Deleted {MediaService.delete_files(names)} files"
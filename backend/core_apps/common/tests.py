@@ -1,3 +1,260 @@
-from django.test import TestCase
+import io
+import json
+import shutil
+import tempfile
+import threading
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper
+from django.db.models import F
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from core_apps.articles.models import Article
+
+from .cache import bump_generation, get_or_build, versioned_key
+from .services import BULK_DELETE_SIZE, MediaService
+from . import renderers
+from .hyperloglog import HyperLogLog
+from .unique_viewers import HyperLogLogViewerCounter
+
+
+class HyperLogLogTest(SimpleTestCase):
+    def test_estimate_is_within_error_bounds(self):
+        sketch = HyperLogLog()
+        sketch.update(f"viewer-{n}" for n in range(50000))
+        self.assertAlmostEqual(sketch.count(), 50000, delta=50000 * 0.03)
+
+    def test_small_cardinalities_are_exact_enough(self):
+        sketch = HyperLogLog()
+        sketch.update(["a", "b", "c", "a", "b"])
+        self.assertEqual(sketch.count(), 3)
+
+    def test_merge_is_union(self):
+        first, second = HyperLogLog(), HyperLogLog()
+        first.update(range(0, 6000))
+        second.update(range(4000, 10000))
+        merged = HyperLogLog.from_bytes(first.to_bytes()).merge(second)
+        self.assertAlmostEqual(merged.count(), 10000, delta=10000 * 0.03)
+
+    def test_merge_rejects_different_precision(self):
+        with self.assertRaises(ValueError):
+            HyperLogLog(precision=10).merge(HyperLogLog(precision=12))
+
+
+class HyperLogLogViewerCounterTest(SimpleTestCase):
+    def test_daily_and_lifetime_counts(self):
+        counter = HyperLogLogViewerCounter()
+        monday, tuesday = date(2026, 1, 5), date(2026, 1, 6)
+        counter.add("article", 1, ["|1.1.1.1", "|2.2.2.2"], day=monday)
+        counter.add("article", 1, ["|2.2.2.2", "7|"], day=tuesday)
+
+        self.assertEqual(counter.count("article", 1, days=[monday]), 2)
+        self.assertEqual(counter.count("article", 1, days=[monday, tuesday]), 3)
+        self.assertEqual(counter.count("article", 1), 3)
+        self.assertEqual(counter.count("product", 1), 0)
+
+
+class ResponseCacheTest(SimpleTestCase):
+    def tearDown(self):
+        cache.clear()
+
+    def test_bump_generation_changes_keys(self):
+        key = versioned_key("things", "/things/")
+        self.assertEqual(versioned_key("things", "/things/"), key)
+        bump_generation("things")
+        self.assertNotEqual(versioned_key("things", "/things/"), key)
+
+    def test_waits_for_the_rebuild_in_progress(self):
+        key = versioned_key("things", "/things/")
+        cache.add(f"{key}:lock", 1)
+        builds = []
+
+        def rebuild_elsewhere():
+            cache.set(key, {"built": "elsewhere"})
+            cache.delete(f"{key}:lock")
+
+        timer = threading.Timer(0.1, rebuild_elsewhere)
+        timer.start()
+        value = get_or_build(key, lambda: builds.append(1) or {"built": "here"})
+        timer.join()
+
+        self.assertEqual(value, {"built": "elsewhere"})
+        self.assertEqual(builds, [])
+
+    def test_builds_once_and_releases_lock(self):
+        key = versioned_key("things", "/things/")
+        builds = []
+
+        def build():
+            builds.append(1)
+            return {"built": len(builds)}
+
+        self.assertEqual(get_or_build(key, build), {"built": 1})
+        self.assertEqual(get_or_build(key, build), {"built": 1})
+        self.assertIsNone(cache.get(f"{key}:lock"))
+
+
+class EnvelopeRendererTest(SimpleTestCase):
+    payload = ReturnList(
+        [
+            ReturnDict(
+                [
+                    ("id", uuid.UUID("12345678-1234-5678-1234-567812345678")),
+                    ("title", "Déjà vu — 東京 deals \u2028 line \u2029 para"),
+                    ("price", Decimal("19.90")),
+                    ("rating", 4.25),
+                    ("created_at", datetime(2024, 1, 2, 3, 4, 5, 678901, timezone.utc)),
+                    ("published_on", date(2024, 1, 2)),
+                    ("label", gettext_lazy("Status")),
+                    ("tags", ["a", "b"]),
+                    ("author", None),
+                    ("flags", {1: True, "x": False}),
+                ],
+                serializer=None,
+            )
+        ],
+        serializer=None,
+    )
+
+    def render(self, renderer_class, data):
+        context = {"response": Response(status=201)}
+        return renderer_class().render(data, renderer_context=context)
+
+    def test_matches_drf_json_renderer(self):
+        envelope = {"status_code": 201, "object": self.payload}
+        expected = JSONRenderer().render(envelope)
+        self.assertEqual(self.render(renderers.EnvelopeJSONRenderer, self.payload), expected)
+
+    def test_stdlib_fallback_is_byte_identical(self):
+        fast = renderers.dumps(self.payload)
+        with mock.patch.object(renderers, "orjson", None):
+            fallback = renderers.dumps(self.payload)
+        self.assertEqual(fast, fallback)
+        self.assertIn(b"\\u2028", fast)
+
+    def test_floats_decode_to_the_same_values(self):
+        data = {"floats": [0.1, 4.25, 1e16, 1e-7, -2.5e-300, 1.7976931348623157e308]}
+        fast = renderers.dumps(data)
+        with mock.patch.object(renderers, "orjson", None):
+            fallback = renderers.dumps(data)
+        self.assertEqual(json.loads(fast), json.loads(fallback))
+        # Exponents are spelled differently, so the bytes can differ.
+        self.assertIn(b"1e16", fast)
+        self.assertIn(b"1e+16", fallback)
+
+    def test_non_finite_floats(self):
+        self.assertEqual(renderers.dumps({"x": float("nan")}), b'{"x":null}')
+        with mock.patch.object(renderers, "orjson", None):
+            with self.assertRaises(ValueError):
+                renderers.dumps({"x": float("inf")})
+
+    def test_values_orjson_rejects_fall_back_to_stdlib(self):
+        self.assertEqual(renderers.dumps({"big": 2**70}), b'{"big":1180591620717411303424}')
+
+    def test_errors_are_not_wrapped(self):
+        data = {"errors": {"title": ["This field is required."]}}
+        self.assertEqual(
+            self.render(renderers.GenericJSONRenderer, data),
+            JSONRenderer().render(data),
+        )
+
+    def test_generic_renderer_uses_view_label(self):
+        view = mock.Mock(object_label="issue")
+        content = renderers.GenericJSONRenderer().render(
+            {"id": 1}, renderer_context={"response": Response(), "view": view}
+        )
+        self.assertEqual(content, b'{"status_code":200,"issue":{"id":1}}')
+
+
+class TrigramLookupTest(SimpleTestCase):
+    def compile(self, queryset, using):
+        return queryset.values("pkid").query.get_compiler(connection=using).as_sql()
+
+    def test_postgresql_uses_plain_ilike(self):
+        postgresql = DatabaseWrapper(connection.settings_dict, alias="postgresql")
+        sql, params = self.compile(
+            Article.objects.filter(title__trgm_icontains="50%_off"), postgresql
+        )
+        self.assertIn('"articles_article"."title" ILIKE %s', sql)
+        self.assertNotIn("UPPER", sql)
+        self.assertEqual(params, ("%50\\%\\_off%",))
+
+    def test_expressions_fall_back_to_icontains(self):
+        postgresql = DatabaseWrapper(connection.settings_dict, alias="postgresql")
+        queryset = Article.objects.filter(title__trgm_icontains=F("description"))
+        self.assertIn("UPPER", self.compile(queryset, postgresql)[0])
+
+    def test_other_databases_use_icontains(self):
+        self.assertEqual(
+            self.compile(Article.objects.filter(title__trgm_icontains="deal"), connection),
+            self.compile(Article.objects.filter(title__icontains="deal"), connection),
+        )
+
+
+class ChunkedReader(io.BytesIO):
+    """File-like object that refuses to be read in one go."""
+
+    name = "upload.jpg"
+
+    def read(self, size=-1):
+        assert size is not None and size > 0, "read the whole file"
+        return super().read(size)
+
+
+class BulkDeleteStorage(FileSystemStorage):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = []
+
+    def delete_many(self, names):
+        self.calls.append(list(names))
+        for name in names:
+            self.delete(name)
+
+
+class MediaServiceTest(SimpleTestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def test_save_image_streams_in_chunks(self):
+        content = b"x" * (3 * 64 * 1024 + 5)
+        url = MediaService.save_image(ChunkedReader(content), "article-id")
+        name = url[len("/mediafiles/") :]
+        self.assertTrue(name.startswith("articles/article-id/"))
+        with default_storage.open(name) as saved:
+            self.assertEqual(saved.read(), content)
+
+    def test_delete_article_images_batches_without_existence_checks(self):
+        storage = BulkDeleteStorage(location=self.media_root)
+        for n in range(BULK_DELETE_SIZE + 1):
+            storage.save(f"articles/a/{n}.jpg", io.BytesIO(b"x"))
+
+        with mock.patch.object(storage, "exists") as exists:
+            self.assertEqual(
+                MediaService.delete_article_images("a", storage), BULK_DELETE_SIZE + 1
+            )
+        exists.assert_not_called()
+        self.assertEqual([len(call) for call in storage.calls], [BULK_DELETE_SIZE, 1])
+        self.assertFalse(storage.exists("articles/a"))
+        self.assertEqual(MediaService.delete_article_images("a", storage), 0)
+
+    def test_delete_files_without_bulk_api(self):
+        default_storage.save("gone.jpg", io.BytesIO(b"x"))
+        with mock.patch.object(default_storage, "exists") as exists:
+            MediaService.delete_files(["gone.jpg", "never-there.jpg"])
+        exists.assert_not_called()
+        self.assertFalse(default_storage.exists("gone.jpg"))
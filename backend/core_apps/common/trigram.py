@@ -0,0 +1,64 @@
+from django.db.models import CharField, TextField
+from django.db.models.lookups import IContains
+from rest_framework import filters
+
+from .indexes import add_postgres_indexes
+
+
+class TrigramIContains(IContains):
+    """
+    ``icontains`` that a pg_trgm GIN index can serve.
+
+    Django renders ``icontains`` on PostgreSQL as ``UPPER(col::text) LIKE
+    UPPER(...)``, which hides the column from any index on it. This lookup
+    emits a plain ``col ILIKE '%...%'`` instead, so a ``gin_trgm_ops`` index
+    on the column turns the substring match into an index scan. Other
+    databases get the regular ``icontains`` SQL.
+    """
+
+    lookup_name = "trgm_icontains"
+
+    def as_sql(self, compiler, connection):
+        return IContains(self.lhs, self.rhs).as_sql(compiler, connection)
+
+    def as_postgresql(self, compiler, connection):
+        if not self.rhs_is_direct_value() or self.bilateral_transforms:
+            return self.as_sql(compiler, connection)
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs_sql} ILIKE {rhs_sql}", (*lhs_params, *rhs_params)
+
+
+def register_lookups():
+    CharField.register_lookup(TrigramIContains)
+    TextField.register_lookup(TrigramIContains)
+
+
+class TrigramSearchFilter(filters.SearchFilter):
+    """``SearchFilter`` whose unprefixed search fields use ``trgm_icontains``."""
+
+    def construct_search(self, field_name):
+        if field_name[0] in self.lookup_prefixes:
+            return super().construct_search(field_name)
+        return f"{field_name}__{TrigramIContains.lookup_name}"
+
+
+def trigram_index_name(table, column):
+    return f"{table}_{column}_trgm"[:63]
+
+
+def add_trigram_indexes(table, columns):
+    """
+    Migration operation creating GIN trigram indexes on ``table.columns``,
+    after enabling pg_trgm. The migration using this must set
+    ``atomic = False``. Other databases are skipped: their ``trgm_icontains``
+    is a plain ``icontains`` with nothing to index.
+    """
+    return add_postgres_indexes(
+        table,
+        {
+            trigram_index_name(table, column): f'gin ("{column}" gin_trgm_ops)'
+            for column in columns
+        },
+        extensions=["pg_trgm"],
+    )
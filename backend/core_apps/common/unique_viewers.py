@@ -0,0 +1,117 @@
+from datetime import timedelta
+from functools import lru_cache
+
+import redis
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .hyperloglog import HyperLogLog
+
+# Daily sketches are kept this long; lifetime sketches never expire.
+DAILY_RETENTION = timedelta(days=90)
+
+
+def viewer_key(user_id, viewer_ip):
+    """Identity of a viewer, mirroring ArticleView's (user, viewer_ip) pair."""
+    return f"{user_id or ''}|{viewer_ip or ''}"
+
+
+def _day_suffix(day):
+    return day.strftime("%Y%m%d")
+
+
+class BaseUniqueViewerCounter:
+    """
+    Estimates unique viewers per object, both per day and over its lifetime.
+
+    Objects are addressed by a ``kind`` ("article", "product") and their
+    primary key, so one counter serves every content type.
+    """
+
+    def key(self, kind, object_id, day=None):
+        key = f"unique-viewers:{kind}:{object_id}"
+        return f"{key}:{_day_suffix(day)}" if day else key
+
+    def add(self, kind, object_id, viewers, day=None):
+        raise NotImplementedError
+
+    def count(self, kind, object_id, days=None):
+        """Lifetime estimate, or the merged estimate over ``days`` if given."""
+        raise NotImplementedError
+
+    def count_today(self, kind, object_id):
+        return self.count(kind, object_id, days=[timezone.localdate()])
+
+
+class HyperLogLogViewerCounter(BaseUniqueViewerCounter):
+    """
+    Pure-Python backend storing sketch registers in the Django cache.
+
+    Updates are read-modify-write, so concurrent writers for the same object
+    can drop each other's additions; feed it from a single writer such as the
+    view buffer flush task.
+    """
+
+    precision = 14
+
+    def _load(self, key):
+        data = cache.get(key)
+        if data is None:
+            return HyperLogLog(precision=self.precision)
+        return HyperLogLog.from_bytes(data, precision=self.precision)
+
+    def add(self, kind, object_id, viewers, day=None):
+        viewers = list(viewers)
+        day = day or timezone.localdate()
+        for key, timeout in (
+            (self.key(kind, object_id), None),
+            (self.key(kind, object_id, day), DAILY_RETENTION.total_seconds()),
+        ):
+            sketch = self._load(key)
+            sketch.update(viewers)
+            cache.set(key, sketch.to_bytes(), timeout)
+
+    def count(self, kind, object_id, days=None):
+        if not days:
+            return self._load(self.key(kind, object_id)).count()
+        sketch = HyperLogLog(precision=self.precision)
+        for day in days:
+            sketch.merge(self._load(self.key(kind, object_id, day)))
+        return sketch.count()
+
+
+class RedisViewerCounter(BaseUniqueViewerCounter):
+    """Redis backend built on PFADD/PFCOUNT, which merge keys natively."""
+
+    def __init__(self, url=None):
+        self.client = redis.Redis.from_url(
+            url or settings.UNIQUE_VIEWER_COUNTER_URL, socket_timeout=1
+        )
+
+    def add(self, kind, object_id, viewers, day=None):
+        viewers = list(viewers)
+        if not viewers:
+            return
+        day = day or timezone.localdate()
+        day_key = self.key(kind, object_id, day)
+        with self.client.pipeline(transaction=False) as pipe:
+            pipe.pfadd(self.key(kind, object_id), *viewers)
+            pipe.pfadd(day_key, *viewers)
+            pipe.expire(day_key, DAILY_RETENTION)
+            pipe.execute()
+
+    def count(self, kind, object_id, days=None):
+        if not days:
+            return self.client.pfcount(self.key(kind, object_id))
+        return self.client.pfcount(*(self.key(kind, object_id, day) for day in days))
+
+
+@lru_cache(maxsize=None)
+def _load_counter(backend):
+    return import_string(backend)()
+
+
+def get_unique_viewer_counter():
+    return _load_counter(settings.UNIQUE_VIEWER_COUNTER_BACKEND)
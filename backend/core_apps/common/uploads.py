@@ -0,0 +1,127 @@
+import posixpath
+import time
+import uuid
+from functools import lru_cache
+
+import cloudinary
+import cloudinary.utils
+from django.conf import settings
+from django.core import signing
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from django.utils.module_loading import import_string
+from rest_framework.exceptions import ValidationError
+
+TICKET_SALT = "core_apps.common.uploads.ticket"
+STORAGE_UPLOAD_SALT = "core_apps.common.uploads.storage"
+
+
+class CloudinaryDirectUpload:
+    """
+    Clients POST the file to Cloudinary with signed parameters and hand
+    back Cloudinary's (signed) upload response to complete the upload.
+    """
+
+    def sign(self, request, key):
+        config = cloudinary.config()
+        params = {
+            "public_id": posixpath.splitext(key)[0],
+            "timestamp": int(time.time()),
+        }
+        return {
+            "method": "POST",
+            "url": cloudinary.utils.cloudinary_api_url("upload", resource_type="image"),
+            "fields": {
+                **params,
+                "api_key": config.api_key,
+                "signature": cloudinary.utils.api_sign_request(params, config.api_secret),
+            },
+        }
+
+    def verify(self, key, result):
+        public_id = result.get("public_id")
+        if public_id != posixpath.splitext(key)[0] or not (
+            cloudinary.utils.verify_api_response_signature(
+                public_id, result.get("version"), result.get("signature", "")
+            )
+        ):
+            raise ValidationError({"result": ["The upload could not be verified."]})
+        # The "type/upload/vN/id.format" form CloudinaryField stores.
+        return (
+            f"{result.get('resource_type', 'image')}/{result.get('type', 'upload')}/"
+            f"v{result['version']}/{public_id}.{result.get('format', 'jpg')}"
+        )
+
+
+class StorageDirectUpload:
+    """
+    For storages that cannot sign uploads themselves, such as the local
+    filesystem (and tests): clients PUT the file to a signed URL of ours,
+    which streams it into ``default_storage`` under the issued name.
+    """
+
+    def sign(self, request, key):
+        token = signing.dumps(key, salt=STORAGE_UPLOAD_SALT)
+        return {
+            "method": "PUT",
+            "url": request.build_absolute_uri(
+                reverse("direct-upload", kwargs={"token": token})
+            ),
+            "fields": {},
+        }
+
+    def verify(self, key, result):
+        if not default_storage.exists(key):
+            raise ValidationError({"ticket": ["Nothing has been uploaded yet."]})
+        return key
+
+    @staticmethod
+    def unsign(token):
+        """The storage name a signed PUT URL writes to, or ``None``."""
+        try:
+            return signing.loads(
+                token, salt=STORAGE_UPLOAD_SALT, max_age=settings.DIRECT_UPLOAD_MAX_AGE
+            )
+        except signing.BadSignature:
+            return None
+
+
+@lru_cache(maxsize=None)
+def _load_backend(backend):
+    return import_string(backend)()
+
+
+def get_direct_upload_backend(target):
+    return _load_backend(settings.DIRECT_UPLOAD_BACKENDS[target])
+
+
+def issue_upload(request, target, object_id, extension):
+    """
+    Signed parameters for uploading a ``target`` file (``"banner"``,
+    ``"avatar"``) of object ``object_id`` straight to storage, and the
+    ticket that completes the upload afterwards.
+    """
+    key = f"{target}s/{object_id}/{uuid.uuid4().hex}{extension}"
+    ticket = signing.dumps(
+        {"target": target, "object": str(object_id), "key": key}, salt=TICKET_SALT
+    )
+    return {
+        "ticket": ticket,
+        "upload": get_direct_upload_backend(target).sign(request, key),
+    }
+
+
+def complete_upload(target, object_id, ticket, result=None):
+    """
+    Check that ``ticket`` was issued for this target and object and that
+    the file arrived, returning the name to store on the object.
+    """
+    try:
+        issued = signing.loads(
+            ticket, salt=TICKET_SALT, max_age=settings.DIRECT_UPLOAD_MAX_AGE
+        )
+    except signing.BadSignature:
+        raise ValidationError({"ticket": ["Invalid or expired upload ticket."]})
+    if issued["target"] != target or issued["object"] != str(object_id):
+        raise ValidationError({"ticket": ["This ticket is for another upload."]})
+    return get_direct_upload_backend(target).verify(issued["key"], result or {})
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import StorageUploadView
+
+urlpatterns = [
+    path("<str:token>/", StorageUploadView.as_view(), name="direct-upload"),
+]
@@ -1,3 +1,94 @@
-from django.shortcuts import render
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import generics, permissions, status
+from rest_framework.parsers import JSONParser
+from rest_framework.response import Response
 
-# Create your views here.
+from .serializers import DirectUploadCompleteSerializer, DirectUploadRequestSerializer
+from .uploads import StorageDirectUpload, complete_upload, issue_upload
+
+
+class DirectUploadView(generics.GenericAPIView):
+    """
+    Direct-to-storage uploads of one file of an object. ``POST
+    {"filename"}`` returns signed upload parameters and a ticket; once the
+    client has uploaded the file, ``POST {"ticket", "result"}`` to the
+    ``complete=True`` view attaches it. The file itself never passes
+    through the API workers or the Celery broker.
+
+    Subclasses set ``upload_target`` and implement ``get_object()`` and
+    ``attach(obj, name)``, which stores the name and returns the response
+    data.
+    """
+
+    upload_target = None
+    complete = False
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [JSONParser]
+
+    def get_serializer_class(self):
+        if self.complete:
+            return DirectUploadCompleteSerializer
+        return DirectUploadRequestSerializer
+
+    def post(self, request, *args, **kwargs):
+        obj = self.get_object()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if not self.complete:
+            return Response(
+                issue_upload(
+                    request,
+                    self.upload_target,
+                    obj.id,
+                    serializer.validated_data["filename"],
+                ),
+                status=status.HTTP_201_CREATED,
+            )
+        name = complete_upload(self.upload_target, obj.id, **serializer.validated_data)
+        return Response(self.attach(obj, name))
+
+    def attach(self, obj, name):
+        raise NotImplementedError
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class StorageUploadView(View):
+    """
+    Receiving end of ``StorageDirectUpload``: streams a PUT body into
+    ``default_storage`` under the name its signed URL was issued for.
+    """
+
+    def put(self, request, token):
+        name = StorageDirectUpload.unsign(token)
+        if name is None:
+            return HttpResponse(status=status.HTTP_403_FORBIDDEN)
+        try:
+            size = int(request.headers.get("Content-Length", ""))
+        except ValueError:
+            return HttpResponse(status=status.HTTP_411_LENGTH_REQUIRED)
+        if size > settings.DIRECT_UPLOAD_MAX_SIZE:
+            return HttpResponse(status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        # Each signed URL accepts one upload: cache.add() is an atomic
+        # one-shot claim, so concurrent PUTs cannot both pass the check.
+        claim = f"direct-upload:{name}"
+        if not cache.add(claim, True, settings.DIRECT_UPLOAD_MAX_AGE):
+            return HttpResponse(status=status.HTTP_409_CONFLICT)
+        if default_storage.exists(name):
+            return HttpResponse(status=status.HTTP_409_CONFLICT)
+        try:
+            saved = default_storage.save(name, File(request, name=name))
+        except Exception:
+            cache.delete(claim)
+            raise
+        if saved != name:
+            # The storage picked another name, so the signed one is taken.
+            default_storage.delete(saved)
+            return HttpResponse(status=status.HTTP_409_CONFLICT)
+        return HttpResponse(status=status.HTTP_201_CREATED)
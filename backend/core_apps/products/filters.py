@@ -0,0 +1,26 @@
+import django_filters as filters
+
+from core_apps.common.tags import TagFilterSet
+
+from .models import Product, ProductCategory
+
+
+class ProductFilter(TagFilterSet):
+    category__slug = filters.CharFilter(method="filter_category_slug")
+
+    def filter_category_slug(self, queryset, name, value):
+        # The category and all of its subcategories.
+        return queryset.filter(ProductCategory.subtree_q(value, prefix="category"))
+
+    class Meta:
+        model = Product
+        fields = [
+            "status",
+            "category__slug",
+            "vendor",
+            "is_featured",
+            "is_new",
+            "tags",
+            "tags_any",
+            "tags_all",
+        ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.2 on 2026-10-18 19:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0002_product_created_keyset_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["status", "end_date"], name="product_status_end_idx"
+            ),
+        ),
+    ]
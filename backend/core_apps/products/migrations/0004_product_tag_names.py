@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+from core_apps.common.indexes import add_postgres_indexes
+from core_apps.common.tags import backfill_tag_names
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("products", "0003_product_status_end_idx"),
+        ("taggit", "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="tag_names",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        backfill_tag_names("products", "product"),
+        add_postgres_indexes("products_product", {"product_tag_names_gin": "gin (tag_names)"}),
+    ]
@@ -5,7 +5,7 @@ from django.utils.translation import gettext_lazy as _
 from taggit.managers import TaggableManager
 from django.utils import timezone
 from datetime import timedelta
-from core_apps.common.models import TimeStampedModel
+from core_apps.common.models import MaterializedPathModel, TimeStampedModel
 from django.core.validators import MinValueValidator
 from decimal import Decimal
 import random
@@ -33,7 +33,11 @@ class ProductImage(models.Model):
         return f"Image URL: {self.image_url}"
 
 
-class ProductCategory(models.Model):
+# Generation namespace of the cached category tree.
+CATEGORY_CACHE_NAMESPACE = "product-categories"
+
+
+class ProductCategory(MaterializedPathModel):
     name = models.CharField(max_length=255)
     slug = AutoSlugField(populate_from='name', unique=True)
     description = models.TextField(blank=True)
@@ -83,6 +87,8 @@ class Product(TimeStampedModel):
     # Categorization Fields
     category = models.ForeignKey(ProductCategory, on_delete=models.SET_NULL, null=True, related_name='products')
     tags = TaggableManager()
+    # Lowercased copy of the tag names, kept in sync by a signal receiver.
+    tag_names = models.JSONField(default=list, blank=True, editable=False)
 
     # Vendor Information
     vendor = models.CharField(max_length=50)
@@ -131,8 +137,10 @@ class Product(TimeStampedModel):
             models.Index(fields=['sku']),
             models.Index(fields=['status']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['-created_at', '-pkid'], name='product_created_keyset_idx'),
             models.Index(fields=['start_date']),
             models.Index(fields=['end_date']),
+            models.Index(fields=['status', 'end_date'], name='product_status_end_idx'),
         ]
         permissions = [
             ("can_create_product", "Can create product"),
@@ -0,0 +1,15 @@
+from rest_framework.pagination import PageNumberPagination
+
+from core_apps.common.pagination import KeysetPagination
+
+
+class ProductPagination(PageNumberPagination):
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 30
+
+
+class ProductKeysetPagination(KeysetPagination):
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 30
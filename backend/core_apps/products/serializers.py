@@ -1,4 +1,5 @@
 from rest_framework import serializers
+
 from .models import Product, ProductImage, ProductCategory
 
 
@@ -17,6 +18,13 @@ class ProductSerializer(serializers.ModelSerializer):
     discount_percentage = serializers.IntegerField(read_only=True)
     has_deal = serializers.BooleanField(read_only=True)
     current_price = serializers.CharField(read_only=True)
+    unique_viewers = serializers.SerializerMethodField()
+    tags = serializers.ListField(source="tag_names", read_only=True)
+
+    def get_unique_viewers(self, obj):
+        # Only product detail reads the estimate (ProductViewSet.retrieve),
+        # so list pages make no per-row PFCOUNT round trips.
+        return getattr(obj, "unique_viewers", None)
 
     class Meta:
         model = Product
@@ -24,13 +32,12 @@ class ProductSerializer(serializers.ModelSerializer):
             'id', 'name', 'slug', 'description', 'short_description',
             'deal_url', 'shorten_url', 'url_shortening_status',
             'price', 'compare_at_price',
-            'deal_start_date', 'deal_end_date',
             'stock_quantity', 'sku',
             'images', 'main_image', 'gallery',
             'category', 'tags',
             'vendor',
             'status', 'start_date', 'end_date',
-            'views_count', 'sales_count',
+            'views_count', 'sales_count', 'unique_viewers',
             'is_featured', 'is_new',
             'weight', 'dimensions',
             'is_published', 'has_discount', 'discount_percentage',
@@ -1,7 +1,10 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
-from .models import Product
+from .models import CATEGORY_CACHE_NAMESPACE, Product, ProductCategory
+from .tasks import schedule_product_transitions
+from core_apps.common.cache import bump_generation
+from core_apps.common.tags import tag_names_receiver
 from celery import shared_task
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
@@ -38,6 +41,22 @@ def trigger_url_shortening(sender, instance, created, **kwargs):
         shorten_product_url.delay(instance.id)
 
 
+@receiver(post_save, sender=Product)
+def schedule_status_transitions(sender, instance, **kwargs):
+    schedule_product_transitions(instance)
+
+
+m2m_changed.connect(
+    tag_names_receiver(Product), sender=Product.tags.through, weak=False
+)
+
+
+@receiver(post_save, sender=ProductCategory)
+@receiver(post_delete, sender=ProductCategory)
+def invalidate_category_tree(sender, **kwargs):
+    bump_generation(CATEGORY_CACHE_NAMESPACE)
+
+
 @receiver(post_save, sender=User)
 def assign_product_permissions(sender, instance, created, **kwargs):
     """
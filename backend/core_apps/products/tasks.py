@@ -0,0 +1,68 @@
+import logging
+
+from celery import shared_task
+from django.utils import timezone
+
+from core_apps.common.scheduling import (
+    apply_transition,
+    schedule_transition,
+    schedule_upcoming,
+)
+
+from .models import Product
+
+logger = logging.getLogger(__name__)
+
+# Products go live by date alone (see Product.is_published), so only the end
+# of a deal changes the stored status: field -> (from, to).
+PRODUCT_TRANSITIONS = {
+    "end_date": ("active", "archived"),
+}
+
+
+def schedule_product_transitions(product):
+    """Enqueue exact-time tasks for the product's upcoming status changes."""
+    for field, (from_status, _) in PRODUCT_TRANSITIONS.items():
+        if product.status == from_status:
+            schedule_transition(
+                apply_product_status_transition, product.pkid, field, getattr(product, field)
+            )
+
+
+@shared_task(name="apply_product_status_transition")
+def apply_product_status_transition(pkid, field, scheduled_for):
+    """Archive one product when its deal ends, unless the date was edited since."""
+    changed = apply_transition(
+        apply_product_status_transition,
+        Product.objects.all(),
+        pkid,
+        field,
+        scheduled_for,
+        PRODUCT_TRANSITIONS[field],
+    )
+    return f"Applied {field} transition to {changed} products"
+
+
+@shared_task(name="sweep_product_statuses")
+def sweep_product_statuses():
+    """
+    Safety net for the exact-time tasks: apply overdue transitions in one
+    UPDATE each and enqueue tasks for dates coming into the scheduler horizon.
+    """
+    now = timezone.now()
+    changed_count = 0
+    scheduled_count = 0
+    for field, (from_status, to_status) in PRODUCT_TRANSITIONS.items():
+        changed_count += Product.objects.filter(
+            status=from_status, **{f"{field}__lte": now}
+        ).update(status=to_status, updated_at=now)
+        scheduled_count += schedule_upcoming(
+            apply_product_status_transition,
+            Product.objects.filter(status=from_status),
+            field,
+        )
+
+    logger.info(
+        f"Swept {changed_count} product status transitions; scheduled {scheduled_count}"
+    )
+    return f"Applied {changed_count} product status transitions"
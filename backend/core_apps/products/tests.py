@@ -1,3 +1,188 @@
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from redis.exceptions import RedisError
+from rest_framework.test import APIClient
+
+from core_apps.common.unique_viewers import get_unique_viewer_counter
+
+from .models import Product, ProductCategory, ProductImage
+
+User = get_user_model()
+
+
+def create_products(count):
+    # bulk_create skips the post_save URL-shortening and permission handlers.
+    return Product.objects.bulk_create(
+        Product(
+            name=f"Deal {n}",
+            slug=f"deal-{n}",
+            sku=f"SKU-{n}",
+            description="Great deal",
+            short_description="Deal",
+            deal_url="https://example.com/deal",
+            price="9.99",
+            vendor="Acme",
+            status="active" if n % 2 else "draft",
+        )
+        for n in range(count)
+    )
+
+
+class ProductExportTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user(
+                email="staff@example.com", password="testpass123", is_staff=True
+            )
+        )
+        create_products(4)
+
+    def test_ndjson_export_is_filtered(self):
+        response = self.client.get(reverse("product-export"), {"status": "active"})
+        self.assertEqual(response.status_code, 200)
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        self.assertEqual([row["sku"] for row in rows], ["SKU-1", "SKU-3"])
+        self.assertNotIn("description", rows[0])
+
+    def test_tag_names_follow_taggit_and_filter(self):
+        product = Product.objects.get(sku="SKU-1")
+        product.tags.add("Kitchen", "sale")
+        Product.objects.get(sku="SKU-2").tags.add("sale")
+        self.assertEqual(
+            Product.objects.values_list("tag_names", flat=True).get(pk=product.pk),
+            ["kitchen", "sale"],
+        )
+
+        response = self.client.get(
+            reverse("product-export"),
+            {"tags_all": "sale,KITCHEN", "export_format": "csv", "fields": "sku,tag_names"},
+        )
+        content = b"".join(response.streaming_content).decode()
+        self.assertEqual(content.splitlines(), ["sku,tag_names", 'SKU-1,"kitchen,sale"'])
+
+    def test_category_filter_and_tree_cover_subcategories(self):
+        kitchen = ProductCategory.objects.create(name="Kitchen")
+        knives = ProductCategory.objects.create(name="Knives", parent=kitchen)
+        Product.objects.filter(sku="SKU-1").update(category=knives)
+        Product.objects.filter(sku="SKU-2").update(category=kitchen)
+
+        response = self.client.get(
+            reverse("product-export"), {"category__slug": kitchen.slug}
+        )
+        skus = [
+            json.loads(line)["sku"]
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        self.assertEqual(skus, ["SKU-1", "SKU-2"])
+
+        response = self.client.get(reverse("product-category-tree"))
+        self.assertEqual(response.data[0]["slug"], kitchen.slug)
+        self.assertEqual(response.data[0]["children"][0]["depth"], 1)
+
+
+class ProductUniqueViewersTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.product = create_products(1)[0]
+        self.url = reverse("product-detail", kwargs={"slug": self.product.slug})
+
+    def test_detail_counts_unique_viewers(self):
+        self.client.get(self.url, REMOTE_ADDR="10.0.0.1")
+        self.client.get(self.url, REMOTE_ADDR="10.0.0.1")
+        response = self.client.get(self.url, REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["unique_viewers"], 2)
+
+    def test_detail_survives_counter_outage(self):
+        counter = get_unique_viewer_counter()
+        with mock.patch.object(counter, "add", side_effect=RedisError):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data["unique_viewers"])
+
+    def test_list_does_not_count(self):
+        counter = get_unique_viewer_counter()
+        with mock.patch.object(counter, "count") as count:
+            response = self.client.get(reverse("product-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data["results"][0]["unique_viewers"])
+        count.assert_not_called()
+
+
+class ProductKeysetPaginationTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        products = create_products(7)
+        # Two products share a timestamp so the pkid tie-breaker is exercised.
+        now = timezone.now()
+        for offset, product in enumerate(products):
+            created_at = now - timedelta(minutes=offset // 2)
+            Product.objects.filter(pkid=product.pkid).update(created_at=created_at)
+        self.expected = list(
+            Product.objects.order_by("-created_at", "-pkid").values_list(
+                "slug", flat=True
+            )
+        )
+
+    def test_walks_every_page_without_gaps_or_duplicates(self):
+        url = reverse("product-list")
+        params = {"cursor": "", "page_size": 3}
+        slugs = []
+        while url:
+            page = self.client.get(url, params).json()
+            self.assertNotIn("count", page)
+            slugs.extend(product["slug"] for product in page["results"])
+            url, params = page["next"], None
+        self.assertEqual(slugs, self.expected)
+
+    def test_page_numbers_stay_the_default(self):
+        response = self.client.get(reverse("product-list"), {"page_size": 3})
+        self.assertEqual(response.json()["count"], 7)
+
+
+class ProductConditionalGetTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.product = create_products(1)[0]
+        self.url = reverse("product-detail", kwargs={"slug": self.product.slug})
+
+    def test_matching_etag_skips_serialization(self):
+        etag = self.client.get(self.url, REMOTE_ADDR="10.0.0.1")["ETag"]
+        response = self.client.get(
+            self.url, REMOTE_ADDR="10.0.0.1", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_new_viewer_does_not_invalidate_etag(self):
+        etag = self.client.get(self.url, REMOTE_ADDR="10.0.0.1")["ETag"]
+        response = self.client.get(
+            self.url, REMOTE_ADDR="10.0.0.2", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_images_tags_and_category_invalidate_etag(self):
+        def etag():
+            return self.client.get(self.url, REMOTE_ADDR="10.0.0.1")["ETag"]
 
-# Create your tests here.
+        seen = [etag()]
+        ProductImage.objects.create(product=self.product, image_url="a.png")
+        seen.append(etag())
+        self.product.tags.add("sale")
+        seen.append(etag())
+        Product.objects.filter(pkid=self.product.pkid).update(
+            category=ProductCategory.objects.create(name="Kitchen")
+        )
+        seen.append(etag())
+        self.assertEqual(len(set(seen)), 4)
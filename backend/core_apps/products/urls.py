@@ -0,0 +1,13 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .views import ProductCategoryTreeView, ProductExportView, ProductViewSet
+
+router = DefaultRouter()
+router.register(r"", ProductViewSet, basename="product")
+
+urlpatterns = [
+    path("categories/tree/", ProductCategoryTreeView.as_view(), name="product-category-tree"),
+    path("export/", ProductExportView.as_view(), name="product-export"),
+    path("", include(router.urls)),
+]
@@ -1,19 +1,135 @@
+import logging
+
+from django.db.models import Count, IntegerField, OuterRef, Subquery
 from django.shortcuts import render
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from redis.exceptions import RedisError
 from rest_framework import viewsets
-from rest_framework.permissions import IsAuthenticated
-from .models import Product
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core_apps.common.cache import get_or_build, versioned_key
+from core_apps.common.conditional import compute_etag, conditional_get
+from core_apps.common.exports import EXPORT_PARAMETERS, StreamingExportView
+from core_apps.common.unique_viewers import get_unique_viewer_counter, viewer_key
+from core_apps.common.pagination import KeysetPaginationMixin
+from .filters import ProductFilter
+from .models import CATEGORY_CACHE_NAMESPACE, Product, ProductCategory, ProductImage
+from .pagination import ProductKeysetPagination, ProductPagination
 from .permissions import ProductPermission
 from .serializers import ProductSerializer
 
-# Create your views here.
+logger = logging.getLogger(__name__)
+
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(KeysetPaginationMixin, viewsets.ModelViewSet):
     queryset = Product.objects.all()
     serializer_class = ProductSerializer
+    filterset_class = ProductFilter
     permission_classes = [ProductPermission]
+    pagination_class = ProductPagination
+    keyset_pagination_class = ProductKeysetPagination
+    lookup_field = "slug"
 
     def perform_create(self, serializer):
         # Set the current user as author
         product = serializer.save()
         product._current_user = self.request.user
         product.save()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action != "retrieve":
+            return queryset
+        # Image rows change without touching the product; their count and
+        # latest update go into the detail validators.
+        images = ProductImage.objects.filter(product=OuterRef("pk")).order_by()
+        return queryset.annotate(
+            images_count=Subquery(
+                images.values("product").annotate(total=Count("pk")).values("total"),
+                output_field=IntegerField(),
+            ),
+            images_updated_at=Subquery(
+                images.order_by("-updated_at").values("updated_at")[:1]
+            ),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        # Images and tags are only loaded if the client's copy is stale.
+        # The unique-viewer estimate changes with every new visitor, so it
+        # stays out of the validators.
+        instance.unique_viewers = self.record_view(instance)
+        etag = compute_etag(
+            instance.pk,
+            instance.updated_at.isoformat(),
+            instance.views_count,
+            instance.sales_count,
+            instance.is_published,
+            instance.has_deal,
+            instance.tag_names,
+            instance.category_id,
+            instance.images_count,
+            instance.images_updated_at,
+        )
+        return conditional_get(
+            request,
+            etag,
+            max(filter(None, (instance.updated_at, instance.images_updated_at))),
+            lambda: Response(self.get_serializer(instance).data),
+        )
+
+    def record_view(self, product):
+        """Add the viewer to the product's sketch and return its estimate."""
+        user_id = None if self.request.user.is_anonymous else self.request.user.pkid
+        viewer_counter = get_unique_viewer_counter()
+        try:
+            viewer_counter.add(
+                "product",
+                product.pk,
+                [viewer_key(user_id, self.request.META.get("REMOTE_ADDR"))],
+            )
+            return viewer_counter.count("product", product.pk)
+        except RedisError:
+            logger.warning("Unique viewer counter unavailable, skipping product view")
+            return None
+
+
+@extend_schema(
+    tags=['products'],
+    description="Stream every product matching the filters (staff only)",
+    parameters=EXPORT_PARAMETERS,
+    responses={200: OpenApiTypes.BINARY},
+)
+class ProductExportView(StreamingExportView):
+    queryset = Product.objects.all()
+    filter_backends = (DjangoFilterBackend,)
+    filterset_class = ProductFilter
+    export_name = "products"
+    export_fields = (
+        'id', 'slug', 'name', 'sku', 'short_description', 'description',
+        'deal_url', 'shorten_url',
+        'price', 'compare_at_price', 'coupon', 'stock_quantity',
+        'category__slug', 'tag_names', 'vendor', 'status', 'start_date', 'end_date',
+        'views_count', 'sales_count', 'is_featured', 'is_new',
+        'created_at', 'updated_at',
+    )
+    default_fields = tuple(field for field in export_fields if field != 'description')
+
+
+@extend_schema(
+    tags=['products'],
+    description="The whole product category tree, for navigation menus",
+)
+class ProductCategoryTreeView(APIView):
+    permission_classes = [AllowAny]
+    tree_fields = ('name', 'slug', 'description', 'depth')
+
+    def get(self, request):
+        tree = get_or_build(
+            versioned_key(CATEGORY_CACHE_NAMESPACE, "tree"),
+            lambda: ProductCategory.build_tree(self.tree_fields),
+        )
+        return Response(tree)
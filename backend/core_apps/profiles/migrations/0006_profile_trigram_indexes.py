@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from core_apps.common.trigram import add_trigram_indexes
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("profiles", "0005_remove_profile_profile_photo_profile_avatar"),
+    ]
+
+    operations = [
+        add_trigram_indexes(
+            "profiles_profile",
+            ["username", "first_name", "last_name", "about_me", "city"],
+        ),
+    ]
@@ -1,8 +1,10 @@
+import cloudinary
+import cloudinary.utils
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from ..models import Profile
 
 User = get_user_model()
@@ -36,11 +38,44 @@ class ProfileViewTest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Add more assertions to test response data
 
+    def test_search_profiles_by_substring(self):
+        other = User.objects.create_user(
+            email="someone@elsewhere.org", password="testpass123"
+        )
+        Profile.objects.filter(user=self.user).update(
+            username="testuser", first_name="Test", last_name="User", city="New York"
+        )
+        Profile.objects.filter(user=other).update(username="other", city="Boston")
+
+        for term in ("EXAMPLE.COM", "york", "est us"):
+            response = self.client.get(reverse("all-profiles"), {"search": term})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            usernames = [row["username"] for row in response.data["results"]]
+            self.assertEqual(usernames, ["testuser"], term)
+
+        response = self.client.get(reverse("all-profiles"), {"search": "100%"})
+        self.assertEqual(response.data["results"], [])
+
     def test_get_profile_detail(self):
         response = self.client.get(reverse("my-profile"))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Add more assertions to test response data
 
+    def test_profile_detail_conditional_get(self):
+        response = self.client.get(reverse("my-profile"))
+        self.assertIn("private", response["Cache-Control"])
+
+        response = self.client.get(
+            reverse("my-profile"), HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+        etag = response["ETag"]
+        self.client.patch(reverse("update-profile"), {"city": "Los Angeles"})
+        response = self.client.get(reverse("my-profile"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_update_profile(self):
         response = self.client.patch(reverse("update-profile"), {"city": "Los Angeles"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -91,3 +126,56 @@ class ProfileViewTest(TestCase):
     def test_delete_profile(self):
         # Test deleting a profile
         pass
+
+
+@override_settings(
+    DIRECT_UPLOAD_BACKENDS={"avatar": "core_apps.common.uploads.CloudinaryDirectUpload"}
+)
+class AvatarDirectUploadTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="avatar@example.com", password="testpass123"
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_signed_cloudinary_upload(self):
+        response = self.client.post(
+            reverse("avatar-upload"), {"filename": "me.jpg"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        fields = response.data["upload"]["fields"]
+        public_id = fields["public_id"]
+        self.assertTrue(public_id.startswith(f"avatars/{self.user.profile.id}/"))
+        self.assertEqual(
+            fields["signature"],
+            cloudinary.utils.api_sign_request(
+                {"public_id": public_id, "timestamp": fields["timestamp"]},
+                cloudinary.config().api_secret,
+            ),
+        )
+
+        result = {
+            "public_id": public_id,
+            "version": 1700000000,
+            "format": "jpg",
+            "signature": cloudinary.utils.api_sign_request(
+                {"public_id": public_id, "version": 1700000000},
+                cloudinary.config().api_secret,
+            ),
+        }
+        complete_url = reverse("avatar-upload-complete")
+        ticket = response.data["ticket"]
+        forged = self.client.post(
+            complete_url,
+            {"ticket": ticket, "result": {**result, "version": 1}},
+            format="json",
+        )
+        self.assertEqual(forged.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(
+            complete_url, {"ticket": ticket, "result": result}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.profile.refresh_from_db()
+        self.assertEqual(self.user.profile.avatar.public_id, public_id)
@@ -1,6 +1,7 @@
 from django.urls import path
 
 from .views import (
+    AvatarUploadView,
     FollowAPIView,
     FollowerListView,
     ProfileDetailAPIView,
@@ -13,6 +14,12 @@ urlpatterns = [
     path("all/", ProfileListAPIView.as_view(), name="all-profiles"),
     path("me/", ProfileDetailAPIView.as_view(), name="my-profile"),
     path("me/update/", UpdateProfileAPIView.as_view(), name="update-profile"),
+    path("me/avatar/upload/", AvatarUploadView.as_view(), name="avatar-upload"),
+    path(
+        "me/avatar/upload/complete/",
+        AvatarUploadView.as_view(complete=True),
+        name="avatar-upload-complete",
+    ),
     path("me/followers/", FollowerListView.as_view(), name="followers"),
     path("<uuid:user_id>/follow/", FollowAPIView.as_view(), name="follow"),
     path("<uuid:user_id>/unfollow/", UnfollowAPIView.as_view(), name="unfollow"),
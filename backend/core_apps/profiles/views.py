@@ -1,7 +1,8 @@
 from django.contrib.auth import get_user_model
 from django.core.mail import send_mail
+from django.utils.cache import patch_cache_control
 from drf_spectacular.utils import extend_schema
-from rest_framework import generics, status, filters
+from rest_framework import generics, status
 from rest_framework.exceptions import NotFound
 from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
@@ -11,6 +12,9 @@ from django_filters.rest_framework import DjangoFilterBackend
 
 # TODO: change this in production
 from config.settings.local import DEFAULT_FROM_EMAIL
+from core_apps.common.conditional import compute_etag, conditional_get
+from core_apps.common.trigram import TrigramSearchFilter
+from core_apps.common.views import DirectUploadView
 
 from .exceptions import CantFollowYourself
 from .models import Profile
@@ -27,7 +31,7 @@ class ProfileListAPIView(generics.ListAPIView):
     serializer_class = ProfileSerializer
     pagination_class = ProfilePagination
     renderer_classes = [ProfilesJSONRenderer]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    filter_backends = [DjangoFilterBackend, TrigramSearchFilter]
     search_fields = ['username', 'first_name', 'last_name', 'about_me', 'city', 'user__email']
 
 
@@ -46,6 +50,19 @@ class ProfileDetailAPIView(generics.RetrieveAPIView):
         profile = self.get_queryset().get(user=user)
         return profile
 
+    def retrieve(self, request, *args, **kwargs):
+        profile = self.get_object()
+        etag = compute_etag(profile.pk, profile.updated_at.isoformat(), profile.user.email)
+        response = conditional_get(
+            request,
+            etag,
+            profile.updated_at,
+            lambda: Response(self.get_serializer(profile).data),
+        )
+        # The URL is the same for every user, so shared caches must not store it.
+        patch_cache_control(response, private=True)
+        return response
+
 
 class UpdateProfileAPIView(generics.RetrieveAPIView):
     serializer_class = UpdateProfileSerializer
@@ -65,6 +82,21 @@ class UpdateProfileAPIView(generics.RetrieveAPIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+@extend_schema(tags=['profiles'])
+class AvatarUploadView(DirectUploadView):
+    """Upload the user's avatar straight to Cloudinary; see DirectUploadView."""
+
+    upload_target = "avatar"
+
+    def get_object(self):
+        return self.request.user.profile
+
+    def attach(self, profile, name):
+        profile.avatar = Profile._meta.get_field("avatar").to_python(name)
+        profile.save(update_fields=["avatar", "updated_at"])
+        return {"avatar": profile.avatar.url}
+
+
 class FollowerListView(APIView):
     permission_classes = [IsAuthenticated]
 
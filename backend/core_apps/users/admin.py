@@ -60,7 +60,7 @@ class UserAdmin(BaseUserAdmin):
             },
         ),
     )
-    search_fields = ["email"]
+    search_fields = ["email__trgm_icontains"]
 
 
 admin.site.register(User, UserAdmin)
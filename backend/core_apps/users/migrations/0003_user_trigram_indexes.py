@@ -0,0 +1,15 @@
+from django.db import migrations
+
+from core_apps.common.trigram import add_trigram_indexes
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("users", "0002_user_username"),
+    ]
+
+    operations = [
+        add_trigram_indexes("users_user", ["email"]),
+    ]